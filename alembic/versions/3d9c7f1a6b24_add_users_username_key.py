@@ -0,0 +1,35 @@
+"""add users username_key
+
+Revision ID: 3d9c7f1a6b24
+Revises: f2c6a8e4b153
+Create Date: 2026-10-18 16:12:48.530117
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '3d9c7f1a6b24'
+down_revision: Union[str, Sequence[str], None] = 'f2c6a8e4b153'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.add_column('users', sa.Column('username_key', sa.String(length=100), nullable=True))
+    # Must match app.models.user.normalize_username. Fails on existing
+    # usernames that differ only by case; those have to be renamed first.
+    op.execute("UPDATE users SET username_key = LOWER(TRIM(username))")
+    op.create_index('ix_users_username_key', 'users', ['username_key'], unique=True)
+    op.drop_index('ix_users_username', table_name='users')
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.create_index('ix_users_username', 'users', ['username', 'deleted_at'], unique=False)
+    op.drop_index('ix_users_username_key', table_name='users')
+    op.drop_column('users', 'username_key')
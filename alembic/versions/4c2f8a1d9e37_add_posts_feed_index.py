@@ -0,0 +1,33 @@
+"""add posts feed index
+
+Revision ID: 4c2f8a1d9e37
+Revises: 983b628c2211
+Create Date: 2026-10-18 09:12:44.518203
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '4c2f8a1d9e37'
+down_revision: Union[str, Sequence[str], None] = '983b628c2211'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_index(
+        'ix_posts_feed',
+        'posts',
+        ['deleted_at', 'created_at', 'id'],
+        unique=False,
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_posts_feed', table_name='posts')
@@ -0,0 +1,40 @@
+"""add posts fulltext index
+
+Revision ID: 5e07b2c9d814
+Revises: c3e81f04a6d2
+Create Date: 2026-10-18 12:40:52.107734
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '5e07b2c9d814'
+down_revision: Union[str, Sequence[str], None] = 'c3e81f04a6d2'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # Only MySQL has FULLTEXT; other backends search with the app's
+    # in-process index instead.
+    if op.get_bind().dialect.name != 'mysql':
+        return
+    op.create_index(
+        'ix_posts_fulltext',
+        'posts',
+        ['title', 'content'],
+        unique=False,
+        mysql_prefix='FULLTEXT',
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    if op.get_bind().dialect.name != 'mysql':
+        return
+    op.drop_index('ix_posts_fulltext', table_name='posts')
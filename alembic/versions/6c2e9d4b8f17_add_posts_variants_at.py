@@ -0,0 +1,41 @@
+"""add posts variants_at
+
+Revision ID: 6c2e9d4b8f17
+Revises: 8b1f5e3c7a60
+Create Date: 2026-10-19 09:42:15.306284
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '6c2e9d4b8f17'
+down_revision: Union[str, Sequence[str], None] = '8b1f5e3c7a60'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.add_column('posts', sa.Column('variants_at', sa.DateTime(timezone=True), nullable=True))
+    # Cleared variants were stored as the JSON value null; make them SQL NULL.
+    dialect = op.get_bind().dialect.name
+    if dialect == 'mysql':
+        is_json_null = "JSON_TYPE(image_variants) = 'NULL'"
+    elif dialect == 'postgresql':
+        is_json_null = "image_variants::text = 'null'"
+    else:
+        is_json_null = "image_variants = 'null'"
+    op.execute(f"UPDATE posts SET image_variants = NULL WHERE {is_json_null}")
+    op.execute(
+        "UPDATE posts SET variants_at = COALESCE(updated_at, created_at) "
+        "WHERE image_variants IS NOT NULL"
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_column('posts', 'variants_at')
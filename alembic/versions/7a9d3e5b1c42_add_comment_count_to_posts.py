@@ -0,0 +1,46 @@
+"""add comment_count to posts
+
+Revision ID: 7a9d3e5b1c42
+Revises: 4c2f8a1d9e37
+Create Date: 2026-10-18 10:03:17.240965
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '7a9d3e5b1c42'
+down_revision: Union[str, Sequence[str], None] = '4c2f8a1d9e37'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.add_column(
+        'posts',
+        sa.Column('comment_count', sa.Integer(), server_default='0', nullable=False)
+    )
+    op.execute(
+        """
+        UPDATE posts SET comment_count = (
+            SELECT COUNT(*) FROM comments
+            WHERE comments.post_id = posts.id AND comments.deleted_at IS NULL
+        )
+        """
+    )
+    op.create_index(
+        'ix_comments_post_thread',
+        'comments',
+        ['post_id', 'deleted_at', 'created_at', 'id'],
+        unique=False,
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_comments_post_thread', table_name='comments')
+    op.drop_column('posts', 'comment_count')
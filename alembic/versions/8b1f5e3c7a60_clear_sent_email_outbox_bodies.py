@@ -0,0 +1,35 @@
+"""clear sent email outbox bodies
+
+Revision ID: 8b1f5e3c7a60
+Revises: 3d9c7f1a6b24
+Create Date: 2026-10-18 21:04:37.118245
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '8b1f5e3c7a60'
+down_revision: Union[str, Sequence[str], None] = '3d9c7f1a6b24'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    with op.batch_alter_table('email_outbox') as batch_op:
+        batch_op.alter_column('body', existing_type=sa.Text(), nullable=True)
+    # Sent and failed messages no longer keep their body (OTP codes).
+    op.execute("UPDATE email_outbox SET body = NULL WHERE sent_at IS NOT NULL OR failed_at IS NOT NULL")
+    op.create_index('ix_email_outbox_failed', 'email_outbox', ['failed_at'], unique=False)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_email_outbox_failed', table_name='email_outbox')
+    op.execute("UPDATE email_outbox SET body = '' WHERE body IS NULL")
+    with op.batch_alter_table('email_outbox') as batch_op:
+        batch_op.alter_column('body', existing_type=sa.Text(), nullable=False)
@@ -0,0 +1,28 @@
+"""add image variants to posts
+
+Revision ID: a8f4c61e2b90
+Revises: 5e07b2c9d814
+Create Date: 2026-10-18 13:22:05.418230
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'a8f4c61e2b90'
+down_revision: Union[str, Sequence[str], None] = '5e07b2c9d814'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.add_column('posts', sa.Column('image_variants', sa.JSON(), nullable=True))
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_column('posts', 'image_variants')
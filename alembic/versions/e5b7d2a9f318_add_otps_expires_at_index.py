@@ -0,0 +1,29 @@
+"""add otps expires_at index
+
+Revision ID: e5b7d2a9f318
+Revises: a8f4c61e2b90
+Create Date: 2026-10-18 15:02:37.560911
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'e5b7d2a9f318'
+down_revision: Union[str, Sequence[str], None] = 'a8f4c61e2b90'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # Lets the OTP reaper find expired rows with a range scan.
+    op.create_index(op.f('ix_otps_expires_at'), 'otps', ['expires_at'], unique=False)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index(op.f('ix_otps_expires_at'), table_name='otps')
@@ -0,0 +1,39 @@
+"""add composite lookup indexes
+
+Revision ID: f2c6a8e4b153
+Revises: e5b7d2a9f318
+Create Date: 2026-10-18 15:31:12.284476
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'f2c6a8e4b153'
+down_revision: Union[str, Sequence[str], None] = 'e5b7d2a9f318'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_index('ix_posts_user_feed', 'posts', ['user_id', 'deleted_at', 'created_at', 'id'], unique=False)
+    op.create_index('ix_posts_image_url', 'posts', ['image_url'], unique=False)
+    op.create_index('ix_comments_user', 'comments', ['user_id', 'deleted_at'], unique=False)
+    op.create_index('ix_users_username', 'users', ['username', 'deleted_at'], unique=False)
+    op.create_index('ix_otps_email_verified', 'otps', ['email', 'is_verified', 'created_at'], unique=False)
+    # Covered by the leading column of ix_otps_email_verified.
+    op.drop_index(op.f('ix_otps_email'), table_name='otps')
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.create_index(op.f('ix_otps_email'), 'otps', ['email'], unique=False)
+    op.drop_index('ix_otps_email_verified', table_name='otps')
+    op.drop_index('ix_users_username', table_name='users')
+    op.drop_index('ix_comments_user', table_name='comments')
+    op.drop_index('ix_posts_image_url', table_name='posts')
+    op.drop_index('ix_posts_user_feed', table_name='posts')
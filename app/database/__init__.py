@@ -1,4 +1,7 @@
 from app.database import connection
 __all__ = [
     "get_db",
+    "get_async_db",
+    "get_session",
+    "run_db",
 ]
\ No newline at end of file
@@ -1,13 +1,76 @@
 from sqlalchemy import create_engine
+from sqlalchemy.engine import make_url
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import sessionmaker
+from starlette.concurrency import run_in_threadpool
+from app.database.pool_metrics import (
+    InstrumentedAsyncQueuePool,
+    InstrumentedQueuePool,
+    async_pool_metrics,
+    sync_pool_metrics,
+)
 from dotenv import load_dotenv
 import os
 load_dotenv()
 
-engine = create_engine(os.getenv("DATABASE_URL"))
+# "sync" (default) or "async". In async mode the request-path dependencies
+# hand out AsyncSession objects bound to an async driver for the same DB.
+DB_MODE = os.getenv("DB_MODE", "sync").lower()
+
+ASYNC_DRIVERS = {
+    "mysql": "mysql+aiomysql",
+    "postgresql": "postgresql+asyncpg",
+    "sqlite": "sqlite+aiosqlite",
+}
+
+
+def async_database_url(url: str) -> str:
+    """Map DATABASE_URL onto the async driver for the same backend."""
+    url = make_url(url)
+    drivername = ASYNC_DRIVERS.get(url.get_backend_name(), url.drivername)
+    return url.set(drivername=drivername).render_as_string(hide_password=False)
+
+
+def pool_options(url: str, poolclass) -> dict:
+    """
+    Pool settings from the environment. SQLite keeps SQLAlchemy's default
+    pool, which does not accept these options.
+    """
+    if make_url(url).get_backend_name() == "sqlite":
+        return {}
+    return {
+        "poolclass": poolclass,
+        "pool_size": int(os.getenv("DB_POOL_SIZE", "5")),
+        "max_overflow": int(os.getenv("DB_MAX_OVERFLOW", "10")),
+        "pool_timeout": float(os.getenv("DB_POOL_TIMEOUT", "30")),
+        "pool_recycle": int(os.getenv("DB_POOL_RECYCLE", "1800")),
+        "pool_pre_ping": os.getenv("DB_POOL_PRE_PING", "true").lower() == "true",
+    }
+
+
+DATABASE_URL = os.getenv("DATABASE_URL")
+engine = create_engine(DATABASE_URL, **pool_options(DATABASE_URL, InstrumentedQueuePool))
+sync_pool_metrics.attach(engine)
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 Base = declarative_base()
+
+async_engine = None
+AsyncSessionLocal = None
+if DB_MODE == "async":
+    ASYNC_DATABASE_URL = os.getenv("ASYNC_DATABASE_URL") or async_database_url(DATABASE_URL)
+    async_engine = create_async_engine(
+        ASYNC_DATABASE_URL,
+        **pool_options(ASYNC_DATABASE_URL, InstrumentedAsyncQueuePool),
+    )
+    async_pool_metrics.attach(async_engine.sync_engine)
+    # Objects must stay readable after commit: there is no implicit IO
+    # outside run_sync to refresh expired attributes.
+    AsyncSessionLocal = async_sessionmaker(
+        async_engine, class_=AsyncSession, autoflush=False, expire_on_commit=False
+    )
+
+
 def get_db():
     db = SessionLocal()
     try:
@@ -15,3 +78,22 @@ def get_db():
     finally:
         db.close()
 
+
+async def get_async_db():
+    async with AsyncSessionLocal() as db:
+        yield db
+
+
+# Dependency for routes that support both modes; use with run_db.
+get_session = get_async_db if DB_MODE == "async" else get_db
+
+
+async def run_db(db, fn, *args, **kwargs):
+    """
+    Run a synchronous service function `fn(session, *args)` without blocking
+    the event loop: on the async driver via AsyncSession.run_sync, otherwise
+    on the threadpool.
+    """
+    if isinstance(db, AsyncSession):
+        return await db.run_sync(fn, *args, **kwargs)
+    return await run_in_threadpool(fn, db, *args, **kwargs)
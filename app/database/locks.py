@@ -0,0 +1,27 @@
+from sqlalchemy import text
+from sqlalchemy.engine import Connection
+
+
+def try_advisory_lock(connection: Connection, name: str) -> bool:
+    """
+    Take a named, connection-scoped lock without waiting. Only one
+    connection across all workers can hold it, which makes it usable for
+    electing a single runner of a periodic job. SQLite has no such lock;
+    it is single-host, so the caller always gets it there.
+    """
+    dialect = connection.dialect.name
+    if dialect == "mysql":
+        return connection.execute(text("SELECT GET_LOCK(:name, 0)"), {"name": name}).scalar() == 1
+    if dialect == "postgresql":
+        return bool(
+            connection.execute(text("SELECT pg_try_advisory_lock(hashtext(:name))"), {"name": name}).scalar()
+        )
+    return True
+
+
+def release_advisory_lock(connection: Connection, name: str):
+    dialect = connection.dialect.name
+    if dialect == "mysql":
+        connection.execute(text("SELECT RELEASE_LOCK(:name)"), {"name": name})
+    elif dialect == "postgresql":
+        connection.execute(text("SELECT pg_advisory_unlock(hashtext(:name))"), {"name": name})
@@ -0,0 +1,128 @@
+from threading import Lock
+import time
+from sqlalchemy import event, exc
+from sqlalchemy.pool import AsyncAdaptedQueuePool, QueuePool
+
+# Upper bounds (ms) of the checkout-wait histogram buckets.
+WAIT_BUCKETS_MS = (1, 5, 10, 50, 100, 500, 1000, 5000)
+
+
+class PoolMetrics:
+    """Thread-safe counters for one engine's connection pool."""
+
+    def __init__(self, name: str):
+        self.name = name
+        self._lock = Lock()
+        self._engine = None
+        self.reset()
+
+    def reset(self):
+        with self._lock:
+            self.checkouts = 0
+            self.checkins = 0
+            self.connects = 0
+            self.invalidations = 0
+            self.timeouts = 0
+            self.wait_count = 0
+            self.wait_total_ms = 0.0
+            self.wait_max_ms = 0.0
+            self.wait_buckets = [0] * (len(WAIT_BUCKETS_MS) + 1)
+
+    def record_wait(self, seconds: float):
+        ms = seconds * 1000
+        with self._lock:
+            self.wait_count += 1
+            self.wait_total_ms += ms
+            self.wait_max_ms = max(self.wait_max_ms, ms)
+            for i, bound in enumerate(WAIT_BUCKETS_MS):
+                if ms <= bound:
+                    self.wait_buckets[i] += 1
+                    break
+            else:
+                self.wait_buckets[-1] += 1
+
+    def record_timeout(self):
+        with self._lock:
+            self.timeouts += 1
+
+    def attach(self, engine):
+        """Hook the pool events of `engine` (sync Engine) into these counters."""
+        self._engine = engine
+
+        @event.listens_for(engine, "connect")
+        def _on_connect(dbapi_connection, connection_record):
+            with self._lock:
+                self.connects += 1
+
+        @event.listens_for(engine, "checkout")
+        def _on_checkout(dbapi_connection, connection_record, connection_proxy):
+            with self._lock:
+                self.checkouts += 1
+
+        @event.listens_for(engine, "checkin")
+        def _on_checkin(dbapi_connection, connection_record):
+            with self._lock:
+                self.checkins += 1
+
+        @event.listens_for(engine, "invalidate")
+        def _on_invalidate(dbapi_connection, connection_record, exception):
+            with self._lock:
+                self.invalidations += 1
+
+    def snapshot(self) -> dict:
+        pool = self._engine.pool if self._engine is not None else None
+        with self._lock:
+            data = {
+                "pool_class": type(pool).__name__ if pool is not None else None,
+                "checkouts": self.checkouts,
+                "checkins": self.checkins,
+                "connects": self.connects,
+                "invalidations": self.invalidations,
+                "timeouts": self.timeouts,
+                "checkout_wait_ms": {
+                    "count": self.wait_count,
+                    "avg": self.wait_total_ms / self.wait_count if self.wait_count else 0.0,
+                    "max": self.wait_max_ms,
+                    "buckets": {
+                        **{f"le_{bound}": n for bound, n in zip(WAIT_BUCKETS_MS, self.wait_buckets)},
+                        "inf": self.wait_buckets[-1],
+                    },
+                },
+            }
+        if isinstance(pool, QueuePool):
+            data.update(
+                size=pool.size(),
+                in_use=pool.checkedout(),
+                idle=pool.checkedin(),
+                overflow=max(pool.overflow(), 0),
+            )
+        return data
+
+
+def instrumented(pool_class, metrics: PoolMetrics):
+    """
+    Subclass a queue pool so the time spent waiting for a connection (and
+    any pool timeout) is recorded. SQLAlchemy has no pool event that fires
+    before a checkout starts, so this wraps the pool's internal getter.
+    """
+
+    class InstrumentedPool(pool_class):
+        def _do_get(self):
+            start = time.perf_counter()
+            try:
+                return super()._do_get()
+            except exc.TimeoutError:
+                metrics.record_timeout()
+                raise
+            finally:
+                metrics.record_wait(time.perf_counter() - start)
+
+    InstrumentedPool.__name__ = f"Instrumented{pool_class.__name__}"
+    return InstrumentedPool
+
+
+sync_pool_metrics = PoolMetrics("sync")
+async_pool_metrics = PoolMetrics("async")
+
+InstrumentedQueuePool = instrumented(QueuePool, sync_pool_metrics)
+InstrumentedAsyncQueuePool = instrumented(AsyncAdaptedQueuePool, async_pool_metrics)
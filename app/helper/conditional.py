@@ -0,0 +1,77 @@
+from datetime import datetime, timezone
+from email.utils import format_datetime, parsedate_to_datetime
+from hashlib import sha256
+from pathlib import Path
+from typing import Optional
+from fastapi import Request, Response
+from app.helper.static_assets import assets
+
+TEMPLATE_DIR = Path("templates")
+
+# Cache-Control per kind of page. Everything is revalidated on each use;
+# pages that depend on the viewer must not be stored by shared caches.
+PUBLIC_PAGE_CACHE = "public, no-cache"
+PRIVATE_PAGE_CACHE = "private, no-cache"
+
+_template_fingerprint = None
+
+
+def template_fingerprint() -> str:
+    """
+    Hash of the template sources and static asset versions, so a deploy that
+    changes markup or the fingerprinted CSS/JS URLs changes every ETag.
+    """
+    global _template_fingerprint
+    if _template_fingerprint is None:
+        digest = sha256()
+        for path in sorted(TEMPLATE_DIR.glob("*.html")):
+            digest.update(path.name.encode())
+            digest.update(path.read_bytes())
+        assets.ensure_built()
+        digest.update(assets.version.encode())
+        _template_fingerprint = digest.hexdigest()[:16]
+    return _template_fingerprint
+
+
+def make_etag(*parts) -> str:
+    """Strong ETag over the repr of `parts` and the template fingerprint."""
+    digest = sha256(template_fingerprint().encode())
+    for part in parts:
+        digest.update(repr(part).encode())
+        digest.update(b"\0")
+    return f'"{digest.hexdigest()[:32]}"'
+
+
+def _as_utc(value: datetime) -> datetime:
+    if value.tzinfo is None:
+        value = value.replace(tzinfo=timezone.utc)
+    return value.astimezone(timezone.utc).replace(microsecond=0)
+
+
+def validator_headers(etag: str, last_modified: Optional[datetime], cache_control: str) -> dict:
+    headers = {"ETag": etag, "Cache-Control": cache_control, "Vary": "Cookie, Authorization"}
+    if last_modified:
+        headers["Last-Modified"] = format_datetime(_as_utc(last_modified), usegmt=True)
+    return headers
+
+
+def is_not_modified(request: Request, etag: str, last_modified: Optional[datetime]) -> bool:
+    """RFC 9110 precedence: If-None-Match wins; If-Modified-Since only without it."""
+    if_none_match = request.headers.get("if-none-match")
+    if if_none_match is not None:
+        # If-None-Match uses weak comparison, so ignore any W/ prefix.
+        candidates = [tag.strip().removeprefix("W/") for tag in if_none_match.split(",")]
+        return "*" in candidates or etag in candidates
+
+    if_modified_since = request.headers.get("if-modified-since")
+    if if_modified_since and last_modified:
+        try:
+            since = parsedate_to_datetime(if_modified_since)
+        except (TypeError, ValueError):
+            return False
+        return _as_utc(last_modified) <= _as_utc(since)
+    return False
+
+
+def not_modified_response(headers: dict) -> Response:
+    return Response(status_code=304, headers=headers)
@@ -1,8 +1,9 @@
 from fastapi import Cookie, HTTPException, Depends, Response
 from sqlalchemy.orm import Session
 from app.models.user import User
-from app.database.connection import get_db
+from app.database.connection import get_session, run_db
 from app.utils.jwt_handler import decode_token
+from app.utils.user_cache import get_cached_user, cache_user
 from fastapi.security import OAuth2PasswordBearer
 
 oauth2_scheme = OAuth2PasswordBearer(
@@ -17,11 +18,32 @@ def get_token(
 ):
     return access_token or bearer_token
 
+# ---------------- USER LOOKUP ----------------
+def _fetch_user(db: Session, user_id):
+    return db.query(User).filter(
+        User.id == user_id,
+        User.deleted_at.is_(None)
+    ).first()
+
+
+async def _load_user(db, user_id):
+    """Resolve a live user from the snapshot cache, falling back to the DB."""
+    if user_id is None:
+        return None
+
+    user = get_cached_user(user_id)
+    if user:
+        return user
+
+    user = await run_db(db, _fetch_user, user_id)
+
+    return cache_user(user) if user else None
+
 # ---------------- REQUIRED LOGIN ----------------
-def get_current_user(
+async def get_current_user(
     response: Response,
     token: str = Depends(get_token),
-    db: Session = Depends(get_db),
+    db=Depends(get_session),
 ):
     if not token:
         raise HTTPException(status_code=401, detail="Not authenticated")
@@ -31,10 +53,7 @@ def get_current_user(
         response.delete_cookie("access_token")
         raise HTTPException(status_code=401, detail="Invalid or expired token")
 
-    user = db.query(User).filter(
-        User.id == payload.get("user_id"),
-        User.deleted_at.is_(None)
-    ).first()
+    user = await _load_user(db, payload.get("user_id"))
 
     if not user:
         response.delete_cookie("access_token")
@@ -44,9 +63,9 @@ def get_current_user(
 
 
 # ---------------- OPTIONAL LOGIN ----------------
-def get_current_user_optional(
+async def get_current_user_optional(
     token: str = Depends(get_token),
-    db: Session = Depends(get_db),
+    db=Depends(get_session),
 ):
     if not token:
         return None
@@ -55,7 +74,4 @@ def get_current_user_optional(
     if not payload:
         return None
 
-    return db.query(User).filter(
-        User.id == payload.get("user_id"),
-        User.deleted_at.is_(None)
-    ).first()
+    return await _load_user(db, payload.get("user_id"))
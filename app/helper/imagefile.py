@@ -1,50 +1,129 @@
 from fastapi import APIRouter, Depends, Request, Form, HTTPException, UploadFile, File
-import shutil
 from pathlib import Path
 from typing import Optional
-from datetime import datetime
+from hashlib import sha256
+import anyio
 import os
+import tempfile
+import uuid
+from dotenv import load_dotenv
+from starlette.datastructures import Headers
+from starlette.responses import JSONResponse
+from app.utils.storage import get_storage, key_from_url
+
+load_dotenv()
 # ================= UPLOAD SETTINGS =================
-UPLOAD_DIR = Path("static/uploads")
-UPLOAD_DIR.mkdir(parents=True, exist_ok=True)
+# Uploads are staged here while streaming, then handed to the storage backend.
+UPLOAD_TMP_DIR = Path(os.getenv("UPLOAD_TMP_DIR", tempfile.gettempdir()))
+UPLOAD_TMP_DIR.mkdir(parents=True, exist_ok=True)
 
 ALLOWED_EXTENSIONS = {".jpg", ".jpeg", ".png", ".gif", ".webp"}
+MAX_UPLOAD_BYTES = int(os.getenv("MAX_UPLOAD_BYTES", str(10 * 1024 * 1024)))
+UPLOAD_CHUNK_BYTES = 256 * 1024
+# Whole multipart request: the image plus the other form fields.
+MAX_UPLOAD_REQUEST_BYTES = MAX_UPLOAD_BYTES + int(os.getenv("MAX_UPLOAD_FORM_BYTES", str(1024 * 1024)))
+
+
+def _too_large_detail() -> str:
+    return f"File too large. Maximum size is {MAX_UPLOAD_BYTES // (1024 * 1024)} MB"
 
 # ================= HELPER FUNCTIONS =================
 def delete_file_if_exists(file_path: Optional[str]):
-    """Delete a file from static/uploads if it exists."""
+    """Delete an upload, and its resized variants, from storage if it exists."""
     try:
         if file_path:
-            absolute_path = Path(file_path.lstrip("/")) 
-            if absolute_path.exists():
-                absolute_path.unlink()
-                print(f"Deleted old file: {absolute_path}")
+            storage = get_storage()
+            key = key_from_url(file_path)
+            storage.delete(key)
+            storage.delete_prefix(f"{os.path.splitext(key)[0]}-")
+            print(f"Deleted old file: {key}")
     except Exception as e:
         print(f"Error deleting file {file_path}: {e}")
 
 
-def save_upload_file(upload_file: UploadFile) -> Optional[str]:
-    """Save uploaded file in static/uploads with date-time filename."""
-    try:
-        file_ext = os.path.splitext(upload_file.filename)[1].lower()
-        if file_ext not in ALLOWED_EXTENSIONS:
-            raise HTTPException(
-                status_code=400,
-                detail=f"Invalid file type. Allowed: {', '.join(ALLOWED_EXTENSIONS)}"
-            )
+async def save_upload_file(upload_file: UploadFile) -> Optional[str]:
+    """
+    Stream an uploaded image into storage without blocking the event loop.
+    The file is written in chunks to a temp file (rejected with 413 once it
+    passes MAX_UPLOAD_BYTES), then stored under a key derived from its
+    SHA-256, so identical images are stored once. Returns the image URL.
+    """
+    file_ext = os.path.splitext(upload_file.filename)[1].lower()
+    if file_ext not in ALLOWED_EXTENSIONS:
+        await upload_file.close()
+        raise HTTPException(
+            status_code=400,
+            detail=f"Invalid file type. Allowed: {', '.join(ALLOWED_EXTENSIONS)}"
+        )
 
-        timestamp = datetime.now().strftime("%d_%m_%y,%H.%M.%S") 
-        safe_filename = upload_file.filename.replace(" ", "_")
-        filename = f"{timestamp}_{safe_filename}"
+    temp_path = UPLOAD_TMP_DIR / f".upload-{uuid.uuid4().hex}.tmp"
+    try:
+        digest = sha256()
+        size = 0
+        async with await anyio.open_file(temp_path, "wb") as buffer:
+            while chunk := await upload_file.read(UPLOAD_CHUNK_BYTES):
+                size += len(chunk)
+                if size > MAX_UPLOAD_BYTES:
+                    raise HTTPException(status_code=413, detail=_too_large_detail())
+                digest.update(chunk)
+                await buffer.write(chunk)
 
-        file_path = UPLOAD_DIR / filename
-        with file_path.open("wb") as buffer:
-            shutil.copyfileobj(upload_file.file, buffer)
+        key = f"{digest.hexdigest()}{file_ext}"
+        storage = get_storage()
+        if not await anyio.to_thread.run_sync(storage.exists, key):
+            await anyio.to_thread.run_sync(storage.put_file, key, temp_path)
 
-        return f"/static/uploads/{filename}"
+        return storage.url(key)
 
+    except HTTPException:
+        raise
     except Exception as e:
         print(f"Error saving file: {e}")
         return None
     finally:
-        upload_file.file.close()
\ No newline at end of file
+        await anyio.Path(temp_path).unlink(missing_ok=True)
+        await upload_file.close()
+
+
+class UploadSizeLimitMiddleware:
+    """
+    Caps multipart request bodies at MAX_UPLOAD_REQUEST_BYTES before the
+    form parser spools them to disk. A declared Content-Length over the cap
+    gets a 413 without reading the body; otherwise (chunked uploads, or a
+    client sending more than it declared) the body is counted as it is
+    received and parsing stops with a 413 once it passes the cap.
+    save_upload_file still enforces MAX_UPLOAD_BYTES per file.
+    """
+
+    def __init__(self, app, max_bytes: int = MAX_UPLOAD_REQUEST_BYTES):
+        self.app = app
+        self.max_bytes = max_bytes
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http" or scope["method"] not in ("POST", "PUT", "PATCH"):
+            await self.app(scope, receive, send)
+            return
+        headers = Headers(scope=scope)
+        if not headers.get("content-type", "").startswith("multipart/form-data"):
+            await self.app(scope, receive, send)
+            return
+
+        content_length = headers.get("content-length", "")
+        if content_length.isdigit() and int(content_length) > self.max_bytes:
+            response = JSONResponse({"detail": _too_large_detail()}, status_code=413)
+            await response(scope, receive, send)
+            return
+
+        received = 0
+
+        async def limited_receive():
+            nonlocal received
+            message = await receive()
+            if message["type"] == "http.request":
+                received += len(message.get("body", b""))
+                if received > self.max_bytes:
+                    # Raised inside body parsing, so FastAPI answers it as a 413.
+                    raise HTTPException(status_code=413, detail=_too_large_detail())
+            return message
+
+        await self.app(scope, limited_receive, send)
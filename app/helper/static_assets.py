@@ -0,0 +1,154 @@
+from dataclasses import dataclass, field
+from hashlib import sha256
+from pathlib import Path
+from threading import Lock
+import gzip
+import mimetypes
+from starlette.responses import Response
+from starlette.staticfiles import StaticFiles
+
+try:
+    import brotli
+except ImportError:  # brotli is optional; gzip is always built
+    brotli = None
+
+STATIC_DIR = Path("static")
+ASSET_DIRS = ("css", "js")
+ASSETS_URL_PREFIX = "/assets"
+COMPRESSIBLE_TYPES = {"text/css", "text/javascript", "application/javascript", "image/svg+xml"}
+IMMUTABLE_CACHE = "public, max-age=31536000, immutable"
+# Skip compressing tiny files; the headers cost more than they save.
+MIN_COMPRESS_BYTES = 512
+
+
+@dataclass
+class Asset:
+    content_type: str
+    etag: str
+    # encoding ("br", "gzip", "identity") -> body
+    bodies: dict = field(default_factory=dict)
+
+
+def _fingerprinted_name(path: Path, digest: str) -> str:
+    return f"{path.stem}.{digest[:12]}{path.suffix}"
+
+
+class AssetManifest:
+    """
+    Content-fingerprinted copies of static/css and static/js, held in memory
+    with gzip (and brotli, if installed) variants built once at startup.
+    asset_url("css/home.css") returns e.g. /assets/css/home.3f2a1b9c04de.css;
+    those URLs never change content, so they are served as immutable.
+    """
+
+    def __init__(self, root: Path = STATIC_DIR, directories=ASSET_DIRS):
+        self.root = root
+        self.directories = directories
+        self._urls = {}    # logical path -> fingerprinted URL
+        self._assets = {}  # fingerprinted path -> Asset
+        self.version = ""
+        self._lock = Lock()
+        self.built = False
+
+    def build(self):
+        urls, assets = {}, {}
+        version = sha256()
+        for directory in self.directories:
+            for path in sorted((self.root / directory).rglob("*")):
+                if not path.is_file():
+                    continue
+                data = path.read_bytes()
+                digest = sha256(data).hexdigest()
+                logical = path.relative_to(self.root).as_posix()
+                hashed = (path.parent / _fingerprinted_name(path, digest)).relative_to(self.root).as_posix()
+                content_type = mimetypes.guess_type(path.name)[0] or "application/octet-stream"
+
+                asset = Asset(content_type=content_type, etag=f'"{digest[:32]}"')
+                asset.bodies["identity"] = data
+                if content_type in COMPRESSIBLE_TYPES and len(data) >= MIN_COMPRESS_BYTES:
+                    if brotli is not None:
+                        asset.bodies["br"] = brotli.compress(data, quality=11)
+                    asset.bodies["gzip"] = gzip.compress(data, compresslevel=9, mtime=0)
+
+                urls[logical] = f"{ASSETS_URL_PREFIX}/{hashed}"
+                assets[hashed] = asset
+                version.update(logical.encode())
+                version.update(digest.encode())
+
+        with self._lock:
+            self._urls, self._assets = urls, assets
+            self.version = version.hexdigest()[:16]
+            self.built = True
+
+    def ensure_built(self):
+        if not self.built:
+            self.build()
+
+    def url(self, logical_path: str) -> str:
+        self.ensure_built()
+        return self._urls.get(logical_path, f"/static/{logical_path}")
+
+    def get(self, hashed_path: str):
+        self.ensure_built()
+        return self._assets.get(hashed_path)
+
+    async def __call__(self, scope, receive, send):
+        """ASGI app serving fingerprinted assets, mounted at ASSETS_URL_PREFIX."""
+        path = scope["path"]
+        root_path = scope.get("root_path", "")
+        if root_path and path.startswith(root_path):
+            path = path[len(root_path):]
+        asset = self.get(path.lstrip("/")) if scope["method"] in ("GET", "HEAD") else None
+        if asset is None:
+            await Response(status_code=404)(scope, receive, send)
+            return
+
+        headers = dict(
+            (key.decode("latin-1").lower(), value.decode("latin-1"))
+            for key, value in scope["headers"]
+        )
+        response_headers = {
+            "Cache-Control": IMMUTABLE_CACHE,
+            "ETag": asset.etag,
+            "Vary": "Accept-Encoding",
+        }
+        if asset.etag in headers.get("if-none-match", ""):
+            await Response(status_code=304, headers=response_headers)(scope, receive, send)
+            return
+
+        accepted = {part.split(";")[0].strip() for part in headers.get("accept-encoding", "").split(",")}
+        encoding = next((e for e in ("br", "gzip") if e in accepted and e in asset.bodies), "identity")
+        if encoding != "identity":
+            response_headers["Content-Encoding"] = encoding
+        body = asset.bodies[encoding]
+        response = Response(
+            content=body if scope["method"] == "GET" else b"",
+            media_type=asset.content_type,
+            headers=response_headers,
+        )
+        if scope["method"] == "HEAD":
+            response.headers["content-length"] = str(len(body))
+        await response(scope, receive, send)
+
+
+class UploadFiles(StaticFiles):
+    """
+    StaticFiles for uploads. Upload names are content hashes and never
+    rewritten, so they can be cached forever. Files are still sent with
+    FileResponse, which handles Range requests and zero-copy send where the
+    server supports it.
+    """
+
+    def file_response(self, *args, **kwargs):
+        response = super().file_response(*args, **kwargs)
+        if response.status_code in (200, 206):
+            response.headers["Cache-Control"] = IMMUTABLE_CACHE
+        return response
+
+
+assets = AssetManifest()
+
+
+def asset_url(logical_path: str) -> str:
+    """Jinja global: fingerprinted URL for a file under static/css or static/js."""
+    return assets.url(logical_path)
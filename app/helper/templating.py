@@ -0,0 +1,55 @@
+from pathlib import Path
+import os
+import time
+from dotenv import load_dotenv
+from fastapi.templating import Jinja2Templates
+from jinja2 import Environment, FileSystemBytecodeCache, FileSystemLoader
+from app.helper.static_assets import asset_url
+
+load_dotenv()
+
+TEMPLATE_DIR = Path("templates")
+# Compiled template bytecode survives restarts here, so a new worker only
+# parses templates that changed since the last deploy. Unset, Jinja picks a
+# per-user directory under the temp dir that it creates 0700 and refuses
+# to use if someone else owns it; anyone who can write the cache can run
+# code in the app.
+TEMPLATE_CACHE_DIR = os.getenv("TEMPLATE_CACHE_DIR")
+# Only for development: re-checks template mtimes on every render.
+TEMPLATE_AUTO_RELOAD = os.getenv("TEMPLATE_AUTO_RELOAD", "false").lower() == "true"
+
+
+
+def _bytecode_cache() -> FileSystemBytecodeCache:
+    if not TEMPLATE_CACHE_DIR:
+        return FileSystemBytecodeCache()
+    cache_dir = Path(TEMPLATE_CACHE_DIR)
+    cache_dir.mkdir(mode=0o700, parents=True, exist_ok=True)
+    return FileSystemBytecodeCache(str(cache_dir))
+
+
+env = Environment(
+    loader=FileSystemLoader(TEMPLATE_DIR),
+    autoescape=True,
+    auto_reload=TEMPLATE_AUTO_RELOAD,
+    bytecode_cache=_bytecode_cache(),
+    # Keep every template compiled; there are only a handful.
+    cache_size=-1,
+)
+env.globals["asset_url"] = asset_url
+
+# The one templating object shared by every router.
+templates = Jinja2Templates(env=env)
+
+template_metrics = {"templates": 0, "compile_seconds": None, "auto_reload": TEMPLATE_AUTO_RELOAD}
+
+
+def precompile_templates():
+    """Load every template at startup so the first request is not the one paying for it."""
+    started = time.perf_counter()
+    names = env.list_templates(extensions=["html"])
+    for name in names:
+        env.get_template(name)
+    template_metrics["templates"] = len(names)
+    template_metrics["compile_seconds"] = round(time.perf_counter() - started, 4)
+    print(f"Compiled {len(names)} templates in {template_metrics['compile_seconds'] * 1000:.1f} ms")
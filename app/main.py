@@ -1,13 +1,25 @@
 from fastapi import FastAPI
+import os
 from fastapi.staticfiles import StaticFiles
-from fastapi.templating import Jinja2Templates
+from app.helper.templating import precompile_templates
+from app.helper.compression import CompressionMiddleware
+from app.helper.imagefile import UploadSizeLimitMiddleware
+from app.utils.rate_limit import RateLimitMiddleware
+from app.helper.static_assets import ASSETS_URL_PREFIX, UploadFiles, assets
+from app.utils.storage import UPLOAD_BASE_URL, UPLOAD_DIR
 from starlette.middleware.sessions import SessionMiddleware
 from app.database.connection import Base, engine
 from app.routers.login_controller import router
 from app.routers.registration_controller import router as registration
 from app.routers.post_controller import router as post
 import app.models
+from app.services.email_outbox import email_worker
+from app.services.otp_reaper import otp_reaper
+from app.services.image_service import shutdown_image_workers
 from app.routers.auth_controller import router as auth_api
+from app.routers.metrics_controller import router as metrics
+from app.routers.media_controller import router as media
+from app.routers.api_controller import router as api_v1
 
 app = FastAPI()
 
@@ -16,14 +28,62 @@ app.add_middleware(
     SessionMiddleware,
     secret_key="secret"  # Change this to a secure secret key in production
 )
+app.add_middleware(CompressionMiddleware)
+app.add_middleware(UploadSizeLimitMiddleware)
+# Added last so it runs first: throttled requests are rejected before
+# sessions, compression or routing do any work.
+app.add_middleware(RateLimitMiddleware)
 
+# Uploads and fingerprinted CSS/JS never change under a given URL, so both
+# are served as immutable; /static keeps serving everything else as before.
+app.mount(UPLOAD_BASE_URL, UploadFiles(directory=UPLOAD_DIR, check_dir=False), name="uploads")
+app.mount(ASSETS_URL_PREFIX, assets, name="assets")
 app.mount("/static", StaticFiles(directory="static"), name="static")
-templates = Jinja2Templates(directory="templates")
 
 # Include routers
 app.include_router(router)
 app.include_router(registration)
 app.include_router(post)
 app.include_router(auth_api)
+app.include_router(metrics)
+app.include_router(media)
+app.include_router(api_v1)
 # Create all database tables
-Base.metadata.create_all(bind=engine)
\ No newline at end of file
+Base.metadata.create_all(bind=engine)
+
+
+@app.on_event("startup")
+def build_static_assets():
+    assets.build()
+
+
+@app.on_event("startup")
+def compile_templates():
+    precompile_templates()
+
+
+@app.on_event("startup")
+def start_email_worker():
+    if os.getenv("EMAIL_WORKER_ENABLED", "true").lower() == "true":
+        email_worker.start()
+
+
+@app.on_event("shutdown")
+def stop_email_worker():
+    email_worker.stop()
+
+
+@app.on_event("startup")
+def start_otp_reaper():
+    if os.getenv("OTP_REAPER_ENABLED", "true").lower() == "true":
+        otp_reaper.start()
+
+
+@app.on_event("shutdown")
+def stop_otp_reaper():
+    otp_reaper.stop()
+
+
+@app.on_event("shutdown")
+def stop_image_workers():
+    shutdown_image_workers()
@@ -2,4 +2,5 @@ from .user import User
 from .post import Post
 from .comments import Comment
 from .otp import OTP
-__all__ = ["User", "Post", "Comment", "OTP"]
\ No newline at end of file
+from .email_outbox import EmailOutbox
+__all__ = ["User", "Post", "Comment", "OTP", "EmailOutbox"]
\ No newline at end of file
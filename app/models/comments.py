@@ -1,4 +1,4 @@
-from sqlalchemy import Column, Integer, Text, ForeignKey, DateTime ,Boolean
+from sqlalchemy import Column, Integer, Text, ForeignKey, DateTime ,Boolean, Index
 from sqlalchemy.sql import func
 from sqlalchemy.orm import relationship
 from app.database.connection import Base
@@ -6,6 +6,12 @@ from datetime import datetime, timezone
 
 class Comment(Base):
     __tablename__ = "comments"
+    __table_args__ = (
+        # Serves per-post comment pages and the newest-K-per-post feed query.
+        Index("ix_comments_post_thread", "post_id", "deleted_at", "created_at", "id"),
+        # A user's live comments (account deletion).
+        Index("ix_comments_user", "user_id", "deleted_at"),
+    )
     id = Column(Integer, primary_key=True, index=True)
     post_id = Column(Integer, ForeignKey("posts.id"))
     user_id = Column(Integer, ForeignKey("users.id"))
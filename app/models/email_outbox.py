@@ -0,0 +1,24 @@
+from sqlalchemy import Column, Integer, String, Text, DateTime, Index
+from sqlalchemy.sql import func
+from app.database.connection import Base
+
+
+class EmailOutbox(Base):
+    __tablename__ = "email_outbox"
+    __table_args__ = (
+        # The worker polls for unsent mail that is due.
+        Index("ix_email_outbox_due", "sent_at", "failed_at", "next_attempt_at"),
+        # Purging failed messages past the retention window.
+        Index("ix_email_outbox_failed", "failed_at"),
+    )
+    id = Column(Integer, primary_key=True, index=True)
+    to_email = Column(String(150), nullable=False)
+    subject = Column(String(255), nullable=False)
+    # Cleared once the message is sent or given up on: OTP mails carry the code.
+    body = Column(Text, nullable=True)
+    attempts = Column(Integer, default=0, server_default="0", nullable=False)
+    last_error = Column(Text, nullable=True)
+    next_attempt_at = Column(DateTime(timezone=True), server_default=func.now(), nullable=False)
+    created_at = Column(DateTime(timezone=True), server_default=func.now(), nullable=False)
+    sent_at = Column(DateTime(timezone=True), nullable=True)
+    failed_at = Column(DateTime(timezone=True), nullable=True)
@@ -1,4 +1,4 @@
-from sqlalchemy import Column, Integer, String, DateTime, Boolean
+from sqlalchemy import Column, Integer, String, DateTime, Boolean, Index
 from sqlalchemy.sql import func
 from app.database.connection import Base
 from datetime import datetime, timezone
@@ -6,10 +6,14 @@ from datetime import datetime, timezone
 
 class OTP(Base):
     __tablename__ = "otps"
+    __table_args__ = (
+        # Latest (verified) OTP for an email; also serves lookups by email alone.
+        Index("ix_otps_email_verified", "email", "is_verified", "created_at"),
+    )
     id = Column(Integer, primary_key=True, index=True)
-    email = Column(String(150), nullable=False, index=True)
+    email = Column(String(150), nullable=False)
     otp_code = Column(String(10), nullable=False)
     is_verified = Column(Boolean, default=False, nullable=False)
-    expires_at = Column(DateTime(timezone=True), nullable=False)
+    expires_at = Column(DateTime(timezone=True), nullable=False, index=True)
     deleted_at = Column(DateTime(timezone=True), nullable=True)
     created_at = Column(DateTime(timezone=True), server_default=func.now(), nullable=False)
\ No newline at end of file
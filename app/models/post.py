@@ -1,4 +1,4 @@
-from sqlalchemy import Column, Integer, String, Text, ForeignKey, DateTime, Boolean
+from sqlalchemy import Column, Integer, String, Text, ForeignKey, DateTime, Boolean, Index, JSON
 from sqlalchemy.orm import relationship
 from app.database.connection import Base
 from datetime import datetime, timezone
@@ -6,11 +6,29 @@ from sqlalchemy.sql import func
 
 class Post(Base):
     __tablename__ = "posts"
+    __table_args__ = (
+        # Serves the keyset-paginated feed: live posts ordered by (created_at, id).
+        Index("ix_posts_feed", "deleted_at", "created_at", "id"),
+        # One author's live posts, newest first (profile, API, account deletion).
+        Index("ix_posts_user_feed", "user_id", "deleted_at", "created_at", "id"),
+        # Whether an uploaded image is still referenced before deleting it.
+        Index("ix_posts_image_url", "image_url"),
+        # Full-text search (MySQL only; other backends use the in-process index).
+        Index("ix_posts_fulltext", "title", "content", mysql_prefix="FULLTEXT").ddl_if(dialect="mysql"),
+    )
     id = Column(Integer, primary_key=True, index=True)
     title = Column(String(255))
     content = Column(Text)
     image_url = Column(String(500), nullable=True)  # NEW: Store image file path
+    # Resized copies of image_url, filled in by the image workers:
+    # {"src": url, "fallback": {width: url}, "webp": {width: url}}
+    # none_as_null: clearing them stores SQL NULL, not the JSON 'null'.
+    image_variants = Column(JSON(none_as_null=True), nullable=True)
+    # When image_variants were attached; a change marker for cached pages
+    # that leaves updated_at to real edits.
+    variants_at = Column(DateTime(timezone=True), nullable=True)
     status = Column(Boolean, default=True, nullable=False)
+    comment_count = Column(Integer, default=0, server_default="0", nullable=False)
     created_at = Column(DateTime(timezone=True), server_default=func.now(), nullable=False)
     updated_at = Column(DateTime(timezone=True), nullable=True)
     deleted_at = Column(DateTime(timezone=True), nullable=True)
@@ -27,10 +45,13 @@ class Post(Base):
             "title": self.title,
             "content": self.content,
             "image_url": self.image_url,
+            "image_variants": self.image_variants,
+            "variants_at": self.variants_at,
             "status": self.status,
             "created_at": self.created_at,
             "updated_at": self.updated_at,
             "user_id": self.user_id,
+            "comment_count": self.comment_count,
             "author": {"id": self.author.id, "username": self.author.username} if self.author else {"id": self.user_id, "username": "Unknown"},
             "comments": [c.to_dict() for c in self.comments] if self.comments else []
         }
@@ -1,14 +1,25 @@
 from sqlalchemy import Column, Integer, String, DateTime ,Boolean ,Index
-from sqlalchemy.orm import relationship
+from sqlalchemy.orm import relationship, validates
 from app.database.connection import Base
 from datetime import datetime, timezone
 from sqlalchemy.sql import func
 
 
+def normalize_username(username: str) -> str:
+    """Case-insensitive form of a username, used for lookups and uniqueness."""
+    return username.strip().lower()
+
+
 class User(Base):
     __tablename__ = "users"
+    __table_args__ = (
+        # Login and registration look users up by username_key; email has its unique index.
+        Index("ix_users_username_key", "username_key", unique=True),
+    )
     id = Column(Integer, primary_key=True, index=True)
     username = Column(String(100))
+    # normalize_username(username), kept in step by the validator below.
+    username_key = Column(String(100))
     email = Column(String(150), unique=True)
     password = Column(String(255))
     status = Column(Boolean, default=True, nullable=False)
@@ -18,6 +29,11 @@ class User(Base):
     posts = relationship("Post", back_populates="author", lazy="dynamic")
     comments = relationship("Comment", back_populates="user")
 
+    @validates("username")
+    def _set_username_key(self, key, username):
+        self.username_key = normalize_username(username) if username is not None else None
+        return username
+
     def to_dict(self, include_posts=False, include_comments=False):
         user_dict = {
             "id": self.id,
@@ -1,4 +1,5 @@
 from app.routers import login_controller
 from app.routers import registration_controller
 from app.routers import post_controller
-from app.routers import auth_controller
\ No newline at end of file
+from app.routers import auth_controller
+from app.routers import metrics_controller
\ No newline at end of file
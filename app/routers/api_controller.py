@@ -0,0 +1,112 @@
+from fastapi import APIRouter, Depends, HTTPException
+from fastapi.responses import ORJSONResponse
+from typing import Optional
+from app.database.connection import get_session
+from app.helper.dependencies import get_current_user
+from app.schemas.api import (
+    BatchResultOut,
+    CommentBatchIn,
+    CommentPageOut,
+    PostBatchIn,
+    PostOut,
+    PostPageOut,
+    ProfileOut,
+)
+from app.services.post_service import (
+    COMMENTS_PAGE_SIZE,
+    FEED_PAGE_SIZE,
+    add_comments_bulk_async,
+    create_posts_bulk_async,
+    get_comments_for_post_async,
+    get_post_detail_async,
+    get_post_summaries_async,
+)
+
+# Versioned JSON API. Responses are validated against the schemas in
+# app.schemas.api and encoded with orjson.
+router = APIRouter(prefix="/api/v1", tags=["API v1"], default_response_class=ORJSONResponse)
+
+
+def _include_content(include: Optional[str]) -> bool:
+    return "content" in (include or "").split(",")
+
+
+def _comment_out(comment) -> dict:
+    return {
+        "id": comment.id,
+        "post_id": comment.post_id,
+        "comment_text": comment.comment_text,
+        "created_at": comment.created_at,
+        "user": {"id": comment.user.id, "username": comment.user.username} if comment.user else None,
+    }
+
+
+@router.get("/posts", response_model=PostPageOut, response_model_exclude_unset=True)
+async def list_posts(
+    cursor: Optional[str] = None,
+    limit: int = FEED_PAGE_SIZE,
+    include: Optional[str] = None,
+    db=Depends(get_session),
+):
+    posts, next_cursor = await get_post_summaries_async(
+        db, cursor, limit, include_content=_include_content(include)
+    )
+    return {"posts": posts, "next_cursor": next_cursor}
+
+
+@router.post("/posts/batch", response_model=BatchResultOut)
+async def create_posts_batch(batch: PostBatchIn, db=Depends(get_session), user=Depends(get_current_user)):
+    """Create up to MAX_BATCH_ITEMS posts in one transaction; invalid items are reported, not fatal."""
+    created, errors = await create_posts_bulk_async(db, batch.posts, user.id)
+    return {"created": created, "errors": errors}
+
+
+@router.post("/comments/batch", response_model=BatchResultOut)
+async def add_comments_batch(batch: CommentBatchIn, db=Depends(get_session), user=Depends(get_current_user)):
+    """Add up to MAX_BATCH_ITEMS comments, across any posts, in one transaction."""
+    created, errors = await add_comments_bulk_async(db, batch.comments, user.id)
+    return {"created": created, "errors": errors}
+
+
+@router.get("/posts/{post_id}", response_model=PostOut, response_model_exclude_unset=True)
+async def get_post(post_id: int, db=Depends(get_session)):
+    post = await get_post_detail_async(db, post_id)
+    if not post:
+        raise HTTPException(status_code=404, detail="Post not found")
+    return post
+
+
+@router.get("/posts/{post_id}/comments", response_model=CommentPageOut)
+async def list_post_comments(
+    post_id: int,
+    cursor: Optional[str] = None,
+    limit: int = COMMENTS_PAGE_SIZE,
+    db=Depends(get_session),
+):
+    comments, next_cursor = await get_comments_for_post_async(db, post_id, cursor, limit)
+    return {
+        "post_id": post_id,
+        "comments": [_comment_out(comment) for comment in comments],
+        "next_cursor": next_cursor,
+    }
+
+
+@router.get("/profile", response_model=ProfileOut, response_model_exclude_unset=True)
+async def get_profile(
+    cursor: Optional[str] = None,
+    limit: int = FEED_PAGE_SIZE,
+    include: Optional[str] = None,
+    db=Depends(get_session),
+    user=Depends(get_current_user),
+):
+    posts, next_cursor = await get_post_summaries_async(
+        db, cursor, limit, include_content=_include_content(include), user_id=user.id
+    )
+    return {
+        "id": user.id,
+        "username": user.username,
+        "email": user.email,
+        "created_at": user.created_at,
+        "posts": posts,
+        "next_cursor": next_cursor,
+    }
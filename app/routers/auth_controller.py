@@ -1,24 +1,29 @@
 from fastapi import APIRouter, Depends, HTTPException, status
 from fastapi.security import OAuth2PasswordRequestForm
-from sqlalchemy.orm import Session
-from app.database.connection import get_db
-from app.models.user import User
+from app.database.connection import get_session
+from app.models.user import normalize_username
+from app.services.login import login_user_service_async
+from app.utils.rate_limit import check_rate_limit_async, retry_after_header
 from app.utils.jwt_handler import create_access_token
-from passlib.context import CryptContext
 
 router = APIRouter(prefix="/auth", tags=["Auth"])
-pwd_context = CryptContext(schemes=["argon2"], deprecated="auto")
 
 @router.post("/login")
-def login(form_data: OAuth2PasswordRequestForm = Depends(), db: Session = Depends(get_db)):
+async def login(form_data: OAuth2PasswordRequestForm = Depends(), db=Depends(get_session)):
     identifier = form_data.username
     password = form_data.password
 
-    user = db.query(User).filter(
-        (User.username == identifier) | (User.email == identifier)
-    ).first()
+    retry_after = await check_rate_limit_async("login_identifier", normalize_username(identifier))
+    if retry_after:
+        raise HTTPException(
+            status_code=429,
+            detail="Too many login attempts",
+            headers=retry_after_header(retry_after),
+        )
 
-    if not user or not pwd_context.verify(password, user.password):
+    user = await login_user_service_async(db, identifier, password)
+
+    if not user:
         raise HTTPException(status_code=401, detail="Invalid credentials")
 
     token = create_access_token({"user_id": user.id})
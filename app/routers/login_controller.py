@@ -1,9 +1,11 @@
 from fastapi import APIRouter, Request, Form, Depends
 from fastapi.responses import HTMLResponse, RedirectResponse
-from fastapi.templating import Jinja2Templates
+from app.helper.templating import templates
 from sqlalchemy.orm import Session
-from app.database.connection import get_db
-from app.services.login import login_user_service
+from app.database.connection import get_session
+from app.models.user import normalize_username
+from app.services.login import login_user_service_async
+from app.utils.rate_limit import check_rate_limit_async, retry_after_header
 from app.utils.jwt_handler import create_access_token
 from app.helper.dependencies import get_current_user_optional
 from dotenv import load_dotenv
@@ -11,7 +13,6 @@ import os
 load_dotenv()
 
 router = APIRouter()
-templates = Jinja2Templates(directory="templates")
 
 
 # ---------------- WELCOME PAGE ----------------
@@ -37,14 +38,23 @@ def login_page(request: Request, user=Depends(get_current_user_optional)):
 
 # ---------------- LOGIN LOGIC ----------------
 @router.post("/login")
-def login_user(
+async def login_user(
     request: Request,
     identifier: str = Form(...),
     password: str = Form(...),
     remember: bool = Form(False),
-    db: Session = Depends(get_db),
+    db=Depends(get_session),
 ):
-    user = login_user_service(db, identifier, password)
+    retry_after = await check_rate_limit_async("login_identifier", normalize_username(identifier))
+    if retry_after:
+        return templates.TemplateResponse(
+            "login.html",
+            {"request": request, "error": "Too many login attempts. Please try again later."},
+            status_code=429,
+            headers=retry_after_header(retry_after),
+        )
+
+    user = await login_user_service_async(db, identifier, password)
 
     if not user:
         return templates.TemplateResponse(
@@ -0,0 +1,15 @@
+from fastapi import APIRouter, HTTPException
+from fastapi.responses import RedirectResponse
+from app.utils.storage import MEDIA_URL_PREFIX, get_storage
+
+router = APIRouter(prefix=MEDIA_URL_PREFIX, tags=["Media"])
+
+
+@router.get("/{key}")
+def media(key: str):
+    """Redirect to a short-lived presigned URL for media in a private bucket."""
+    storage = get_storage()
+    presigned_url = getattr(storage, "presigned_url", None)
+    if presigned_url is None or "/" in key or key.startswith("."):
+        raise HTTPException(status_code=404, detail="Not found")
+    return RedirectResponse(presigned_url(key), status_code=302)
@@ -0,0 +1,55 @@
+from fastapi import APIRouter, Depends, Header, HTTPException
+import hmac
+import os
+from dotenv import load_dotenv
+from app.database.connection import async_engine
+from app.database.pool_metrics import async_pool_metrics, sync_pool_metrics
+from app.helper.compression import no_compression
+from app.helper.templating import template_metrics
+from app.services.otp_reaper import otp_reaper
+from app.utils.rate_limit import rate_limit_metrics
+
+load_dotenv()
+
+# Scrapers send "Authorization: Bearer <METRICS_TOKEN>". Unset, the metrics
+# endpoints are off: they expose pool sizes, rejection counts and worker
+# state that are of use to an attacker probing the limits.
+METRICS_TOKEN = os.getenv("METRICS_TOKEN")
+
+
+def require_metrics_token(authorization: str = Header(None)):
+    if not METRICS_TOKEN:
+        raise HTTPException(status_code=404, detail="Not Found")
+    scheme, _, token = (authorization or "").partition(" ")
+    if scheme.lower() != "bearer" or not hmac.compare_digest(token.encode(), METRICS_TOKEN.encode()):
+        raise HTTPException(status_code=401, detail="Not authenticated", headers={"WWW-Authenticate": "Bearer"})
+
+
+router = APIRouter(prefix="/metrics", tags=["Metrics"], dependencies=[Depends(require_metrics_token)])
+
+
+@router.get("/db-pool")
+@no_compression  # polled often by scrapers; tiny and not worth the CPU
+def db_pool_metrics():
+    metrics = {"sync": sync_pool_metrics.snapshot()}
+    if async_engine is not None:
+        metrics["async"] = async_pool_metrics.snapshot()
+    return metrics
+
+
+@router.get("/templates")
+@no_compression
+def templates_metrics():
+    return template_metrics
+
+
+@router.get("/otp-reaper")
+@no_compression
+def otp_reaper_metrics():
+    return otp_reaper.metrics()
+
+
+@router.get("/rate-limit")
+@no_compression
+def rate_limiting_metrics():
+    return rate_limit_metrics
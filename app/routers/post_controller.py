@@ -1,48 +1,238 @@
-from fastapi import APIRouter, Depends, Request, Form, HTTPException, UploadFile, File
-from fastapi.responses import HTMLResponse, RedirectResponse
+from fastapi import APIRouter, BackgroundTasks, Depends, Request, Form, HTTPException, UploadFile, File
+from fastapi.responses import HTMLResponse, RedirectResponse, StreamingResponse
 from sqlalchemy.orm import Session
-from fastapi.templating import Jinja2Templates
-from app.database.connection import get_db
+from app.helper.templating import templates
+from app.database.connection import get_db, get_session
 from app.helper.dependencies import get_current_user, get_current_user_optional
 from app.schemas.post import PostCreate, PostUpdate
 from app.schemas.comment import CommentCreate
 from app.models.comments import Comment
 from app.services.post_service import (
-    create_post,
+    create_post_async,
     get_post_by_id,
-    update_post,
+    get_post_by_id_async,
+    update_post_async,
     delete_post,
+    is_image_shared_async,
     add_comment_to_post,
     delete_comment,
-    get_user_posts,
-    get_all_posts,
+    get_feed_page_async,
+    get_comments_for_post_async,
+    get_user_posts_async,
+    get_feed_validator_async,
+    get_user_posts_validator_async,
+    FeedStream,
 )
+import itertools
 import os
 from typing import Optional
 from app.helper.imagefile import save_upload_file,delete_file_if_exists
+from app.services.search_service import search_posts_async
+from app.utils.render_cache import page_cache, fragment_cache, content_version
+from app.helper.conditional import (
+    PRIVATE_PAGE_CACHE,
+    PUBLIC_PAGE_CACHE,
+    is_not_modified,
+    make_etag,
+    not_modified_response,
+    validator_headers,
+)
+from markupsafe import Markup
+from urllib.parse import urlencode
 
 
 router = APIRouter()
-templates = Jinja2Templates(directory="templates")
 
+# Stream /read as it renders instead of building the whole page first.
+FEED_STREAMING = os.getenv("FEED_STREAMING", "true").lower() == "true"
+STREAM_FLUSH_BYTES = 8192
+
+
+def _anonymous_post_fragment(post):
+    """
+    Rendered post card for anonymous viewers, reused across pages until the
+    post is edited, its image variants arrive or its comments change.
+    """
+    key = (
+        post["id"],
+        post["updated_at"],
+        post["variants_at"],
+        post["comment_count"],
+        tuple(comment["id"] for comment in post["comments"]),
+    )
+    html = fragment_cache.get(key)
+    if html is None:
+        html = templates.env.get_template("_post_card.html").render(post=post, current_user=None)
+        fragment_cache.set(key, html)
+    return Markup(html)
+
+
+class _StreamedPosts:
+    """
+    The `posts` of a streamed home.html: posts are loaded and converted while
+    the template iterates, and `next_url` is known once they have run out.
+    """
+
+    _UNSET = object()
+
+    def __init__(self, feed: FeedStream, anonymous: bool):
+        self._feed = feed
+        self._anonymous = anonymous
+        self._rows = None
+        self._first = self._UNSET
+
+    def __bool__(self):
+        if self._first is self._UNSET:
+            self._rows = iter(self._feed)
+            self._first = next(self._rows, None)
+        return self._first is not None
+
+    def __iter__(self):
+        if not self:
+            return
+        for post in itertools.chain([self._first], self._rows):
+            data = post.to_dict()
+            if self._anonymous:
+                data["fragment"] = _anonymous_post_fragment(data)
+            yield data
+
+    @property
+    def next_url(self):
+        cursor = self._feed.next_cursor
+        return f"/read?cursor={cursor}" if cursor else None
+
+
+def _stream_template(name: str, context: dict, on_complete=None):
+    """
+    Render `name` incrementally, yielding roughly STREAM_FLUSH_BYTES at a
+    time. Everything up to </head> is flushed on its own so the browser can
+    start fetching CSS while posts are still loading. `on_complete` gets the
+    full HTML once rendering has finished.
+    """
+    rendered = [] if on_complete else None
+    buffer, size, head_sent = [], 0, False
+    try:
+        for piece in templates.get_template(name).generate(context):
+            buffer.append(piece)
+            size += len(piece)
+            if size >= STREAM_FLUSH_BYTES or (not head_sent and "</head>" in piece):
+                head_sent = True
+                chunk = "".join(buffer)
+                buffer, size = [], 0
+                if rendered is not None:
+                    rendered.append(chunk)
+                yield chunk
+        chunk = "".join(buffer)
+        if rendered is not None:
+            rendered.append(chunk)
+            on_complete("".join(rendered))
+        yield chunk
+    except Exception as e:
+        print(f"Error streaming {name}:", e)
+        raise
 
 
 # ================= HOME =================
 @router.get("/read", response_class=HTMLResponse)
-def home(request: Request, db: Session = Depends(get_db), user=Depends(get_current_user_optional)):
+async def home(
+    request: Request,
+    cursor: Optional[str] = None,
+    db=Depends(get_session),
+    user=Depends(get_current_user_optional),
+):
     try:
-        posts = get_all_posts(db)
+        # Anonymous visitors all see the same page: serve it from memory
+        # until a post or comment changes.
+        cache_key = ("read", cursor, content_version())
+        if user is None:
+            cached = page_cache.get(cache_key)
+            if cached is not None:
+                html, etag, last_modified = cached
+                headers = validator_headers(etag, last_modified, PUBLIC_PAGE_CACHE)
+                if is_not_modified(request, etag, last_modified):
+                    return not_modified_response(headers)
+                return HTMLResponse(html, headers=headers)
+
+        # Validate against cheap aggregates before loading or rendering.
+        fingerprint, last_modified = await get_feed_validator_async(db, cursor)
+        etag = make_etag("read", user.id if user else None, cursor, fingerprint)
+        headers = validator_headers(
+            etag, last_modified, PRIVATE_PAGE_CACHE if user else PUBLIC_PAGE_CACHE
+        )
+        if is_not_modified(request, etag, last_modified):
+            return not_modified_response(headers)
+
+        context = {
+            "request": request,
+            "current_user": user,
+            "prev_url": "/read" if cursor else None,
+            "prev_label": "⬆️ Latest posts",
+        }
+
+        if FEED_STREAMING:
+            # Head and first posts go out while later batches are loading.
+            context["posts"] = _StreamedPosts(FeedStream(cursor), anonymous=user is None)
+            on_complete = None
+            if user is None:
+                def on_complete(html):
+                    page_cache.set(cache_key, (html, etag, last_modified))
+            return StreamingResponse(
+                _stream_template("home.html", context, on_complete),
+                media_type="text/html",
+                headers=headers,
+            )
+
+        posts, next_cursor = await get_feed_page_async(db, cursor)
         posts_data = [post.to_dict() for post in posts]
-        # print(f"{posts_data}:::::")
+        context["posts"] = posts_data
+        context["next_url"] = f"/read?cursor={next_cursor}" if next_cursor else None
+
+        if user is None:
+            for post in posts_data:
+                post["fragment"] = _anonymous_post_fragment(post)
+            html = templates.get_template("home.html").render(context)
+            page_cache.set(cache_key, (html, etag, last_modified))
+            return HTMLResponse(html, headers=headers)
+
+        return templates.TemplateResponse("home.html", context, headers=headers)
+    except HTTPException:
+        raise
+    except Exception as e:
+        print("Error loading home page:", e)
+        raise HTTPException(status_code=500, detail="Failed to load posts")
+
+# ================= SEARCH =================
+@router.get("/search", response_class=HTMLResponse)
+async def search(
+    request: Request,
+    q: str = "",
+    page: int = 1,
+    db=Depends(get_session),
+    user=Depends(get_current_user_optional),
+):
+    try:
+        posts, has_more = await search_posts_async(db, q, page)
+        posts_data = [post.to_dict() for post in posts]
+        if user is None:
+            for post in posts_data:
+                post["fragment"] = _anonymous_post_fragment(post)
         return templates.TemplateResponse(
             "home.html",
-            {"request": request, "posts": posts_data, "current_user": user},
+            {
+                "request": request,
+                "posts": posts_data,
+                "current_user": user,
+                "search_query": q,
+                "prev_url": f"/search?{urlencode({'q': q, 'page': page - 1})}" if page > 1 else None,
+                "prev_label": "⬅️ Previous",
+                "next_url": f"/search?{urlencode({'q': q, 'page': page + 1})}" if has_more else None,
+            },
         )
     except HTTPException:
         raise
     except Exception as e:
-        print("Error loading home page:", e)
-        raise HTTPException(status_code=500, detail="Failed to load posts")
+        print("Error searching posts:", e)
+        raise HTTPException(status_code=500, detail="Failed to search posts")
 
 # ================= CREATE POST =================
 @router.get("/create-post", response_class=HTMLResponse)
@@ -59,20 +249,20 @@ def create_post_page(request: Request, user=Depends(get_current_user)):
         raise HTTPException(status_code=500, detail="Failed to load page")
 
 @router.post("/create-post", response_class=RedirectResponse)
-def create_post_action(
+async def create_post_action(
     title: str = Form(...),
     content: str = Form(...),
     image: Optional[UploadFile] = File(None),
-    db: Session = Depends(get_db),
+    db=Depends(get_session),
     user=Depends(get_current_user),
 ):
     try:
         image_url = None
         if image and image.filename:
-            image_url = save_upload_file(image)
+            image_url = await save_upload_file(image)
 
         post_data = PostCreate(title=title, content=content, image_url=image_url)
-        create_post(db, post_data, user.id)
+        await create_post_async(db, post_data, user.id)
         return RedirectResponse("/read", status_code=303)
     except HTTPException:
         raise
@@ -100,17 +290,18 @@ def edit_post_page(post_id: int, request: Request, db: Session = Depends(get_db)
         raise HTTPException(status_code=500, detail="Failed to load page")
 
 @router.post("/post/{post_id}/edit", response_class=RedirectResponse)
-def update_post_action(
+async def update_post_action(
     post_id: int,
+    background_tasks: BackgroundTasks,
     title: str = Form(...),
     content: str = Form(...),
     image: Optional[UploadFile] = File(None),
     remove_image: Optional[str] = Form(None),
-    db: Session = Depends(get_db),
+    db=Depends(get_session),
     user=Depends(get_current_user),
 ):
     try:
-        post = get_post_by_id(db, post_id)
+        post = await get_post_by_id_async(db, post_id)
         if not post:
             raise HTTPException(status_code=404, detail="Post not found")
         if post.user_id != user.id:
@@ -120,15 +311,16 @@ def update_post_action(
 
         if remove_image == "true":
             image_url = None
-            delete_file_if_exists(old_image)
         elif image and image.filename:
-            image_url = save_upload_file(image)
-            delete_file_if_exists(old_image)
+            image_url = await save_upload_file(image)
         else:
             image_url = old_image
 
         post_data = PostUpdate(title=title, content=content, image_url=image_url)
-        update_post(db, post_id, post_data)
+        await update_post_async(db, post_id, post_data)
+
+        if old_image and old_image != image_url and not await is_image_shared_async(db, old_image, post_id):
+            background_tasks.add_task(delete_file_if_exists, old_image)
         return RedirectResponse("/read", status_code=303)
     except HTTPException:
         raise
@@ -138,16 +330,16 @@ def update_post_action(
 
 # ================= DELETE POST =================
 @router.post("/post/{post_id}/delete", response_class=RedirectResponse)
-def delete_post_action(post_id: int, db: Session = Depends(get_db), user=Depends(get_current_user)):
+def delete_post_action(
+    post_id: int,
+    background_tasks: BackgroundTasks,
+    db: Session = Depends(get_db),
+    user=Depends(get_current_user),
+):
     try:
-        post = get_post_by_id(db, post_id)
-        if not post:
+        # Storage may be remote; an unused image is removed after the response is sent.
+        if not delete_post(db, post_id, user_id=user.id, background_tasks=background_tasks):
             raise HTTPException(status_code=404, detail="Post not found")
-        if post.user_id != user.id:
-            raise HTTPException(status_code=403, detail="Not authorized")
-        delete_file_if_exists(post.image_url)
-
-        delete_post(db, post_id)
 
         return RedirectResponse("/read", status_code=303)
     except HTTPException:
@@ -169,6 +361,21 @@ def add_comment(post_id: int, comment_text: str = Form(...), db: Session = Depen
         print("Unexpected error adding comment:", e)
         raise HTTPException(status_code=500, detail="Failed to add comment")
 
+@router.get("/post/{post_id}/comments")
+async def list_comments(post_id: int, cursor: Optional[str] = None, db=Depends(get_session)):
+    try:
+        comments, next_cursor = await get_comments_for_post_async(db, post_id, cursor)
+        return {
+            "post_id": post_id,
+            "comments": [comment.to_dict() for comment in comments],
+            "next_cursor": next_cursor,
+        }
+    except HTTPException:
+        raise
+    except Exception as e:
+        print("Unexpected error fetching comments:", e)
+        raise HTTPException(status_code=500, detail="Failed to fetch comments")
+
 @router.post("/comment/{comment_id}/delete", response_class=RedirectResponse)
 def delete_comment_action(comment_id: int, db: Session = Depends(get_db), user=Depends(get_current_user)):
     try:
@@ -190,11 +397,15 @@ def delete_comment_action(comment_id: int, db: Session = Depends(get_db), user=D
 
 # ================= PROFILE =================
 @router.get("/profile", response_class=HTMLResponse)
-def profile_page(request: Request, db: Session = Depends(get_db), user=Depends(get_current_user)):
+async def profile_page(request: Request, db=Depends(get_session), user=Depends(get_current_user)):
     try:
-        user_posts = get_user_posts(db, user.id)
-        for post in user_posts:
-            post.comments = [c for c in post.comments if c.deleted_at is None]
+        fingerprint, last_modified = await get_user_posts_validator_async(db, user.id)
+        etag = make_etag("profile", user.to_dict(), fingerprint)
+        headers = validator_headers(etag, last_modified, PRIVATE_PAGE_CACHE)
+        if is_not_modified(request, etag, last_modified):
+            return not_modified_response(headers)
+
+        user_posts = await get_user_posts_async(db, user.id)
         return templates.TemplateResponse(
             "profile.html",
             {
@@ -203,6 +414,7 @@ def profile_page(request: Request, db: Session = Depends(get_db), user=Depends(g
                 "posts": user_posts,
                 "current_user": user,
             },
+            headers=headers,
         )
     except HTTPException:
         raise
@@ -1,17 +1,17 @@
 from fastapi import APIRouter, Request, Form, Depends, HTTPException
 from fastapi.responses import RedirectResponse, HTMLResponse
 from sqlalchemy.orm import Session
-from app.database.connection import get_db
+from app.database.connection import get_db, get_session
 from app.schemas.registration import RegisterSchema
-from app.services.registration import register_user_service
+from app.services.registration import register_user_service_async
 from app.services.user_service import delete_user_account
-from app.services.otp_service import create_and_send_otp, verify_otp, is_email_verified
+from app.services.otp_service import create_and_send_otp, verify_otp_async, is_email_verified
 from app.helper.dependencies import get_current_user_optional, get_current_user
 from pydantic import ValidationError
-from fastapi.templating import Jinja2Templates
-from app.models.user import User
+from app.helper.templating import templates
+from app.models.user import User, normalize_username
+from app.utils.rate_limit import check_rate_limit, check_rate_limit_async, retry_after_header
 router = APIRouter()
-templates = Jinja2Templates(directory="templates")
 
 @router.get("/register")
 def register_page(request: Request, user=Depends(get_current_user_optional)):
@@ -50,7 +50,18 @@ def register_user(
             password=password,
             confirm_password=confirm_password,
         )
-        existing_username = db.query(User).filter(User.username == user_data.username).first()
+        # Each attempt here may send an email, so cap them per address.
+        retry_after = check_rate_limit("register_email", user_data.email)
+        if retry_after:
+            errors["general"] = "Too many verification emails requested. Please try again later."
+            return templates.TemplateResponse(
+                "register.html",
+                {"request": request, "errors": errors, "values": values, "show_otp": False},
+                status_code=429,
+                headers=retry_after_header(retry_after),
+            )
+
+        existing_username = db.query(User).filter(User.username_key == normalize_username(user_data.username)).first()
         if existing_username:
             errors["username"] = "This username is already taken"
             return templates.TemplateResponse(
@@ -117,21 +128,41 @@ def register_user(
 
 
 @router.post("/verify-otp", response_class=HTMLResponse)
-def verify_otp_and_register(
+async def verify_otp_and_register(
     request: Request,
     email: str = Form(...),
     username: str = Form(...),
     password: str = Form(...),
     otp: str = Form(...),
-    db: Session = Depends(get_db),
+    db=Depends(get_session),
 ):
     """Step 2: Verify OTP and complete registration"""
     errors = {}
     values = {"username": username, "email": email}
 
     try:
+        # Caps OTP guesses per address, whichever IPs they come from.
+        retry_after = await check_rate_limit_async("otp_email", email.strip().lower())
+        if retry_after:
+            errors["otp"] = "Too many attempts. Please try again later."
+            return templates.TemplateResponse(
+                "register.html",
+                {
+                    "request": request,
+                    "errors": errors,
+                    "values": values,
+                    "show_otp": True,
+                    "user_data": {
+                        "username": username,
+                        "password": password
+                    }
+                },
+                status_code=429,
+                headers=retry_after_header(retry_after),
+            )
+
         # Verify OTP
-        is_valid = verify_otp(db, email, otp)
+        is_valid = await verify_otp_async(db, email, otp)
         
         if not is_valid:
             errors["otp"] = "Invalid or expired OTP. Please try again."
@@ -155,7 +186,7 @@ def verify_otp_and_register(
             confirm_password=password,
         )
         
-        register_user_service(db, user_data)
+        await register_user_service_async(db, user_data)
 
         return RedirectResponse("/login?verified=true", status_code=303)
 
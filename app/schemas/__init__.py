@@ -1,4 +1,14 @@
 from app.schemas import comment
 from app.schemas import post
 from app.schemas import registration
-__all__ = ["CommentCreate", "PostCreate", "PostUpdate", "RegisterSchema"]
\ No newline at end of file
+from app.schemas import api
+__all__ = [
+    "CommentCreate",
+    "PostCreate",
+    "PostUpdate",
+    "RegisterSchema",
+    "PostOut",
+    "PostPageOut",
+    "CommentPageOut",
+    "ProfileOut",
+]
\ No newline at end of file
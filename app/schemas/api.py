@@ -0,0 +1,77 @@
+from pydantic import BaseModel, Field
+from datetime import datetime
+from typing import List, Optional
+from app.schemas.comment import CommentCreate
+from app.schemas.post import PostCreate
+
+
+class AuthorOut(BaseModel):
+    id: int
+    username: str
+
+
+class CommentOut(BaseModel):
+    id: int
+    post_id: int
+    comment_text: str
+    created_at: datetime
+    user: Optional[AuthorOut] = None
+
+
+class PostSummaryOut(BaseModel):
+    id: int
+    # Nullable columns; older rows can have NULL in either.
+    title: Optional[str]
+    image_url: Optional[str] = None
+    comment_count: int
+    created_at: datetime
+    updated_at: Optional[datetime] = None
+    author: AuthorOut
+    # Only present when the list was requested with ?include=content.
+    content: Optional[str] = None
+
+
+class PostOut(PostSummaryOut):
+    content: Optional[str]
+
+
+class PostPageOut(BaseModel):
+    posts: List[PostSummaryOut]
+    next_cursor: Optional[str] = None
+
+
+class CommentPageOut(BaseModel):
+    post_id: int
+    comments: List[CommentOut]
+    next_cursor: Optional[str] = None
+
+
+class ProfileOut(BaseModel):
+    id: int
+    username: str
+    email: str
+    created_at: Optional[datetime] = None
+    posts: List[PostSummaryOut]
+    next_cursor: Optional[str] = None
+
+
+# Upper bound on items per batch request; larger imports send several batches.
+MAX_BATCH_ITEMS = 500
+
+
+class PostBatchIn(BaseModel):
+    posts: List[PostCreate] = Field(..., min_length=1, max_length=MAX_BATCH_ITEMS)
+
+
+class CommentBatchIn(BaseModel):
+    comments: List[CommentCreate] = Field(..., min_length=1, max_length=MAX_BATCH_ITEMS)
+
+
+class BatchErrorOut(BaseModel):
+    index: int
+    detail: str
+
+
+class BatchResultOut(BaseModel):
+    created: List[int]
+    errors: List[BatchErrorOut]
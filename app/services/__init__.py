@@ -3,7 +3,10 @@ from app.services import registration
 from app.services import post_service
 from app.services import user_service
 from app.services import otp_service
+from app.services import email_outbox
 __all__ = ["login_user_service", 
+           "enqueue_email",
+           "email_worker",
            "create_and_send_otp", 
            "verify_otp", 
            "is_email_verified",
@@ -16,4 +19,5 @@ __all__ = ["login_user_service",
            "update_post",
            "get_post_by_id",
            "get_all_posts",
+           "get_feed_page",
            "create_post"]
\ No newline at end of file
@@ -0,0 +1,200 @@
+from datetime import datetime, timedelta, timezone
+from threading import Event, Thread
+import os
+from dotenv import load_dotenv
+from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy.orm import Session
+from app.database.connection import SessionLocal
+from app.models.email_outbox import EmailOutbox
+from app.utils.email import EmailService
+
+load_dotenv()
+
+EMAIL_BATCH_SIZE = int(os.getenv("EMAIL_BATCH_SIZE", "50"))
+EMAIL_MAX_ATTEMPTS = int(os.getenv("EMAIL_MAX_ATTEMPTS", "6"))
+EMAIL_POLL_INTERVAL = float(os.getenv("EMAIL_POLL_INTERVAL", "5"))
+EMAIL_RETRY_BASE_SECONDS = float(os.getenv("EMAIL_RETRY_BASE_SECONDS", "10"))
+EMAIL_RETRY_MAX_SECONDS = float(os.getenv("EMAIL_RETRY_MAX_SECONDS", "900"))
+# How long a claimed message is hidden from other workers while it is sent.
+EMAIL_LEASE_SECONDS = int(os.getenv("EMAIL_LEASE_SECONDS", "120"))
+# Sent and failed messages are kept this long (bodies already cleared), then purged.
+EMAIL_OUTBOX_RETENTION_HOURS = float(os.getenv("EMAIL_OUTBOX_RETENTION_HOURS", "72"))
+EMAIL_OUTBOX_PURGE_BATCH_SIZE = int(os.getenv("EMAIL_OUTBOX_PURGE_BATCH_SIZE", "1000"))
+EMAIL_OUTBOX_PURGE_MAX_BATCHES = int(os.getenv("EMAIL_OUTBOX_PURGE_MAX_BATCHES", "50"))
+
+
+def enqueue_email(db: Session, to_email: str, subject: str, body: str) -> EmailOutbox:
+    """
+    Add a message to the outbox. Does not commit: the caller commits it in
+    the same transaction as the data the email is about.
+    """
+    message = EmailOutbox(
+        to_email=to_email,
+        subject=subject,
+        body=body,
+        next_attempt_at=datetime.now(timezone.utc),
+    )
+    db.add(message)
+    return message
+
+
+def retry_delay(attempts: int) -> timedelta:
+    """Exponential backoff: base, 2x base, 4x base, ... capped."""
+    seconds = EMAIL_RETRY_BASE_SECONDS * (2 ** max(attempts - 1, 0))
+    return timedelta(seconds=min(seconds, EMAIL_RETRY_MAX_SECONDS))
+
+
+def claim_due_emails(db: Session, limit: int = EMAIL_BATCH_SIZE):
+    """
+    Lease up to `limit` due messages to this worker by pushing their
+    next_attempt_at past the lease window. Rows locked by another worker
+    are skipped (FOR UPDATE SKIP LOCKED where the backend supports it).
+    """
+    now = datetime.now(timezone.utc)
+    messages = (
+        db.query(EmailOutbox)
+        .filter(
+            EmailOutbox.sent_at.is_(None),
+            EmailOutbox.failed_at.is_(None),
+            EmailOutbox.next_attempt_at <= now,
+        )
+        .order_by(EmailOutbox.next_attempt_at, EmailOutbox.id)
+        .limit(limit)
+        .with_for_update(skip_locked=True)
+        .all()
+    )
+    lease_until = now + timedelta(seconds=EMAIL_LEASE_SECONDS)
+    for message in messages:
+        message.next_attempt_at = lease_until
+    db.commit()
+    return messages
+
+
+def deliver_batch(db: Session, email_service: EmailService, limit: int = EMAIL_BATCH_SIZE) -> int:
+    """
+    Send one batch over `email_service`'s connection. Returns messages sent.
+    Commits after each message; use a session with expire_on_commit=False
+    so those commits do not expire (and refetch) the rest of the batch.
+    """
+    sent = 0
+    for message in claim_due_emails(db, limit):
+        try:
+            email_service.send_message(message.to_email, message.subject, message.body)
+        except Exception as e:
+            message.attempts += 1
+            message.last_error = str(e)[:1000]
+            if message.attempts >= EMAIL_MAX_ATTEMPTS:
+                message.failed_at = datetime.now(timezone.utc)
+                message.body = None
+                print(f"❌ EMAIL FAILED permanently to {message.to_email}:", e)
+            else:
+                message.next_attempt_at = datetime.now(timezone.utc) + retry_delay(message.attempts)
+                print(f"EMAIL to {message.to_email} failed, retrying later:", e)
+        else:
+            message.attempts += 1
+            message.sent_at = datetime.now(timezone.utc)
+            message.body = None
+            sent += 1
+        db.commit()
+    return sent
+
+
+def purge_email_outbox(
+    db: Session,
+    batch_size: int = EMAIL_OUTBOX_PURGE_BATCH_SIZE,
+    max_batches: int = EMAIL_OUTBOX_PURGE_MAX_BATCHES,
+) -> int:
+    """
+    Delete sent and failed messages older than EMAIL_OUTBOX_RETENTION_HOURS,
+    in batches of ids that commit on their own, like cleanup_expired_otps.
+    Returns the number of rows deleted.
+    """
+    cutoff = datetime.now(timezone.utc) - timedelta(hours=EMAIL_OUTBOX_RETENTION_HOURS)
+    purged = 0
+    try:
+        for column in (EmailOutbox.sent_at, EmailOutbox.failed_at):
+            for _ in range(max_batches):
+                ids = [
+                    message_id
+                    for (message_id,) in db.query(EmailOutbox.id)
+                    .filter(column < cutoff)
+                    .order_by(column)
+                    .limit(batch_size)
+                ]
+                if not ids:
+                    break
+                db.query(EmailOutbox).filter(EmailOutbox.id.in_(ids)).delete(synchronize_session=False)
+                db.commit()
+                purged += len(ids)
+                if len(ids) < batch_size:
+                    break
+    except SQLAlchemyError as e:
+        db.rollback()
+        print("DB Error purging email outbox:", e)
+    return purged
+
+
+class EmailOutboxWorker:
+    """
+    Background thread that drains the outbox. It keeps one SMTP connection
+    open while there is mail to send and closes it when the outbox is idle.
+    """
+
+    def __init__(self, session_factory=SessionLocal, service_factory=EmailService):
+        self.session_factory = session_factory
+        self.service_factory = service_factory
+        self._wakeup = Event()
+        self._stopping = Event()
+        self._thread = None
+
+    def start(self):
+        if self._thread and self._thread.is_alive():
+            return
+        self._stopping.clear()
+        self._thread = Thread(target=self._run, name="email-outbox", daemon=True)
+        self._thread.start()
+
+    def stop(self, timeout: float = 10):
+        self._stopping.set()
+        self._wakeup.set()
+        if self._thread:
+            self._thread.join(timeout)
+
+    def notify(self):
+        """Wake the worker now instead of at the next poll."""
+        self._wakeup.set()
+
+    def _run(self):
+        email_service = None
+        while not self._stopping.is_set():
+            # Clear before draining so a notify() that lands mid-batch is kept.
+            self._wakeup.clear()
+            sent = 0
+            # Claimed rows stay loaded across the per-message commits instead
+            # of being refetched one SELECT at a time; this worker holds
+            # their lease, so nothing else changes them meanwhile.
+            db = self.session_factory(expire_on_commit=False)
+            try:
+                if email_service is None:
+                    email_service = self.service_factory()
+                sent = deliver_batch(db, email_service)
+            except (SQLAlchemyError, ValueError) as e:
+                db.rollback()
+                print("Email outbox worker error:", e)
+            except Exception as e:
+                db.rollback()
+                print("Unexpected email outbox worker error:", e)
+            finally:
+                db.close()
+
+            if sent:
+                continue  # more may be due; keep the connection warm
+            if email_service is not None:
+                email_service.close()
+            self._wakeup.wait(EMAIL_POLL_INTERVAL)
+
+        if email_service is not None:
+            email_service.close()
+
+
+email_worker = EmailOutboxWorker()
@@ -0,0 +1,132 @@
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timezone
+from io import BytesIO
+import os
+import uuid
+from dotenv import load_dotenv
+from sqlalchemy.exc import SQLAlchemyError
+from app.database.connection import SessionLocal
+from app.helper.imagefile import UPLOAD_TMP_DIR
+from app.models.post import Post
+from app.utils.render_cache import bump_content_version
+from app.utils.storage import get_storage, image_urls_for, key_from_url
+
+try:
+    from PIL import Image, ImageOps
+except ImportError:  # Pillow is optional; without it cards use the original upload
+    Image = None
+
+load_dotenv()
+
+# Widths generated for every upload: card thumbnail, feed column, full view.
+IMAGE_VARIANT_WIDTHS = (320, 720, 1600)
+IMAGE_FEED_WIDTH = 720
+IMAGE_JPEG_QUALITY = int(os.getenv("IMAGE_JPEG_QUALITY", "82"))
+IMAGE_WEBP_QUALITY = int(os.getenv("IMAGE_WEBP_QUALITY", "80"))
+IMAGE_WORKERS = int(os.getenv("IMAGE_WORKERS", "2"))
+
+_executor = ThreadPoolExecutor(max_workers=IMAGE_WORKERS, thread_name_prefix="images")
+
+
+def _fallback_format(image) -> tuple:
+    """Keep PNG/GIF sources (transparency) as PNG; everything else becomes JPEG."""
+    if image.mode in ("RGBA", "LA", "P") or image.format in ("PNG", "GIF"):
+        return "PNG", ".png"
+    return "JPEG", ".jpg"
+
+
+def generate_variants(image_url: str) -> dict:
+    """
+    Write resized copies of an upload to storage and return their URLs:
+    {"src": url, "fallback": {width: url}, "webp": {width: url}}, where src
+    is the feed-width copy for browsers without srcset. Files are named after
+    the upload's content hash, so an image shared by several posts is only
+    processed once. Images are never upscaled.
+    """
+    storage = get_storage()
+    key = key_from_url(image_url)
+    stem = os.path.splitext(key)[0]
+    with storage.open(key) as stream:
+        data = stream if stream.seekable() else BytesIO(stream.read())
+        with Image.open(data) as original:
+            image = ImageOps.exif_transpose(original)
+            image.load()
+            fmt, ext = _fallback_format(original)
+
+    if fmt == "JPEG" and image.mode != "RGB":
+        image = image.convert("RGB")
+    elif fmt == "PNG" and image.mode == "P":
+        image = image.convert("RGBA")
+
+    widths = sorted({min(w, image.width) for w in IMAGE_VARIANT_WIDTHS})
+    variants = {"src": None, "fallback": {}, "webp": {}}
+    for width in widths:
+        height = max(1, round(image.height * width / image.width))
+        resized = image if width == image.width else image.resize((width, height), Image.LANCZOS)
+
+        for kind, name, save_args in (
+            ("fallback", f"{stem}-{width}{ext}", {"format": fmt, "optimize": True, "quality": IMAGE_JPEG_QUALITY, "progressive": fmt == "JPEG"}),
+            ("webp", f"{stem}-{width}.webp", {"format": "WEBP", "quality": IMAGE_WEBP_QUALITY, "method": 4}),
+        ):
+            if not storage.exists(name):
+                temp = UPLOAD_TMP_DIR / f".variant-{uuid.uuid4().hex}.tmp"
+                try:
+                    resized.save(temp, **save_args)
+                    storage.put_file(name, temp)
+                finally:
+                    temp.unlink(missing_ok=True)
+            variants[kind][str(width)] = storage.url(name)
+        if width <= IMAGE_FEED_WIDTH or variants["src"] is None:
+            variants["src"] = variants["fallback"][str(width)]
+    return variants
+
+
+def _process(post_id: int, image_url: str):
+    try:
+        variants = generate_variants(image_url)
+    except Exception as e:
+        print(f"Error generating variants for {image_url}:", e)
+        return
+
+    db = SessionLocal()
+    try:
+        # Only attach if the post still shows this image; it may have been
+        # edited or deleted while the variants were being generated.
+        # updated_at is left for real edits; variants_at is what cached
+        # cards, ETags and Last-Modified pick the change up from.
+        updated = (
+            db.query(Post)
+            .filter(Post.id == post_id, Post.image_url == image_url, Post.deleted_at.is_(None))
+            .update(
+                {Post.image_variants: variants, Post.variants_at: datetime.now(timezone.utc)},
+                synchronize_session=False,
+            )
+        )
+        db.commit()
+        if updated:
+            bump_content_version()
+        elif not (
+            db.query(Post.id)
+            .filter(Post.image_url.in_(image_urls_for(image_url)), Post.deleted_at.is_(None))
+            .first()
+        ):
+            # The image was dropped while we worked; its cleanup may have
+            # run before these files existed.
+            stem = os.path.splitext(key_from_url(image_url))[0]
+            get_storage().delete_prefix(f"{stem}-")
+    except SQLAlchemyError as e:
+        db.rollback()
+        print("DB Error saving image variants:", e)
+    finally:
+        db.close()
+
+
+def schedule_image_variants(post_id: int, image_url: str):
+    """Generate variants for a post's image in the background."""
+    if Image is None or not image_url:
+        return
+    _executor.submit(_process, post_id, image_url)
+
+
+def shutdown_image_workers():
+    _executor.shutdown(wait=False, cancel_futures=True)
@@ -1,32 +1,61 @@
 from fastapi import HTTPException
 from sqlalchemy.exc import SQLAlchemyError
 from sqlalchemy.orm import Session
-from sqlalchemy import or_
-from app.models.user import User
-from app.utils.hashing import verify_password
+from app.database.connection import run_db
+from app.models.user import User, normalize_username
+from app.utils.hashing import HashingBusyError, verify_password, verify_password_async
 
-def login_user_service(db: Session, identifier: str, password: str):
+def find_login_user(db: Session, identifier: str):
+    """
+    Live user for a login identifier, matched case-insensitively. Usernames
+    cannot contain "@", so an identifier with one is an email and anything
+    else a username; each goes straight to its own unique index.
+    """
+    key = normalize_username(identifier)
+    column = User.email if "@" in key else User.username_key
     try:
-        user = (
+        return (
             db.query(User)
-            .filter(
-                or_(User.username == identifier, User.email == identifier),
-                User.deleted_at.is_(None),       
-            )
+            .filter(column == key, User.deleted_at.is_(None))
             .first()
         )
     except SQLAlchemyError as e:
         print("DB Error during user lookup:", e)
         raise HTTPException(status_code=500, detail="Database error during login")
 
+
+def login_user_service(db: Session, identifier: str, password: str):
+    user = find_login_user(db, identifier)
+
     if not user:
         return None  
 
     try:
         if not verify_password(password, user.password):
             return None  
+    except HashingBusyError:
+        raise HTTPException(status_code=503, detail="Server busy. Please try again.")
+    except Exception as e:
+        print("Password verification error:", e)
+        raise HTTPException(status_code=500, detail="Authentication error")
+
+    return user
+
+
+async def login_user_service_async(db, identifier: str, password: str):
+    """Async variant; the argon2 check runs on the hashing pool, not the loop."""
+    user = await run_db(db, find_login_user, identifier)
+
+    if not user:
+        return None
+
+    try:
+        if not await verify_password_async(password, user.password):
+            return None
+    except HashingBusyError:
+        raise HTTPException(status_code=503, detail="Server busy. Please try again.")
     except Exception as e:
         print("Password verification error:", e)
         raise HTTPException(status_code=500, detail="Authentication error")
 
-    return user
\ No newline at end of file
+    return user
@@ -0,0 +1,112 @@
+from datetime import datetime, timezone
+from threading import Event, Lock, Thread
+import os
+import time
+from dotenv import load_dotenv
+from sqlalchemy.exc import SQLAlchemyError
+from app.database.connection import SessionLocal, engine
+from app.database.locks import release_advisory_lock, try_advisory_lock
+from app.services.email_outbox import purge_email_outbox
+from app.services.otp_service import cleanup_expired_otps
+
+load_dotenv()
+
+OTP_REAPER_INTERVAL = float(os.getenv("OTP_REAPER_INTERVAL", "300"))
+OTP_REAPER_LOCK_NAME = "blog:otp-reaper"
+
+
+class OTPReaper:
+    """
+    Background thread that runs cleanup_expired_otps, and purges old
+    outbox mail with purge_email_outbox, every OTP_REAPER_INTERVAL seconds.
+    Every worker runs one, but each run first takes a database advisory
+    lock, so only one worker reaps at a time. The lock is held on a
+    dedicated connection, and the deletes run on it too.
+    """
+
+    def __init__(self, bind=engine, interval: float = OTP_REAPER_INTERVAL):
+        self.bind = bind
+        self.interval = interval
+        self._stopping = Event()
+        self._thread = None
+        self._metrics_lock = Lock()
+        self._metrics = {
+            "runs": 0,
+            "skipped_not_leader": 0,
+            "errors": 0,
+            "total_reaped": 0,
+            "total_outbox_purged": 0,
+            "last_reaped": None,
+            "last_run_at": None,
+            "last_duration_seconds": None,
+        }
+
+    def start(self):
+        if self._thread and self._thread.is_alive():
+            return
+        self._stopping.clear()
+        self._thread = Thread(target=self._run, name="otp-reaper", daemon=True)
+        self._thread.start()
+
+    def stop(self, timeout: float = 10):
+        self._stopping.set()
+        if self._thread:
+            self._thread.join(timeout)
+
+    def metrics(self) -> dict:
+        with self._metrics_lock:
+            return dict(self._metrics)
+
+    def _record(self, **changes):
+        with self._metrics_lock:
+            for key, value in changes.items():
+                if key in ("runs", "skipped_not_leader", "errors", "total_reaped", "total_outbox_purged"):
+                    self._metrics[key] += value
+                else:
+                    self._metrics[key] = value
+
+    def run_once(self) -> int:
+        """Reap if this worker wins the lock. Returns rows deleted (0 if skipped)."""
+        started = time.perf_counter()
+        try:
+            with self.bind.connect() as connection:
+                if not try_advisory_lock(connection, OTP_REAPER_LOCK_NAME):
+                    connection.rollback()
+                    self._record(skipped_not_leader=1)
+                    return 0
+                connection.commit()
+                try:
+                    db = SessionLocal(bind=connection)
+                    try:
+                        reaped = cleanup_expired_otps(db)
+                        purged = purge_email_outbox(db)
+                    finally:
+                        db.close()
+                finally:
+                    release_advisory_lock(connection, OTP_REAPER_LOCK_NAME)
+                    connection.commit()
+        except SQLAlchemyError as e:
+            print("OTP reaper error:", e)
+            self._record(errors=1)
+            return 0
+
+        self._record(
+            runs=1,
+            total_reaped=reaped,
+            total_outbox_purged=purged,
+            last_reaped=reaped,
+            last_run_at=datetime.now(timezone.utc).isoformat(),
+            last_duration_seconds=round(time.perf_counter() - started, 4),
+        )
+        if reaped:
+            print(f"OTP reaper deleted {reaped} rows")
+        if purged:
+            print(f"OTP reaper purged {purged} outbox messages")
+        return reaped
+
+    def _run(self):
+        while not self._stopping.wait(self.interval):
+            self.run_once()
+
+
+otp_reaper = OTPReaper()
@@ -1,15 +1,31 @@
-from datetime import datetime, timezone
+from datetime import datetime, timedelta, timezone
+import os
+from dotenv import load_dotenv
 from fastapi import HTTPException
+from sqlalchemy import or_
 from sqlalchemy.exc import SQLAlchemyError
 from sqlalchemy.orm import Session
+from app.database.connection import run_db
 from app.models.otp import OTP
-from app.utils.email import generate_otp, otp_expiry, EmailService
+from app.services.email_outbox import email_worker, enqueue_email
+from app.utils.email import generate_otp, otp_expiry, verification_email
+
+load_dotenv()
+
+# A verified OTP lets its email register for this long after it was issued.
+EMAIL_VERIFICATION_WINDOW_MINUTES = 30
+OTP_CLEANUP_BATCH_SIZE = int(os.getenv("OTP_CLEANUP_BATCH_SIZE", "1000"))
+OTP_CLEANUP_MAX_BATCHES = int(os.getenv("OTP_CLEANUP_MAX_BATCHES", "50"))
 
 
 def create_and_send_otp(db: Session, email: str) -> bool:
+    """
+    Replace the email's OTP and queue the verification email, both in one
+    transaction. Delivery happens on the email outbox worker, so this never
+    waits on SMTP.
+    """
     try:
         db.query(OTP).filter(OTP.email == email).delete()
-        db.commit()
 
         otp_code = generate_otp(6)
         expires_at = otp_expiry(5)
@@ -20,16 +36,12 @@ def create_and_send_otp(db: Session, email: str) -> bool:
             is_verified=False
         )
         db.add(new_otp)
-        db.commit()
-
-        email_service = EmailService()
-        email_sent = email_service.send_verification_email(email, otp_code)
 
-        if not email_sent:
-            db.delete(new_otp)
-            db.commit()
-            return False
+        subject, body = verification_email(otp_code)
+        enqueue_email(db, email, subject, body)
+        db.commit()
 
+        email_worker.notify()
         return True
 
     except SQLAlchemyError as e:
@@ -43,6 +55,10 @@ def create_and_send_otp(db: Session, email: str) -> bool:
         return False
 
 
+async def create_and_send_otp_async(db, email: str) -> bool:
+    return await run_db(db, create_and_send_otp, email)
+
+
 def verify_otp(db: Session, email: str, otp_code: str) -> bool:
     try:
         otp_record = (
@@ -112,7 +128,7 @@ def is_email_verified(db: Session, email: str) -> bool:
         
         time_diff = (now - created_at).total_seconds() / 60
 
-        return time_diff <= 30
+        return time_diff <= EMAIL_VERIFICATION_WINDOW_MINUTES
 
     except Exception as e:
         print("Error checking email verification:", e)
@@ -121,27 +137,47 @@ def is_email_verified(db: Session, email: str) -> bool:
         return False
 
 
-def cleanup_expired_otps(db: Session):
+def cleanup_expired_otps(
+    db: Session, batch_size: int = OTP_CLEANUP_BATCH_SIZE, max_batches: int = OTP_CLEANUP_MAX_BATCHES
+) -> int:
     """
-    Delete expired OTP records (cleanup job).
+    Delete expired unverified OTPs, and verified ones older than the
+    verification window, in batches of `batch_size` ids taken from the
+    expires_at index. Each batch commits on its own so locks stay short.
+    Stops after `max_batches`; the next run picks up the rest. Returns the
+    number of rows deleted.
     """
+    now = datetime.now(timezone.utc)
+    verified_cutoff = now - timedelta(minutes=EMAIL_VERIFICATION_WINDOW_MINUTES)
+    reaped = 0
     try:
-        now = datetime.now(timezone.utc)
-        expired_otps = db.query(OTP).all()
-        
-        for otp in expired_otps:
-            expires_at = otp.expires_at
-            if expires_at.tzinfo is None:
-                expires_at = expires_at.replace(tzinfo=timezone.utc)
-            
-            if expires_at < now:
-                db.delete(otp)
-        
-        db.commit()
-        print("Cleaned up expired OTPs")
-        
-    except Exception as e:
+        for _ in range(max_batches):
+            ids = [
+                otp_id
+                for (otp_id,) in db.query(OTP.id)
+                .filter(
+                    OTP.expires_at < now,
+                    or_(OTP.is_verified == False, OTP.created_at < verified_cutoff),
+                )
+                .order_by(OTP.expires_at)
+                .limit(batch_size)
+            ]
+            if not ids:
+                break
+            db.query(OTP).filter(OTP.id.in_(ids)).delete(synchronize_session=False)
+            db.commit()
+            reaped += len(ids)
+            if len(ids) < batch_size:
+                break
+    except SQLAlchemyError as e:
         db.rollback()
-        print("Error cleaning up OTPs:", e)
-        import traceback
-        traceback.print_exc()
\ No newline at end of file
+        print("DB Error cleaning up OTPs:", e)
+    return reaped
+
+
+async def verify_otp_async(db, email: str, otp_code: str) -> bool:
+    return await run_db(db, verify_otp, email, otp_code)
+
+
+async def is_email_verified_async(db, email: str) -> bool:
+    return await run_db(db, is_email_verified, email)
@@ -1,11 +1,99 @@
 from datetime import datetime, timezone
-from fastapi import HTTPException
+from fastapi import BackgroundTasks, HTTPException
+from collections import Counter
+from sqlalchemy import and_, bindparam, func, insert, or_, select, update
 from sqlalchemy.exc import SQLAlchemyError
-from sqlalchemy.orm import Session
+from sqlalchemy.orm import Session, joinedload
+from sqlalchemy.orm.attributes import set_committed_value
+from app.database.connection import SessionLocal, run_db
 from app.models.post import Post
 from app.models.comments import Comment
+from app.models.user import User
 from app.schemas.post import PostCreate, PostUpdate
 from app.schemas.comment import CommentCreate
+from app.utils.pagination import encode_cursor, decode_cursor
+from app.utils.render_cache import bump_content_version
+from app.utils.search_index import post_index
+from app.utils.storage import get_storage, image_urls_for, key_from_url
+from app.helper.imagefile import delete_file_if_exists
+from app.services.image_service import schedule_image_variants
+
+FEED_PAGE_SIZE = 20
+MAX_FEED_PAGE_SIZE = 50
+FEED_COMMENTS_PER_POST = 3
+COMMENTS_PAGE_SIZE = 20
+MAX_COMMENTS_PAGE_SIZE = 100
+
+
+def _with_post_graph(query):
+    """
+    Eager-load the authors Post.to_dict() touches so rendering N posts does
+    not cost N lazy author loads. Comments are attached separately by
+    _attach_recent_comments.
+    """
+    return query.options(joinedload(Post.author))
+
+
+def _attach_recent_comments(db: Session, posts, limit: int = FEED_COMMENTS_PER_POST):
+    """
+    Load the newest `limit` live comments of every post in one round trip
+    (ROW_NUMBER() partitioned by post) and set them as each post's loaded
+    `comments` collection, oldest first. The full count stays available in
+    Post.comment_count; the rest is served by get_comments_for_post.
+    """
+    if not posts:
+        return posts
+
+    ranked = (
+        select(
+            Comment.id,
+            func.row_number()
+            .over(
+                partition_by=Comment.post_id,
+                order_by=(Comment.created_at.desc(), Comment.id.desc()),
+            )
+            .label("rn"),
+        )
+        .where(
+            Comment.post_id.in_([post.id for post in posts]),
+            Comment.deleted_at.is_(None),
+        )
+        .subquery()
+    )
+    comments = (
+        db.query(Comment)
+        .options(joinedload(Comment.user))
+        .join(ranked, ranked.c.id == Comment.id)
+        .filter(ranked.c.rn <= limit)
+        .order_by(Comment.created_at.asc(), Comment.id.asc())
+        .all()
+    )
+
+    by_post = {post.id: [] for post in posts}
+    for comment in comments:
+        by_post[comment.post_id].append(comment)
+    for post in posts:
+        set_committed_value(post, "comments", by_post[post.id])
+    return posts
+
+
+def refresh_comment_counts(db: Session, post_ids):
+    """
+    Recompute Post.comment_count from the live comments of the given posts.
+    Does not commit; callers run it inside their own transaction.
+    """
+    post_ids = list(post_ids)
+    if not post_ids:
+        return
+    live_count = (
+        select(func.count(Comment.id))
+        .where(Comment.post_id == Post.id, Comment.deleted_at.is_(None))
+        .scalar_subquery()
+    )
+    db.query(Post).filter(Post.id.in_(post_ids)).update(
+        {Post.comment_count: live_count}, synchronize_session=False
+    )
+
 
 def create_post(db: Session, post: PostCreate, user_id: int):
     try:
@@ -18,6 +106,9 @@ def create_post(db: Session, post: PostCreate, user_id: int):
         db.add(new_post)
         db.commit()
         db.refresh(new_post)
+        post_index.add(new_post.id, new_post.title, new_post.content)
+        bump_content_version()
+        schedule_image_variants(new_post.id, new_post.image_url)
         return new_post
 
     except SQLAlchemyError as e:
@@ -33,12 +124,267 @@ def create_post(db: Session, post: PostCreate, user_id: int):
 
 def get_all_posts(db: Session):
     try:
-        return (
-            db.query(Post)
+        posts = (
+            _with_post_graph(db.query(Post))
             .filter(Post.deleted_at.is_(None))
             .order_by(Post.created_at.desc())
             .all()
         )
+        return _attach_recent_comments(db, posts)
+    except SQLAlchemyError as e:
+        print("DB Error fetching posts:", e)
+        raise HTTPException(status_code=500, detail="Failed to fetch posts")
+
+
+def _parse_feed_cursor(cursor: str):
+    after = decode_cursor(cursor) if cursor else None
+    if cursor and (not after or not isinstance(after.get("id"), int)):
+        raise HTTPException(status_code=400, detail="Invalid cursor")
+    return after
+
+
+def _feed_query(query, after):
+    """Restrict `query` to live posts after the keyset position `after`."""
+    query = query.filter(Post.deleted_at.is_(None))
+    if after:
+        anchor = (
+            select(Post.created_at)
+            .where(Post.id == after["id"])
+            .scalar_subquery()
+        )
+        query = query.filter(
+            or_(
+                Post.created_at < anchor,
+                and_(Post.created_at == anchor, Post.id < after["id"]),
+            )
+        )
+    return query.order_by(Post.created_at.desc(), Post.id.desc())
+
+
+def get_feed_page(db: Session, cursor: str = None, limit: int = FEED_PAGE_SIZE):
+    """
+    Return one page of live posts (newest first) and the cursor for the next
+    page, or None when there are no more posts.
+
+    Keyset pagination on (created_at, id): the cursor names the last post of
+    the previous page and the next page starts strictly after it, so every
+    page is a range scan on ix_posts_feed regardless of how deep it is.
+    """
+    limit = max(1, min(limit, MAX_FEED_PAGE_SIZE))
+    after = _parse_feed_cursor(cursor)
+
+    try:
+        posts = (
+            _feed_query(_with_post_graph(db.query(Post)), after)
+            .limit(limit + 1)
+            .all()
+        )
+        next_cursor = None
+        if len(posts) > limit:
+            posts = posts[:limit]
+            next_cursor = encode_cursor({"id": posts[-1].id})
+
+        _attach_recent_comments(db, posts)
+    except SQLAlchemyError as e:
+        print("DB Error fetching feed page:", e)
+        raise HTTPException(status_code=500, detail="Failed to fetch posts")
+
+    return posts, next_cursor
+
+
+class FeedStream:
+    """
+    One feed page for streamed rendering, loaded when iteration starts (after
+    the page head has been flushed). It uses its own session, because
+    request-scoped sessions are closed before a streamed body is sent. The
+    whole page, capped at MAX_FEED_PAGE_SIZE, is read with its recent
+    comments and the connection is returned to the pool before the first
+    post is yielded, so a slow client never holds a DB connection while the
+    rest of the page is written to it. `next_cursor` is set once iteration
+    has started.
+    """
+
+    def __init__(self, cursor: str = None, limit: int = FEED_PAGE_SIZE, session_factory=SessionLocal):
+        self.cursor = cursor
+        self.limit = limit
+        self.session_factory = session_factory
+        self.next_cursor = None
+
+    def __iter__(self):
+        db = self.session_factory()
+        try:
+            posts, self.next_cursor = get_feed_page(db, self.cursor, self.limit)
+        finally:
+            db.close()
+        yield from posts
+
+
+# Columns the JSON API lists; `content` is only added when asked for, so
+# list views never read post bodies they do not show.
+_SUMMARY_COLUMNS = (
+    Post.id,
+    Post.title,
+    Post.image_url,
+    Post.comment_count,
+    Post.created_at,
+    Post.updated_at,
+    User.id.label("author_id"),
+    User.username.label("author_username"),
+)
+
+
+def _summary_from_row(row) -> dict:
+    data = row._asdict()
+    data["author"] = {"id": data.pop("author_id"), "username": data.pop("author_username")}
+    return data
+
+
+def get_post_summaries(
+    db: Session,
+    cursor: str = None,
+    limit: int = FEED_PAGE_SIZE,
+    include_content: bool = False,
+    user_id: int = None,
+):
+    """
+    Column-projected feed page for the JSON API: plain dicts straight from
+    the result rows, with no ORM objects built. Same keyset cursor as
+    get_feed_page; `user_id` restricts it to one author's posts.
+    """
+    limit = max(1, min(limit, MAX_FEED_PAGE_SIZE))
+    after = _parse_feed_cursor(cursor)
+    columns = _SUMMARY_COLUMNS + ((Post.content,) if include_content else ())
+
+    try:
+        query = db.query(*columns).join(User, User.id == Post.user_id)
+        if user_id is not None:
+            query = query.filter(Post.user_id == user_id)
+        rows = _feed_query(query, after).limit(limit + 1).all()
+    except SQLAlchemyError as e:
+        print("DB Error fetching post summaries:", e)
+        raise HTTPException(status_code=500, detail="Failed to fetch posts")
+
+    next_cursor = None
+    if len(rows) > limit:
+        rows = rows[:limit]
+        next_cursor = encode_cursor({"id": rows[-1].id})
+    return [_summary_from_row(row) for row in rows], next_cursor
+
+
+def get_post_detail(db: Session, post_id: int):
+    """One live post as a plain dict (with content) for the JSON API, or None."""
+    try:
+        row = (
+            db.query(*_SUMMARY_COLUMNS, Post.content)
+            .join(User, User.id == Post.user_id)
+            .filter(Post.id == post_id, Post.deleted_at.is_(None))
+            .first()
+        )
+    except SQLAlchemyError as e:
+        print("DB Error fetching post:", e)
+        raise HTTPException(status_code=500, detail="Failed to fetch post")
+    return _summary_from_row(row) if row else None
+
+
+def _content_fingerprint(db: Session, post_ids):
+    """
+    Aggregate change markers for the given posts and their comments, from
+    index-friendly MAX/COUNT queries rather than loading the rows.
+    Returns (fingerprint tuple, latest timestamp or None).
+    """
+    if not post_ids:
+        return (), None
+
+    # variants_at moves when background-generated variants land, which
+    # does not touch updated_at.
+    post_marks = (
+        db.query(
+            func.max(Post.created_at),
+            func.max(Post.updated_at),
+            func.sum(Post.comment_count),
+            func.max(Post.variants_at),
+        )
+        .filter(Post.id.in_(post_ids))
+        .one()
+    )
+    comment_marks = (
+        db.query(func.count(Comment.id), func.max(Comment.created_at), func.max(Comment.deleted_at))
+        .filter(Comment.post_id.in_(post_ids))
+        .one()
+    )
+    timestamps = [
+        t for t in (post_marks[0], post_marks[1], post_marks[3], comment_marks[1], comment_marks[2]) if t
+    ]
+    return tuple(post_marks) + tuple(comment_marks), max(timestamps) if timestamps else None
+
+
+def _with_last_deletion(db: Session, marks, last_modified, *criteria):
+    """
+    Fold the latest post deletion matching `criteria` into the validators.
+    A deleted post leaves the page without touching the posts still on it,
+    so without this Last-Modified could stay put or even move backwards.
+    MAX(deleted_at) is answered from the feed indexes, which lead with it.
+    """
+    last_deleted = db.query(func.max(Post.deleted_at)).filter(*criteria).scalar()
+    if last_deleted:
+        last_modified = max(last_deleted, last_modified) if last_modified else last_deleted
+    return marks + (last_deleted,), last_modified
+
+
+def get_feed_validator(db: Session, cursor: str = None, limit: int = FEED_PAGE_SIZE):
+    """
+    Cheap stand-in for rendering a feed page, for HTTP validators: the ids
+    on the page (plus whether a next page exists) and the aggregate change
+    markers of those posts and their comments.
+    Returns (fingerprint tuple, last-modified datetime or None).
+    """
+    limit = max(1, min(limit, MAX_FEED_PAGE_SIZE))
+    after = _parse_feed_cursor(cursor)
+
+    try:
+        ids = [post_id for (post_id,) in _feed_query(db.query(Post.id), after).limit(limit + 1)]
+        marks, last_modified = _content_fingerprint(db, ids[:limit])
+        marks, last_modified = _with_last_deletion(db, marks, last_modified)
+    except SQLAlchemyError as e:
+        print("DB Error computing feed validator:", e)
+        raise HTTPException(status_code=500, detail="Failed to fetch posts")
+
+    return (tuple(ids),) + marks, last_modified
+
+
+def get_user_posts_validator(db: Session, user_id: int):
+    """Like get_feed_validator, for the posts get_user_posts returns."""
+    try:
+        ids = [
+            post_id
+            for (post_id,) in db.query(Post.id)
+            .filter(Post.user_id == user_id, Post.deleted_at.is_(None))
+        ]
+        marks, last_modified = _content_fingerprint(db, ids)
+        marks, last_modified = _with_last_deletion(
+            db, marks, last_modified, Post.user_id == user_id
+        )
+    except SQLAlchemyError as e:
+        print("DB Error computing profile validator:", e)
+        raise HTTPException(status_code=500, detail="Failed to fetch user posts")
+
+    return (tuple(sorted(ids)),) + marks, last_modified
+
+
+def get_posts_by_ids(db: Session, post_ids):
+    """Load live posts (with the feed's eager graph) in the order given."""
+    post_ids = list(post_ids)
+    if not post_ids:
+        return []
+    try:
+        by_id = {
+            post.id: post
+            for post in _with_post_graph(db.query(Post))
+            .filter(Post.id.in_(post_ids), Post.deleted_at.is_(None))
+            .all()
+        }
+        posts = [by_id[post_id] for post_id in post_ids if post_id in by_id]
+        return _attach_recent_comments(db, posts)
     except SQLAlchemyError as e:
         print("DB Error fetching posts:", e)
         raise HTTPException(status_code=500, detail="Failed to fetch posts")
@@ -48,6 +394,7 @@ def get_post_by_id(db: Session, post_id: int):
     try:
         return (
             db.query(Post)
+            .options(joinedload(Post.author))
             .filter(Post.id == post_id, Post.deleted_at.is_(None))
             .first()
         )
@@ -71,12 +418,19 @@ def update_post(db: Session, post_id: int, post_data: PostUpdate):
 
         if "content" in update_data:
             post.content = update_data["content"]
-        if "image_url" in update_data:
-            post.image_url = update_data["image_url"]  
+        image_changed = "image_url" in update_data and update_data["image_url"] != post.image_url
+        if image_changed:
+            post.image_url = update_data["image_url"]
+            post.image_variants = None
+            post.variants_at = None
         post.updated_at = datetime.now(timezone.utc)
 
         db.commit()
         db.refresh(post)
+        post_index.add(post.id, post.title, post.content)
+        bump_content_version()
+        if image_changed:
+            schedule_image_variants(post.id, post.image_url)
         return post
     except SQLAlchemyError as e:
         db.rollback()
@@ -89,28 +443,52 @@ def update_post(db: Session, post_id: int, post_data: PostUpdate):
         raise HTTPException(status_code=500, detail="Failed to update post")
 
 
-def delete_post(db: Session, post_id: int):
+def delete_post(db: Session, post_id: int, user_id: int = None, background_tasks: BackgroundTasks = None):
+    """
+    Soft-delete a post and all its live comments in one transaction of
+    set-based UPDATEs; the comments are never loaded. With `user_id`, only
+    that user's post may be deleted (403 otherwise). If no other live post
+    uses the post's image, the file is removed after the commit, through
+    `background_tasks` when given. Returns False if there is no such post.
+    """
     try:
-        post = db.query(Post).filter(
-            Post.id == post_id, Post.deleted_at.is_(None)
-        ).first()
+        # Lock the row so the image cannot change under the orphan check.
+        post = (
+            db.query(Post.user_id, Post.image_url)
+            .filter(Post.id == post_id, Post.deleted_at.is_(None))
+            .with_for_update()
+            .first()
+        )
 
         if not post:
             return False
+        if user_id is not None and post.user_id != user_id:
+            db.rollback()
+            raise HTTPException(status_code=403, detail="Not authorized")
 
         now = datetime.now(timezone.utc)
-        post.deleted_at = now
-        post.status = False
-        comments = db.query(Comment).filter(
+        db.query(Comment).filter(
             Comment.post_id == post_id, Comment.deleted_at.is_(None)
-        ).all()
-
-        for c in comments:
-            c.deleted_at = now
+        ).update({Comment.deleted_at: now}, synchronize_session=False)
+        db.query(Post).filter(Post.id == post_id).update(
+            {Post.deleted_at: now, Post.status: False, Post.comment_count: 0},
+            synchronize_session=False,
+        )
+        orphaned_image = post.image_url if post.image_url and not is_image_shared(db, post.image_url, post_id) else None
 
         db.commit()
+        post_index.remove(post_id)
+        bump_content_version()
+        if orphaned_image:
+            if background_tasks is not None:
+                background_tasks.add_task(delete_file_if_exists, orphaned_image)
+            else:
+                delete_file_if_exists(orphaned_image)
         return True
 
+    except HTTPException:
+        raise
+
     except SQLAlchemyError as e:
         db.rollback()
         print("DB Error deleting post:", e)
@@ -122,8 +500,139 @@ def delete_post(db: Session, post_id: int):
         raise HTTPException(status_code=500, detail="Failed to delete post")
 
 
+def _insert_many(db: Session, model, rows):
+    """
+    Insert `rows` (dicts) in one executemany and return their new ids, in
+    order. Backends without executemany RETURNING (MySQL) fall back to an
+    ORM flush, which still runs inside the caller's single transaction.
+    """
+    if not rows:
+        return []
+    if db.get_bind().dialect.insert_executemany_returning:
+        return list(db.scalars(insert(model).returning(model.id, sort_by_parameter_order=True), rows))
+    objects = [model(**row) for row in rows]
+    db.add_all(objects)
+    db.flush()
+    return [obj.id for obj in objects]
+
+
+def _is_uploaded_image(image_url: str) -> bool:
+    """
+    True if `image_url` is exactly the storage URL of an existing upload.
+    Clients may only reference files that were uploaded; any other URL
+    would later have its last segment treated as a storage key on delete.
+    """
+    storage = get_storage()
+    key = key_from_url(image_url)
+    try:
+        return bool(key) and storage.url(key) == image_url and storage.exists(key)
+    except Exception as e:
+        print(f"Error checking upload {image_url}:", e)
+        return False
+
+
+def create_posts_bulk(db: Session, posts, user_id: int):
+    """
+    Create many posts in one transaction. Items that fail validation are
+    skipped and reported as {"index", "detail"}; the rest are inserted
+    together. Returns (ids in input order for the inserted items, errors).
+    """
+    rows, errors = [], []
+    uploaded = {}
+    for index, post in enumerate(posts):
+        title = (post.title or "").strip()
+        if post.image_url and post.image_url not in uploaded:
+            uploaded[post.image_url] = _is_uploaded_image(post.image_url)
+        if not title:
+            errors.append({"index": index, "detail": "Title is required"})
+        elif len(title) > 255:
+            errors.append({"index": index, "detail": "Title must not exceed 255 characters"})
+        elif not (post.content or "").strip():
+            errors.append({"index": index, "detail": "Content is required"})
+        elif post.image_url and not uploaded[post.image_url]:
+            errors.append({"index": index, "detail": "image_url must be the URL of an uploaded image"})
+        else:
+            rows.append({"title": title, "content": post.content, "image_url": post.image_url, "user_id": user_id})
+
+    try:
+        ids = _insert_many(db, Post, rows)
+        db.commit()
+    except SQLAlchemyError as e:
+        db.rollback()
+        print("DB Error creating posts in bulk:", e)
+        raise HTTPException(status_code=500, detail="Failed to create posts")
+
+    for post_id, row in zip(ids, rows):
+        post_index.add(post_id, row["title"], row["content"])
+        schedule_image_variants(post_id, row["image_url"])
+    if ids:
+        bump_content_version()
+    return ids, errors
+
+
+def add_comments_bulk(db: Session, comments, user_id: int):
+    """
+    Add many comments, possibly across posts, in one transaction. Comments
+    on missing or deleted posts, or with no text, are reported as errors.
+    comment_count is bumped once per post. Returns (ids, errors).
+    """
+    try:
+        # Lock the target posts, as delete_post does, so none can be deleted
+        # between this check and the commit and end up with live comments.
+        # Id order keeps concurrent batches from deadlocking on each other.
+        live_posts = {
+            post_id
+            for (post_id,) in db.query(Post.id)
+            .filter(
+                Post.id.in_({comment.post_id for comment in comments}),
+                Post.deleted_at.is_(None),
+            )
+            .order_by(Post.id)
+            .with_for_update()
+        }
+
+        rows, errors = [], []
+        for index, comment in enumerate(comments):
+            if comment.post_id not in live_posts:
+                errors.append({"index": index, "detail": "Post not found"})
+            elif not (comment.comment_text or "").strip():
+                errors.append({"index": index, "detail": "Comment text is required"})
+            else:
+                rows.append({"post_id": comment.post_id, "user_id": user_id, "comment_text": comment.comment_text})
+
+        ids = _insert_many(db, Comment, rows)
+        added = Counter(row["post_id"] for row in rows)
+        if added:
+            posts_table = Post.__table__
+            db.execute(
+                update(posts_table)
+                .where(posts_table.c.id == bindparam("b_id"))
+                .values(comment_count=posts_table.c.comment_count + bindparam("b_added")),
+                [{"b_id": post_id, "b_added": count} for post_id, count in added.items()],
+            )
+        db.commit()
+    except SQLAlchemyError as e:
+        db.rollback()
+        print("DB Error adding comments in bulk:", e)
+        raise HTTPException(status_code=500, detail="Failed to add comments")
+
+    if ids:
+        bump_content_version()
+    return ids, errors
+
+
 def add_comment_to_post(db: Session, comment: CommentCreate, user_id: int):
     try:
+        bumped = db.query(Post).filter(
+            Post.id == comment.post_id, Post.deleted_at.is_(None)
+        ).update(
+            {Post.comment_count: Post.comment_count + 1},
+            synchronize_session=False,
+        )
+        if not bumped:
+            db.rollback()
+            raise HTTPException(status_code=404, detail="Post not found")
+
         new_comment = Comment(
             post_id=comment.post_id,
             user_id=user_id,
@@ -132,8 +641,12 @@ def add_comment_to_post(db: Session, comment: CommentCreate, user_id: int):
         db.add(new_comment)
         db.commit()
         db.refresh(new_comment)
+        bump_content_version()
         return new_comment
 
+    except HTTPException:
+        raise
+
     except SQLAlchemyError as e:
         db.rollback()
         print("DB Error adding comment:", e)
@@ -156,7 +669,14 @@ def delete_comment(db: Session, comment_id: int):
 
         comment.deleted_at = datetime.now(timezone.utc)
         comment.status = False
+        db.query(Post).filter(
+            Post.id == comment.post_id, Post.comment_count > 0
+        ).update(
+            {Post.comment_count: Post.comment_count - 1},
+            synchronize_session=False,
+        )
         db.commit()
+        bump_content_version()
         return True
 
     except SQLAlchemyError as e:
@@ -170,6 +690,28 @@ def delete_comment(db: Session, comment_id: int):
         raise HTTPException(status_code=500, detail="Failed to delete comment")
 
 
+def is_image_shared(db: Session, image_url: str, exclude_post_id: int) -> bool:
+    """
+    Uploads are content-addressed, so several posts can point at the same
+    file. True if a live post other than `exclude_post_id` still uses the
+    stored file behind `image_url`.
+    """
+    try:
+        return (
+            db.query(Post.id)
+            .filter(
+                Post.image_url.in_(image_urls_for(image_url)),
+                Post.id != exclude_post_id,
+                Post.deleted_at.is_(None),
+            )
+            .first()
+            is not None
+        )
+    except SQLAlchemyError as e:
+        print("DB Error checking image usage:", e)
+        return True  # keep the file when in doubt
+
+
 def get_user_posts(db: Session, user_id: int):
     try:
         return (
@@ -183,14 +725,132 @@ def get_user_posts(db: Session, user_id: int):
         raise HTTPException(status_code=500, detail="Failed to fetch user posts")
 
 
-def get_comments_for_post(db: Session, post_id: int):
+def get_comments_for_post(
+    db: Session, post_id: int, cursor: str = None, limit: int = COMMENTS_PAGE_SIZE
+):
+    """
+    Return one page of a post's live comments (oldest first) and the cursor
+    for the next page, or None when there are no more comments. Uses the
+    same (created_at, id) keyset scheme as get_feed_page.
+    """
+    limit = max(1, min(limit, MAX_COMMENTS_PAGE_SIZE))
+
+    after = decode_cursor(cursor) if cursor else None
+    if cursor and (not after or not isinstance(after.get("id"), int)):
+        raise HTTPException(status_code=400, detail="Invalid cursor")
+
     try:
-        return (
+        query = (
             db.query(Comment)
+            .options(joinedload(Comment.user))
             .filter(Comment.post_id == post_id, Comment.deleted_at.is_(None))
-            .order_by(Comment.created_at.asc())
+        )
+
+        if after:
+            anchor = (
+                select(Comment.created_at)
+                .where(Comment.id == after["id"])
+                .scalar_subquery()
+            )
+            query = query.filter(
+                or_(
+                    Comment.created_at > anchor,
+                    and_(Comment.created_at == anchor, Comment.id > after["id"]),
+                )
+            )
+
+        comments = (
+            query.order_by(Comment.created_at.asc(), Comment.id.asc())
+            .limit(limit + 1)
             .all()
         )
     except SQLAlchemyError as e:
         print("DB Error fetching comments:", e)
-        raise HTTPException(status_code=500, detail="Failed to fetch comments")
\ No newline at end of file
+        raise HTTPException(status_code=500, detail="Failed to fetch comments")
+
+    next_cursor = None
+    if len(comments) > limit:
+        comments = comments[:limit]
+        next_cursor = encode_cursor({"id": comments[-1].id})
+
+    return comments, next_cursor
+
+
+# ---------------- ASYNC VARIANTS ----------------
+# Same behaviour as the functions above; `db` may be an AsyncSession or a
+# Session (see run_db).
+
+async def create_post_async(db, post: PostCreate, user_id: int):
+    return await run_db(db, create_post, post, user_id)
+
+
+async def get_feed_page_async(db, cursor: str = None, limit: int = FEED_PAGE_SIZE):
+    return await run_db(db, get_feed_page, cursor, limit)
+
+
+async def get_feed_validator_async(db, cursor: str = None, limit: int = FEED_PAGE_SIZE):
+    return await run_db(db, get_feed_validator, cursor, limit)
+
+
+async def get_user_posts_validator_async(db, user_id: int):
+    return await run_db(db, get_user_posts_validator, user_id)
+
+
+async def get_posts_by_ids_async(db, post_ids):
+    return await run_db(db, get_posts_by_ids, post_ids)
+
+
+async def get_post_summaries_async(
+    db,
+    cursor: str = None,
+    limit: int = FEED_PAGE_SIZE,
+    include_content: bool = False,
+    user_id: int = None,
+):
+    return await run_db(db, get_post_summaries, cursor, limit, include_content, user_id)
+
+
+async def get_post_detail_async(db, post_id: int):
+    return await run_db(db, get_post_detail, post_id)
+
+
+async def get_post_by_id_async(db, post_id: int):
+    return await run_db(db, get_post_by_id, post_id)
+
+
+async def update_post_async(db, post_id: int, post_data: PostUpdate):
+    return await run_db(db, update_post, post_id, post_data)
+
+
+async def is_image_shared_async(db, image_url: str, exclude_post_id: int) -> bool:
+    return await run_db(db, is_image_shared, image_url, exclude_post_id)
+
+
+async def delete_post_async(db, post_id: int, user_id: int = None, background_tasks: BackgroundTasks = None):
+    return await run_db(db, delete_post, post_id, user_id, background_tasks)
+
+
+async def add_comment_to_post_async(db, comment: CommentCreate, user_id: int):
+    return await run_db(db, add_comment_to_post, comment, user_id)
+
+
+async def create_posts_bulk_async(db, posts, user_id: int):
+    return await run_db(db, create_posts_bulk, posts, user_id)
+
+
+async def add_comments_bulk_async(db, comments, user_id: int):
+    return await run_db(db, add_comments_bulk, comments, user_id)
+
+
+async def delete_comment_async(db, comment_id: int):
+    return await run_db(db, delete_comment, comment_id)
+
+
+async def get_user_posts_async(db, user_id: int):
+    return await run_db(db, get_user_posts, user_id)
+
+
+async def get_comments_for_post_async(
+    db, post_id: int, cursor: str = None, limit: int = COMMENTS_PAGE_SIZE
+):
+    return await run_db(db, get_comments_for_post, post_id, cursor, limit)
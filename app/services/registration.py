@@ -1,13 +1,14 @@
 from fastapi import HTTPException
 from sqlalchemy.exc import SQLAlchemyError
 from sqlalchemy.orm import Session
-from app.models.user import User
+from app.database.connection import run_db
+from app.models.user import User, normalize_username
 from app.schemas.registration import RegisterSchema
-from app.utils.hashing import hash_password
+from app.utils.hashing import HashingBusyError, hash_password, hash_password_async
 
-def register_user_service(db: Session, user_data: RegisterSchema):
+def register_user_service(db: Session, user_data: RegisterSchema, hashed_password: str = None):
     try:
-        existing_username = db.query(User).filter(User.username == user_data.username).first()
+        existing_username = db.query(User).filter(User.username_key == normalize_username(user_data.username)).first()
         if existing_username:
             raise HTTPException(status_code=400, detail="Username already registered")
         existing_email = db.query(User).filter(User.email == user_data.email).first()
@@ -16,7 +17,7 @@ def register_user_service(db: Session, user_data: RegisterSchema):
         new_user = User(
             username=user_data.username,
             email=user_data.email,
-            password=hash_password(user_data.password),
+            password=hashed_password or hash_password(user_data.password),
             status=True,
         )
 
@@ -28,6 +29,9 @@ def register_user_service(db: Session, user_data: RegisterSchema):
     except HTTPException:
         raise
 
+    except HashingBusyError:
+        raise HTTPException(status_code=503, detail="Server busy. Please try again.")
+
     except SQLAlchemyError as e:
         db.rollback()
         print("DB Error during registration:", e)
@@ -36,4 +40,13 @@ def register_user_service(db: Session, user_data: RegisterSchema):
     except Exception as e:
         db.rollback()
         print("Unexpected error during registration:", e)
-        raise HTTPException(status_code=500, detail="Registration failed. Please try again.")
\ No newline at end of file
+        raise HTTPException(status_code=500, detail="Registration failed. Please try again.")
+
+
+async def register_user_service_async(db, user_data: RegisterSchema):
+    """Async variant; hashes on the hashing pool before touching the DB."""
+    try:
+        hashed_password = await hash_password_async(user_data.password)
+    except HashingBusyError:
+        raise HTTPException(status_code=503, detail="Server busy. Please try again.")
+    return await run_db(db, register_user_service, user_data, hashed_password)
@@ -0,0 +1,72 @@
+from fastapi import HTTPException
+from sqlalchemy.dialects.mysql import match
+from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy.orm import Session
+from app.database.connection import run_db
+from app.models.post import Post
+from app.services.post_service import get_posts_by_ids
+from app.utils.search_index import post_index
+
+SEARCH_PAGE_SIZE = 20
+MAX_SEARCH_PAGE = 50
+MAX_QUERY_LENGTH = 200
+
+
+def _uses_fulltext(db: Session) -> bool:
+    return db.get_bind().dialect.name == "mysql"
+
+
+def _ranked_ids_fulltext(db: Session, query: str, limit: int, offset: int):
+    score = match(Post.title, Post.content, against=query).in_natural_language_mode()
+    rows = (
+        db.query(Post.id)
+        .filter(Post.deleted_at.is_(None), score > 0)
+        .order_by(score.desc(), Post.id.desc())
+        .offset(offset)
+        .limit(limit)
+        .all()
+    )
+    return [post_id for (post_id,) in rows]
+
+
+def _ranked_ids_fallback(db: Session, query: str, limit: int, offset: int):
+    if not post_index.built:
+        post_index.build(
+            db.query(Post.id, Post.title, Post.content)
+            .filter(Post.deleted_at.is_(None))
+            .yield_per(1000)
+        )
+    return post_index.search(query, limit, offset)
+
+
+def search_posts(db: Session, query: str, page: int = 1, limit: int = SEARCH_PAGE_SIZE):
+    """
+    Rank live posts by relevance of `query` to their title and content.
+    Returns (posts, has_more). Uses the MySQL FULLTEXT index when available
+    and the in-process inverted index otherwise. Pages past MAX_SEARCH_PAGE
+    are refused to keep every search bounded.
+    """
+    query = (query or "").strip()[:MAX_QUERY_LENGTH]
+    if not query:
+        return [], False
+    if page < 1 or page > MAX_SEARCH_PAGE:
+        raise HTTPException(status_code=400, detail="Invalid page")
+
+    offset = (page - 1) * limit
+    try:
+        if _uses_fulltext(db):
+            ids = _ranked_ids_fulltext(db, query, limit + 1, offset)
+        else:
+            ids = _ranked_ids_fallback(db, query, limit + 1, offset)
+
+        has_more = len(ids) > limit
+        ids = ids[:limit]
+
+        return get_posts_by_ids(db, ids), has_more
+    except SQLAlchemyError as e:
+        print("DB Error searching posts:", e)
+        raise HTTPException(status_code=500, detail="Failed to search posts")
+
+
+async def search_posts_async(db, query: str, page: int = 1, limit: int = SEARCH_PAGE_SIZE):
+    return await run_db(db, search_posts, query, page, limit)
@@ -2,30 +2,27 @@ from datetime import datetime, timezone
 from fastapi import HTTPException
 from sqlalchemy.exc import SQLAlchemyError
 from sqlalchemy.orm import Session
+from app.database.connection import run_db
 from app.models.user import User
 from app.models.post import Post
 from app.models.comments import Comment
-from app.utils.hashing import verify_password
+from app.services.login import find_login_user, login_user_service_async
+from app.services.post_service import refresh_comment_counts
+from app.utils.hashing import HashingBusyError, verify_password
+from app.utils.render_cache import bump_content_version
+from app.utils.search_index import post_index
+from app.utils.user_cache import invalidate_user
 
 def authenticate_user(db: Session, identifier: str, password: str):
-    try:
-        user = (
-            db.query(User)
-            .filter(
-                (User.username == identifier) | (User.email == identifier),
-                User.deleted_at.is_(None),       
-            )
-            .first()
-        )
-    except SQLAlchemyError as e:
-        print("DB Error during authentication:", e)
-        raise HTTPException(status_code=500, detail="Database error during authentication")
+    user = find_login_user(db, identifier)
 
     if not user:
         return None
     try:
         if not verify_password(password, user.password):
             return None
+    except HashingBusyError:
+        raise HTTPException(status_code=503, detail="Server busy. Please try again.")
     except Exception as e:
         print("Password verification error:", e)
         raise HTTPException(status_code=500, detail="Authentication error")
@@ -41,16 +38,31 @@ def delete_user_account(db: Session, user_id: int):
     try:
         now = datetime.now(timezone.utc)
 
+        commented_post_ids = [
+            post_id
+            for (post_id,) in db.query(Comment.post_id)
+            .filter(Comment.user_id == user_id, Comment.deleted_at.is_(None))
+            .distinct()
+        ]
+
         db.query(Comment).filter(
             Comment.user_id == user_id,
             Comment.deleted_at.is_(None),
         ).update({"deleted_at": now}, synchronize_session="fetch")
 
+        owned_post_ids = [
+            post_id
+            for (post_id,) in db.query(Post.id)
+            .filter(Post.user_id == user_id, Post.deleted_at.is_(None))
+        ]
+
         db.query(Post).filter(
             Post.user_id == user_id,
             Post.deleted_at.is_(None),
         ).update({"deleted_at": now}, synchronize_session="fetch")
 
+        refresh_comment_counts(db, commented_post_ids)
+
         user = db.query(User).filter(
             User.id == user_id,
             User.deleted_at.is_(None),
@@ -62,6 +74,10 @@ def delete_user_account(db: Session, user_id: int):
         user.deleted_at = now
         user.status=False
         db.commit()
+        invalidate_user(user_id)
+        for post_id in owned_post_ids:
+            post_index.remove(post_id)
+        bump_content_version()
         return True
 
     except HTTPException:
@@ -75,4 +91,12 @@ def delete_user_account(db: Session, user_id: int):
     except Exception as e:
         db.rollback()
         print("Unexpected error deleting account:", e)
-        raise HTTPException(status_code=500, detail="Failed to delete account")
\ No newline at end of file
+        raise HTTPException(status_code=500, detail="Failed to delete account")
+
+
+async def authenticate_user_async(db, identifier: str, password: str):
+    return await login_user_service_async(db, identifier, password)
+
+
+async def delete_user_account_async(db, user_id: int):
+    return await run_db(db, delete_user_account, user_id)
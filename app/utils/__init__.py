@@ -1,6 +1,9 @@
 from app.utils import hashing
 from app.utils import jwt_handler
 from app.utils import email
+from app.utils import pagination
+from app.utils import user_cache
+from app.utils import storage
 __all__ = [
     "generate_otp",
     "otp_expiry",
@@ -8,6 +11,14 @@ __all__ = [
     "hash_password",
     "verify_password",
     "create_access_token",
-    "decode_token"
-    
+    "decode_token",
+    "encode_cursor",
+    "decode_cursor",
+    "UserSnapshot",
+    "get_cached_user",
+    "cache_user",
+    "invalidate_user",
+    "set_user_cache_backend",
+    "get_storage",
+    "set_storage_backend",
 ]
\ No newline at end of file
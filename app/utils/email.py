@@ -19,10 +19,34 @@ def otp_expiry(minutes: int = 5):
     return datetime.now(timezone.utc) + timedelta(minutes=minutes)
 
 
+def verification_email(otp: str):
+    """Subject and body of the OTP verification email."""
+    return (
+        "Email Verification - MyBlog",
+        f"""Hello,
+
+Your verification code is: {otp}
+
+This code is valid for 5 minutes. Please do not share this code with anyone.
+
+If you didn't request this code, please ignore this email.
+
+Best regards,
+MyBlog Team""",
+    )
+
+
 class EmailService:
+    """
+    SMTP client. send_message reuses one authenticated connection across
+    calls (reconnecting if the server dropped it); call close() when done.
+    """
+
     def __init__(self):
-        self.smtp_server = "smtp.gmail.com"
-        self.smtp_port = 587
+        self.smtp_server = os.getenv("SMTP_SERVER", "smtp.gmail.com")
+        self.smtp_port = int(os.getenv("SMTP_PORT", "587"))
+        self.smtp_starttls = os.getenv("SMTP_STARTTLS", "true").lower() == "true"
+        self.smtp_timeout = float(os.getenv("SMTP_TIMEOUT", "10"))
         self.smtp_email = os.getenv("SMTP_EMAIL")
         self.smtp_password = os.getenv("SMTP_PASSWORD")
 
@@ -30,36 +54,64 @@ class EmailService:
             raise ValueError("SMTP credentials not found in environment variables")
 
         self.from_email = self.smtp_email  
+        self._server = None
 
-    def send_verification_email(self, to_email: str, otp: str) -> bool:
-        """Send OTP email. Returns True if success."""
+    def _connect(self):
+        server = smtplib.SMTP(self.smtp_server, self.smtp_port, timeout=self.smtp_timeout)
         try:
-            msg = EmailMessage()
-            msg.set_content(
-                f"""Hello,
-
-Your verification code is: {otp}
-
-This code is valid for 5 minutes. Please do not share this code with anyone.
-
-If you didn't request this code, please ignore this email.
-
-Best regards,
-MyBlog Team"""
-            )
-            msg["Subject"] = "Email Verification - MyBlog"
-            msg["From"] = self.from_email
-            msg["To"] = to_email
-
-            server = smtplib.SMTP(self.smtp_server, self.smtp_port, timeout=10)
-            server.starttls()
+            if self.smtp_starttls:
+                server.starttls()
             server.login(self.smtp_email, self.smtp_password)
-            server.send_message(msg)
-            server.quit()
+        except Exception:
+            server.close()
+            raise
+        return server
+
+    def _connection(self):
+        if self._server is not None:
+            try:
+                if self._server.noop()[0] == 250:
+                    return self._server
+            except smtplib.SMTPException:
+                pass
+            self.close()
+        self._server = self._connect()
+        return self._server
+
+    def close(self):
+        if self._server is None:
+            return
+        try:
+            self._server.quit()
+        except Exception:
+            self._server.close()
+        self._server = None
+
+    def send_message(self, to_email: str, subject: str, body: str):
+        """Send one email over the shared connection. Raises on failure."""
+        msg = EmailMessage()
+        msg.set_content(body)
+        msg["Subject"] = subject
+        msg["From"] = self.from_email
+        msg["To"] = to_email
+
+        try:
+            self._connection().send_message(msg)
+        except (smtplib.SMTPServerDisconnected, OSError):
+            # Drop the connection so the next send starts a fresh one.
+            self._server = None
+            raise
 
+    def send_verification_email(self, to_email: str, otp: str) -> bool:
+        """Send OTP email on a one-off connection. Returns True if success."""
+        try:
+            subject, body = verification_email(otp)
+            self.send_message(to_email, subject, body)
             print("✅ EMAIL SENT SUCCESSFULLY to", to_email)
             return True
 
         except Exception as e:
             print("❌ EMAIL FAILED:", str(e))
-            return False
\ No newline at end of file
+            return False
+        finally:
+            self.close()
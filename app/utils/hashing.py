@@ -1,12 +1,54 @@
+from concurrent.futures import ThreadPoolExecutor
+from threading import BoundedSemaphore
+import asyncio
+import os
+from dotenv import load_dotenv
 from passlib.context import CryptContext
 
+load_dotenv()
+
 pwd_context = CryptContext(
     schemes=["argon2"],
     deprecated="auto"
 )
 
+# argon2 releases the GIL, so a thread pool gives real parallelism while
+# capping how many hashes run at once. Work beyond workers + queue limit is
+# rejected instead of piling up behind a login storm.
+HASH_WORKERS = int(os.getenv("HASH_WORKERS", str(os.cpu_count() or 2)))
+HASH_QUEUE_LIMIT = int(os.getenv("HASH_QUEUE_LIMIT", "64"))
+
+_executor = ThreadPoolExecutor(max_workers=HASH_WORKERS, thread_name_prefix="hashing")
+_slots = BoundedSemaphore(HASH_WORKERS + HASH_QUEUE_LIMIT)
+
+
+class HashingBusyError(RuntimeError):
+    """Raised when the hashing pool's queue is full."""
+
+
+def _submit(fn, *args):
+    if not _slots.acquire(blocking=False):
+        raise HashingBusyError("Password hashing queue is full")
+    try:
+        future = _executor.submit(fn, *args)
+    except Exception:
+        _slots.release()
+        raise
+    future.add_done_callback(lambda _: _slots.release())
+    return future
+
+
 def hash_password(password: str):
-    return pwd_context.hash(password)
+    return _submit(pwd_context.hash, password).result()
 
 def verify_password(plain_password: str, hashed_password: str):
-    return pwd_context.verify(plain_password, hashed_password)
+    return _submit(pwd_context.verify, plain_password, hashed_password).result()
+
+
+async def hash_password_async(password: str):
+    return await asyncio.wrap_future(_submit(pwd_context.hash, password))
+
+async def verify_password_async(plain_password: str, hashed_password: str):
+    return await asyncio.wrap_future(
+        _submit(pwd_context.verify, plain_password, hashed_password)
+    )
@@ -0,0 +1,270 @@
+from collections import OrderedDict, deque
+from dataclasses import dataclass
+from threading import Lock
+import math
+import os
+import time
+from dotenv import load_dotenv
+from starlette.concurrency import run_in_threadpool
+from starlette.datastructures import Headers
+from starlette.responses import JSONResponse
+
+try:
+    import redis
+except ImportError:  # only needed for RATE_LIMIT_BACKEND=redis
+    redis = None
+
+load_dotenv()
+
+RATE_LIMIT_ENABLED = os.getenv("RATE_LIMIT_ENABLED", "true").lower() == "true"
+# "memory" (per process), "redis" (shared between workers) or "local-counter",
+# an in-process stand-in that runs the shared backend's code path without Redis.
+RATE_LIMIT_BACKEND = os.getenv("RATE_LIMIT_BACKEND", "memory")
+RATE_LIMIT_REDIS_URL = os.getenv("RATE_LIMIT_REDIS_URL", "redis://localhost:6379/0")
+# Seconds; kept short so an unreachable Redis fails open quickly instead of
+# holding requests until the OS gives up on the connection.
+RATE_LIMIT_REDIS_TIMEOUT = float(os.getenv("RATE_LIMIT_REDIS_TIMEOUT", "0.25"))
+RATE_LIMIT_MAX_KEYS = int(os.getenv("RATE_LIMIT_MAX_KEYS", "100000"))
+# Only behind a proxy that sets X-Forwarded-For; otherwise clients can spoof it.
+RATE_LIMIT_TRUST_FORWARDED = os.getenv("RATE_LIMIT_TRUST_FORWARDED", "false").lower() == "true"
+
+
+@dataclass(frozen=True)
+class RateLimit:
+    limit: int
+    window: int  # seconds
+
+
+def parse_rate(value: str) -> RateLimit:
+    """Parse "20/60" into 20 requests per 60 seconds."""
+    limit, _, window = value.partition("/")
+    return RateLimit(limit=int(limit), window=int(window or 60))
+
+
+RULES = {
+    # Per client IP, checked in the middleware before the request body is read.
+    "login_ip": parse_rate(os.getenv("RATE_LIMIT_LOGIN_PER_IP", "20/60")),
+    "register_ip": parse_rate(os.getenv("RATE_LIMIT_REGISTER_PER_IP", "10/600")),
+    "otp_ip": parse_rate(os.getenv("RATE_LIMIT_OTP_PER_IP", "20/600")),
+    # Per account, checked in the handlers before any DB or password work.
+    "login_identifier": parse_rate(os.getenv("RATE_LIMIT_LOGIN_PER_IDENTIFIER", "10/300")),
+    "register_email": parse_rate(os.getenv("RATE_LIMIT_REGISTER_PER_EMAIL", "3/600")),
+    "otp_email": parse_rate(os.getenv("RATE_LIMIT_OTP_PER_EMAIL", "10/600")),
+}
+
+# POST paths throttled per IP by RateLimitMiddleware.
+PATH_RULES = {
+    "/login": "login_ip",
+    "/auth/login": "login_ip",
+    "/register": "register_ip",
+    "/verify-otp": "otp_ip",
+}
+
+
+class InMemoryRateLimitBackend:
+    """
+    Per-process sliding-window log: the timestamps of the allowed hits in
+    the last window, per key. Exact, and small because limits are small.
+    Least recently used keys are dropped past max_keys, so a flood of
+    distinct keys cannot grow memory without bound.
+    """
+
+    # No I/O, so async callers may run hit() directly on the event loop.
+    blocking = False
+
+    def __init__(self, max_keys: int = RATE_LIMIT_MAX_KEYS):
+        self.max_keys = max_keys
+        self._hits = OrderedDict()
+        self._lock = Lock()
+
+    def hit(self, key: str, limit: int, window: int) -> float:
+        """Record a hit; 0 if allowed, else seconds until the next one would be."""
+        now = time.monotonic()
+        with self._lock:
+            hits = self._hits.get(key)
+            if hits is None:
+                hits = self._hits[key] = deque()
+            self._hits.move_to_end(key)
+            while hits and hits[0] <= now - window:
+                hits.popleft()
+            if len(hits) >= limit:
+                return hits[0] + window - now
+            hits.append(now)
+            while len(self._hits) > self.max_keys:
+                self._hits.popitem(last=False)
+            return 0
+
+    def clear(self):
+        with self._lock:
+            self._hits.clear()
+
+
+class CounterRateLimitBackend:
+    """
+    Sliding-window counter over a key/value store with incr/expire/get
+    (the redis-py client API), so every worker shares the same counts.
+    The previous fixed window's count is weighted by how much of it still
+    overlaps the sliding window: two counters per key instead of a log.
+    """
+
+    # Network round trips: async callers run hit() in the threadpool.
+    blocking = True
+
+    def __init__(self, client):
+        self.client = client
+
+    def hit(self, key: str, limit: int, window: int) -> float:
+        now = time.time()
+        current = int(now // window)
+        elapsed = now - current * window
+        current_key = f"ratelimit:{key}:{current}"
+
+        count = self.client.incr(current_key)
+        if count == 1:
+            self.client.expire(current_key, window * 2)
+        previous = int(self.client.get(f"ratelimit:{key}:{current - 1}") or 0)
+
+        if previous * (window - elapsed) / window + count > limit:
+            return window - elapsed
+        return 0
+
+
+class LocalCounterClient:
+    """In-process stand-in for the incr/expire/get subset of a Redis client."""
+
+    def __init__(self):
+        self._values = {}
+        self._lock = Lock()
+
+    def _live(self, key: str):
+        entry = self._values.get(key)
+        if entry is not None and entry[1] is not None and entry[1] <= time.monotonic():
+            del self._values[key]
+            return None
+        return entry
+
+    def incr(self, key: str) -> int:
+        with self._lock:
+            entry = self._live(key)
+            value = (entry[0] if entry else 0) + 1
+            self._values[key] = (value, entry[1] if entry else None)
+            return value
+
+    def expire(self, key: str, seconds: int):
+        with self._lock:
+            entry = self._live(key)
+            if entry is not None:
+                self._values[key] = (entry[0], time.monotonic() + seconds)
+
+    def get(self, key: str):
+        with self._lock:
+            entry = self._live(key)
+            return entry[0] if entry else None
+
+
+def _default_backend():
+    if RATE_LIMIT_BACKEND == "redis":
+        if redis is None:
+            raise RuntimeError("RATE_LIMIT_BACKEND=redis requires the redis package")
+        client = redis.Redis.from_url(
+            RATE_LIMIT_REDIS_URL,
+            socket_connect_timeout=RATE_LIMIT_REDIS_TIMEOUT,
+            socket_timeout=RATE_LIMIT_REDIS_TIMEOUT,
+        )
+        return CounterRateLimitBackend(client)
+    if RATE_LIMIT_BACKEND == "local-counter":
+        return CounterRateLimitBackend(LocalCounterClient())
+    return InMemoryRateLimitBackend()
+
+
+_backend = None
+_metrics_lock = Lock()
+rate_limit_metrics = {"backend": RATE_LIMIT_BACKEND, "allowed": 0, "rejected": {}, "errors": 0}
+
+
+def get_rate_limit_backend():
+    global _backend
+    if _backend is None:
+        _backend = _default_backend()
+    return _backend
+
+
+def set_rate_limit_backend(backend):
+    global _backend
+    _backend = backend
+
+
+def check_rate_limit(rule: str, value: str) -> float:
+    """
+    Count one attempt against RULES[rule] for `value` (an IP, username or
+    email). Returns 0 if allowed, else the seconds to wait. Fails open if
+    the backend is unreachable, so an outage there does not block logins.
+    """
+    if not RATE_LIMIT_ENABLED or not value:
+        return 0
+    limit = RULES[rule]
+    try:
+        retry_after = get_rate_limit_backend().hit(f"{rule}:{value}", limit.limit, limit.window)
+    except Exception as e:
+        print("Rate limit backend error:", e)
+        with _metrics_lock:
+            rate_limit_metrics["errors"] += 1
+        return 0
+    with _metrics_lock:
+        if retry_after:
+            rate_limit_metrics["rejected"][rule] = rate_limit_metrics["rejected"].get(rule, 0) + 1
+        else:
+            rate_limit_metrics["allowed"] += 1
+    return retry_after
+
+
+async def check_rate_limit_async(rule: str, value: str) -> float:
+    """Async variant; backends that do network I/O run in the threadpool, not on the loop."""
+    if not RATE_LIMIT_ENABLED or not value:
+        return 0
+    if getattr(get_rate_limit_backend(), "blocking", True):
+        return await run_in_threadpool(check_rate_limit, rule, value)
+    return check_rate_limit(rule, value)
+
+
+def retry_after_header(retry_after: float) -> dict:
+    return {"Retry-After": str(max(1, math.ceil(retry_after)))}
+
+
+def client_ip(scope) -> str:
+    if RATE_LIMIT_TRUST_FORWARDED:
+        forwarded = Headers(scope=scope).get("x-forwarded-for")
+        if forwarded:
+            return forwarded.split(",")[0].strip()
+    client = scope.get("client")
+    return client[0] if client else ""
+
+
+class RateLimitMiddleware:
+    """
+    Throttles POSTs to the login, registration and OTP endpoints per client
+    IP. Over-limit requests get a 429 before their body is read, so a
+    credential-stuffing burst costs neither a DB connection nor an argon2
+    hash. Per-account limits need the form fields and are checked in the
+    handlers with check_rate_limit.
+    """
+
+    def __init__(self, app, path_rules: dict = PATH_RULES):
+        self.app = app
+        self.path_rules = path_rules
+
+    async def __call__(self, scope, receive, send):
+        rule = None
+        if scope["type"] == "http" and scope["method"] == "POST":
+            rule = self.path_rules.get(scope["path"].rstrip("/") or "/")
+        if rule is not None:
+            retry_after = await check_rate_limit_async(rule, client_ip(scope))
+            if retry_after:
+                response = JSONResponse(
+                    {"detail": "Too many attempts. Please try again later."},
+                    status_code=429,
+                    headers=retry_after_header(retry_after),
+                )
+                await response(scope, receive, send)
+                return
+        await self.app(scope, receive, send)
@@ -0,0 +1,83 @@
+from collections import OrderedDict
+from threading import Lock
+import itertools
+import os
+import time
+from dotenv import load_dotenv
+
+load_dotenv()
+
+PAGE_CACHE_MAX_BYTES = int(os.getenv("PAGE_CACHE_MAX_BYTES", str(32 * 1024 * 1024)))
+FRAGMENT_CACHE_MAX_BYTES = int(os.getenv("FRAGMENT_CACHE_MAX_BYTES", str(32 * 1024 * 1024)))
+# Other workers only see this worker's version bumps through the database,
+# so cached pages also expire after a short TTL.
+RENDER_CACHE_TTL_SECONDS = int(os.getenv("RENDER_CACHE_TTL_SECONDS", "30"))
+
+
+def _size_of(value) -> int:
+    return len(value[0] if isinstance(value, tuple) else value)
+
+
+class RenderCache:
+    """
+    LRU cache of rendered HTML, bounded by total size and TTL. Values are
+    strings, or tuples whose first item is the HTML string (the rest is
+    small metadata stored alongside it).
+    """
+
+    def __init__(self, max_bytes: int, ttl_seconds: int = RENDER_CACHE_TTL_SECONDS):
+        self.max_bytes = max_bytes
+        self.ttl_seconds = ttl_seconds
+        self._entries = OrderedDict()
+        self._size = 0
+        self._lock = Lock()
+
+    def get(self, key):
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            expires_at, value = entry
+            if expires_at <= time.monotonic():
+                self._pop(key)
+                return None
+            self._entries.move_to_end(key)
+            return value
+
+    def set(self, key, value):
+        size = _size_of(value)
+        if size > self.max_bytes:
+            return
+        with self._lock:
+            self._pop(key)
+            self._entries[key] = (time.monotonic() + self.ttl_seconds, value)
+            self._size += size
+            while self._size > self.max_bytes:
+                self._pop(next(iter(self._entries)))
+
+    def _pop(self, key):
+        entry = self._entries.pop(key, None)
+        if entry is not None:
+            self._size -= _size_of(entry[1])
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self._size = 0
+
+
+page_cache = RenderCache(PAGE_CACHE_MAX_BYTES)
+fragment_cache = RenderCache(FRAGMENT_CACHE_MAX_BYTES)
+
+_content_version = itertools.count(1)
+_current_version = next(_content_version)
+
+
+def content_version() -> int:
+    return _current_version
+
+
+def bump_content_version():
+    """Call after any committed change to posts or comments."""
+    global _current_version
+    _current_version = next(_content_version)
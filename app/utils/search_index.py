@@ -0,0 +1,101 @@
+from collections import Counter, defaultdict
+from threading import RLock
+import heapq
+import math
+import re
+
+TOKEN_RE = re.compile(r"\w+", re.UNICODE)
+TITLE_WEIGHT = 2  # a title term counts as this many body occurrences
+
+BM25_K1 = 1.2
+BM25_B = 0.75
+
+
+def tokenize(text: str):
+    return [t for t in TOKEN_RE.findall((text or "").lower()) if len(t) > 1]
+
+
+class InvertedIndex:
+    """
+    In-memory BM25 index over post title + content. This is the search
+    backend for databases without a native full-text index (SQLite in dev
+    and tests); it is per-process and built lazily from the DB.
+    """
+
+    def __init__(self):
+        self._lock = RLock()
+        self._postings = defaultdict(dict)   # term -> {post_id: term frequency}
+        self._doc_terms = {}                 # post_id -> Counter of terms
+        self._doc_lengths = {}               # post_id -> weighted term count
+        self._total_length = 0
+        self.built = False
+
+    def build(self, documents):
+        """Replace the index with `documents`: iterable of (id, title, content)."""
+        with self._lock:
+            self._postings.clear()
+            self._doc_terms.clear()
+            self._doc_lengths.clear()
+            self._total_length = 0
+            for post_id, title, content in documents:
+                self._add(post_id, title, content)
+            self.built = True
+
+    def _add(self, post_id, title, content):
+        terms = Counter(tokenize(content))
+        for term in tokenize(title):
+            terms[term] += TITLE_WEIGHT
+        self._doc_terms[post_id] = terms
+        self._doc_lengths[post_id] = sum(terms.values())
+        self._total_length += self._doc_lengths[post_id]
+        for term, tf in terms.items():
+            self._postings[term][post_id] = tf
+
+    def _remove(self, post_id):
+        terms = self._doc_terms.pop(post_id, None)
+        if terms is None:
+            return
+        self._total_length -= self._doc_lengths.pop(post_id)
+        for term in terms:
+            postings = self._postings.get(term)
+            if postings is not None:
+                postings.pop(post_id, None)
+                if not postings:
+                    del self._postings[term]
+
+    def add(self, post_id, title, content):
+        with self._lock:
+            if not self.built:
+                return  # the lazy build will pick the post up from the DB
+            self._remove(post_id)
+            self._add(post_id, title, content)
+
+    def remove(self, post_id):
+        with self._lock:
+            if self.built:
+                self._remove(post_id)
+
+    def search(self, query: str, limit: int, offset: int = 0):
+        """Return up to `limit` post ids ranked by BM25, skipping `offset`."""
+        terms = set(tokenize(query))
+        with self._lock:
+            doc_count = len(self._doc_terms)
+            if not terms or not doc_count:
+                return []
+            avg_length = self._total_length / doc_count
+            scores = defaultdict(float)
+            for term in terms:
+                postings = self._postings.get(term)
+                if not postings:
+                    continue
+                idf = math.log(1 + (doc_count - len(postings) + 0.5) / (len(postings) + 0.5))
+                for post_id, tf in postings.items():
+                    length = self._doc_lengths[post_id]
+                    norm = BM25_K1 * (1 - BM25_B + BM25_B * length / avg_length)
+                    scores[post_id] += idf * tf * (BM25_K1 + 1) / (tf + norm)
+
+        top = heapq.nlargest(offset + limit, scores.items(), key=lambda item: (item[1], item[0]))
+        return [post_id for post_id, _ in top[offset:]]
+
+
+post_index = InvertedIndex()
@@ -0,0 +1,198 @@
+from pathlib import Path
+from typing import BinaryIO, Optional
+from urllib.parse import urlsplit
+import mimetypes
+import os
+import shutil
+import uuid
+from dotenv import load_dotenv
+
+try:
+    import boto3
+    from botocore.exceptions import ClientError
+except ImportError:  # only needed for STORAGE_BACKEND=s3
+    boto3 = None
+
+load_dotenv()
+
+STORAGE_BACKEND = os.getenv("STORAGE_BACKEND", "local")
+UPLOAD_DIR = Path(os.getenv("UPLOAD_DIR", "static/uploads"))
+UPLOAD_BASE_URL = os.getenv("UPLOAD_BASE_URL", "/static/uploads")
+
+STORAGE_S3_BUCKET = os.getenv("STORAGE_S3_BUCKET")
+STORAGE_S3_ENDPOINT = os.getenv("STORAGE_S3_ENDPOINT")  # e.g. a MinIO server
+STORAGE_S3_REGION = os.getenv("STORAGE_S3_REGION")
+# Public (bucket website / CDN) base URL. Without one, media is served
+# through /media/<key>, which redirects to a presigned URL.
+STORAGE_PUBLIC_URL = os.getenv("STORAGE_PUBLIC_URL")
+STORAGE_PRESIGN_SECONDS = int(os.getenv("STORAGE_PRESIGN_SECONDS", "3600"))
+MEDIA_URL_PREFIX = "/media"
+
+
+def key_from_url(url: str) -> str:
+    """Uploads use flat, content-addressed keys, so the key is the URL's last segment."""
+    return urlsplit(url).path.rsplit("/", 1)[-1]
+
+
+def image_urls_for(url: str) -> set:
+    """
+    URLs a post may store for the upload behind `url`: the URL itself and
+    the backend's canonical URL for its key. Checks for whether an upload
+    is still in use compare against both, so they match on the storage key
+    the delete would act on, not just on the exact string.
+    """
+    return {url, get_storage().url(key_from_url(url))}
+
+
+def _move_into_place(source: Path, target: Path):
+    """Rename `source` to `target`, copying first if they are on different filesystems."""
+    target.parent.mkdir(parents=True, exist_ok=True)
+    try:
+        os.replace(source, target)
+    except OSError:
+        temp = target.with_name(f".{uuid.uuid4().hex}.tmp")
+        shutil.copyfile(source, temp)
+        os.replace(temp, target)
+        source.unlink(missing_ok=True)
+
+
+class LocalStorage:
+    """
+    Uploads in one local directory, served by the app's StaticFiles mount.
+    Keys map directly to file names.
+    """
+
+    def __init__(self, root: Path = UPLOAD_DIR, base_url: str = UPLOAD_BASE_URL):
+        self.root = root
+        self.base_url = base_url.rstrip("/")
+        self.root.mkdir(parents=True, exist_ok=True)
+
+    def _relative(self, key: str) -> str:
+        return key
+
+    def path(self, key: str) -> Path:
+        return self.root / self._relative(key)
+
+    def put_file(self, key: str, source: Path):
+        """Move a finished temp file into storage under `key`."""
+        _move_into_place(Path(source), self.path(key))
+
+    def open(self, key: str) -> BinaryIO:
+        return open(self.path(key), "rb")
+
+    def exists(self, key: str) -> bool:
+        return self.path(key).exists()
+
+    def delete(self, key: str):
+        self.path(key).unlink(missing_ok=True)
+
+    def delete_prefix(self, prefix: str):
+        directory = self.path(prefix).parent
+        for path in directory.glob(f"{Path(prefix).name}*"):
+            path.unlink(missing_ok=True)
+
+    def url(self, key: str) -> str:
+        return f"{self.base_url}/{self._relative(key)}"
+
+
+class ShardedLocalStorage(LocalStorage):
+    """
+    Like LocalStorage, but spreads keys over two levels of sub-directories
+    taken from the key itself (ab/cd/abcd...), so no directory grows huge.
+    A hash's derived files share its prefix, so they land in the same shard.
+    """
+
+    def _relative(self, key: str) -> str:
+        return f"{key[0:2]}/{key[2:4]}/{key}"
+
+
+class S3Storage:
+    """Uploads in an S3-compatible bucket (AWS S3, MinIO, ...)."""
+
+    def __init__(
+        self,
+        bucket: Optional[str] = STORAGE_S3_BUCKET,
+        endpoint_url: Optional[str] = STORAGE_S3_ENDPOINT,
+        region: Optional[str] = STORAGE_S3_REGION,
+        public_url: Optional[str] = STORAGE_PUBLIC_URL,
+        presign_seconds: int = STORAGE_PRESIGN_SECONDS,
+        client=None,
+    ):
+        if client is None:
+            if boto3 is None:
+                raise RuntimeError("STORAGE_BACKEND=s3 requires boto3")
+            client = boto3.client("s3", endpoint_url=endpoint_url, region_name=region)
+        if not bucket:
+            raise RuntimeError("STORAGE_S3_BUCKET is not set")
+        self.client = client
+        self.bucket = bucket
+        self.public_url = public_url.rstrip("/") if public_url else None
+        self.presign_seconds = presign_seconds
+
+    def put_file(self, key: str, source: Path):
+        content_type = mimetypes.guess_type(key)[0] or "application/octet-stream"
+        # upload_file streams from disk, switching to multipart for large files.
+        self.client.upload_file(
+            str(source),
+            self.bucket,
+            key,
+            ExtraArgs={"ContentType": content_type, "CacheControl": "public, max-age=31536000, immutable"},
+        )
+        Path(source).unlink(missing_ok=True)
+
+    def open(self, key: str) -> BinaryIO:
+        return self.client.get_object(Bucket=self.bucket, Key=key)["Body"]
+
+    def exists(self, key: str) -> bool:
+        try:
+            self.client.head_object(Bucket=self.bucket, Key=key)
+            return True
+        except ClientError as e:
+            if e.response.get("Error", {}).get("Code") in ("404", "NoSuchKey", "NotFound"):
+                return False
+            raise
+
+    def delete(self, key: str):
+        self.client.delete_object(Bucket=self.bucket, Key=key)
+
+    def delete_prefix(self, prefix: str):
+        paginator = self.client.get_paginator("list_objects_v2")
+        for page in paginator.paginate(Bucket=self.bucket, Prefix=prefix):
+            objects = [{"Key": item["Key"]} for item in page.get("Contents", [])]
+            if objects:
+                self.client.delete_objects(Bucket=self.bucket, Delete={"Objects": objects})
+
+    def url(self, key: str) -> str:
+        if self.public_url:
+            return f"{self.public_url}/{key}"
+        return f"{MEDIA_URL_PREFIX}/{key}"
+
+    def presigned_url(self, key: str) -> str:
+        return self.client.generate_presigned_url(
+            "get_object",
+            Params={"Bucket": self.bucket, "Key": key},
+            ExpiresIn=self.presign_seconds,
+        )
+
+
+def _default_backend():
+    if STORAGE_BACKEND == "s3":
+        return S3Storage()
+    if STORAGE_BACKEND == "sharded":
+        return ShardedLocalStorage()
+    return LocalStorage()
+
+
+_backend = None
+
+
+def get_storage():
+    global _backend
+    if _backend is None:
+        _backend = _default_backend()
+    return _backend
+
+
+def set_storage_backend(backend):
+    global _backend
+    _backend = backend
@@ -0,0 +1,130 @@
+from collections import OrderedDict
+from dataclasses import dataclass
+from datetime import datetime
+from threading import Lock
+from typing import Optional
+import os
+import time
+from dotenv import load_dotenv
+
+load_dotenv()
+
+USER_CACHE_TTL_SECONDS = int(os.getenv("USER_CACHE_TTL_SECONDS", "60"))
+USER_CACHE_MAX_ENTRIES = int(os.getenv("USER_CACHE_MAX_ENTRIES", "10000"))
+
+
+@dataclass(frozen=True)
+class UserSnapshot:
+    """Read-only copy of the user fields request handlers and templates use."""
+    id: int
+    username: str
+    email: str
+    status: bool
+    created_at: Optional[datetime]
+
+    @classmethod
+    def from_user(cls, user):
+        return cls(
+            id=user.id,
+            username=user.username,
+            email=user.email,
+            status=user.status,
+            created_at=user.created_at,
+        )
+
+    @classmethod
+    def from_dict(cls, data: dict):
+        created_at = data.get("created_at")
+        return cls(
+            id=data["id"],
+            username=data["username"],
+            email=data["email"],
+            status=data["status"],
+            created_at=datetime.fromisoformat(created_at) if created_at else None,
+        )
+
+    def to_dict(self) -> dict:
+        return {
+            "id": self.id,
+            "username": self.username,
+            "email": self.email,
+            "status": self.status,
+            "created_at": self.created_at.isoformat() if self.created_at else None,
+        }
+
+
+class InMemoryUserCache:
+    """
+    Per-process TTL + LRU cache. Any object with the same get/set/delete
+    methods (e.g. a thin Redis wrapper) can replace it through
+    set_user_cache_backend to share entries between workers.
+    """
+
+    def __init__(self, max_entries: int = USER_CACHE_MAX_ENTRIES):
+        self.max_entries = max_entries
+        self._entries = OrderedDict()
+        self._lock = Lock()
+
+    def get(self, key: str) -> Optional[dict]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            expires_at, value = entry
+            if expires_at <= time.monotonic():
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+            return value
+
+    def set(self, key: str, value: dict, ttl: int):
+        with self._lock:
+            self._entries[key] = (time.monotonic() + ttl, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def delete(self, key: str):
+        with self._lock:
+            self._entries.pop(key, None)
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+
+_backend = InMemoryUserCache()
+
+
+def set_user_cache_backend(backend):
+    global _backend
+    _backend = backend
+
+
+def _key(user_id: int) -> str:
+    return f"user:{user_id}"
+
+
+def get_cached_user(user_id: int) -> Optional[UserSnapshot]:
+    try:
+        data = _backend.get(_key(user_id))
+    except Exception as e:
+        print("User cache read error:", e)
+        return None
+    return UserSnapshot.from_dict(data) if data else None
+
+
+def cache_user(user) -> UserSnapshot:
+    snapshot = UserSnapshot.from_user(user)
+    try:
+        _backend.set(_key(snapshot.id), snapshot.to_dict(), USER_CACHE_TTL_SECONDS)
+    except Exception as e:
+        print("User cache write error:", e)
+    return snapshot
+
+
+def invalidate_user(user_id: int):
+    try:
+        _backend.delete(_key(user_id))
+    except Exception as e:
+        print("User cache delete error:", e)
@@ -0,0 +1,89 @@
+// DOM Elements
+const form = document.getElementById('postForm');
+const uploadArea = document.getElementById('uploadArea');
+const imageInput = document.getElementById('imageInput');
+const imagePreview = document.getElementById('imagePreview');
+const previewImg = document.getElementById('previewImg');
+const removeImageBtn = document.getElementById('removeImageBtn');
+const toast = document.getElementById('toast');
+
+// Click to upload
+uploadArea.addEventListener('click', () => {
+    imageInput.click();
+});
+
+// Handle file selection
+imageInput.addEventListener('change', (e) => {
+    const file = e.target.files[0];
+    if (file) {
+        handleImageFile(file);
+    }
+});
+
+// Drag and drop handlers
+uploadArea.addEventListener('dragover', (e) => {
+    e.preventDefault();
+    uploadArea.classList.add('dragover');
+});
+
+uploadArea.addEventListener('dragleave', () => {
+    uploadArea.classList.remove('dragover');
+});
+
+uploadArea.addEventListener('drop', (e) => {
+    e.preventDefault();
+    uploadArea.classList.remove('dragover');
+
+    const files = e.dataTransfer.files;
+    if (files.length > 0 && files[0].type.startsWith('image/')) {
+        // Set the file to the input
+        const dataTransfer = new DataTransfer();
+        dataTransfer.items.add(files[0]);
+        imageInput.files = dataTransfer.files;
+
+        handleImageFile(files[0]);
+    }
+});
+
+// Handle image file
+function handleImageFile(file) {
+    // Validate file size (5MB)
+    if (file.size > 5 * 1024 * 1024) {
+        alert('Image size should be less than 5MB');
+        imageInput.value = '';
+        return;
+    }
+
+    // Validate file type
+    if (!file.type.startsWith('image/')) {
+        alert('Please select an image file');
+        imageInput.value = '';
+        return;
+    }
+
+    // Preview image
+    const reader = new FileReader();
+    reader.onload = (e) => {
+        previewImg.src = e.target.result;
+        imagePreview.classList.add('active');
+        uploadArea.style.display = 'none';
+    };
+    reader.readAsDataURL(file);
+}
+
+// Remove image
+removeImageBtn.addEventListener('click', () => {
+    imageInput.value = '';
+    imagePreview.classList.remove('active');
+    uploadArea.style.display = 'block';
+});
+
+// Form submission
+form.addEventListener('submit', function(e) {
+    e.preventDefault();
+    toast.classList.add('show');
+
+    setTimeout(() => {
+        form.submit();
+    }, 500);
+});
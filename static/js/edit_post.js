@@ -0,0 +1,108 @@
+// DOM Elements
+const form = document.getElementById('editForm');
+const uploadArea = document.getElementById('uploadArea');
+const imageInput = document.getElementById('imageInput');
+const imagePreview = document.getElementById('imagePreview');
+const previewImg = document.getElementById('previewImg');
+const removePreviewBtn = document.getElementById('removePreviewBtn');
+const currentImageSection = document.getElementById('currentImageSection');
+const removeCurrentBtn = document.getElementById('removeCurrentBtn');
+const removeImageInput = document.getElementById('removeImageInput');
+const toast = document.getElementById('toast');
+
+// Click to upload
+if (uploadArea) {
+    uploadArea.addEventListener('click', () => {
+        imageInput.click();
+    });
+}
+
+// Handle file selection
+imageInput.addEventListener('change', (e) => {
+    const file = e.target.files[0];
+    if (file) {
+        handleImageFile(file);
+    }
+});
+
+// Drag and drop handlers
+if (uploadArea) {
+    uploadArea.addEventListener('dragover', (e) => {
+        e.preventDefault();
+        uploadArea.style.background = 'rgba(59, 130, 246, 0.15)';
+    });
+
+    uploadArea.addEventListener('dragleave', () => {
+        uploadArea.style.background = 'rgba(59, 130, 246, 0.05)';
+    });
+
+    uploadArea.addEventListener('drop', (e) => {
+        e.preventDefault();
+        uploadArea.style.background = 'rgba(59, 130, 246, 0.05)';
+
+        const files = e.dataTransfer.files;
+        if (files.length > 0 && files[0].type.startsWith('image/')) {
+            const dataTransfer = new DataTransfer();
+            dataTransfer.items.add(files[0]);
+            imageInput.files = dataTransfer.files;
+
+            handleImageFile(files[0]);
+        }
+    });
+}
+
+// Handle image file
+function handleImageFile(file) {
+    if (file.size > 5 * 1024 * 1024) {
+        alert('Image size should be less than 5MB');
+        imageInput.value = '';
+        return;
+    }
+
+    if (!file.type.startsWith('image/')) {
+        alert('Please select an image file');
+        imageInput.value = '';
+        return;
+    }
+
+    const reader = new FileReader();
+    reader.onload = (e) => {
+        previewImg.src = e.target.result;
+        imagePreview.classList.add('active');
+        if (uploadArea) uploadArea.style.display = 'none';
+        if (currentImageSection) currentImageSection.style.display = 'none';
+    };
+    reader.readAsDataURL(file);
+}
+
+// Remove new image preview
+removePreviewBtn.addEventListener('click', () => {
+    imageInput.value = '';
+    imagePreview.classList.remove('active');
+    if (currentImageSection) {
+        currentImageSection.style.display = 'block';
+    } else if (uploadArea) {
+        uploadArea.style.display = 'block';
+    }
+});
+
+// Remove current image
+if (removeCurrentBtn) {
+    removeCurrentBtn.addEventListener('click', () => {
+        if (confirm('Are you sure you want to remove the current image?')) {
+            currentImageSection.style.display = 'none';
+            removeImageInput.value = 'true';
+            if (uploadArea) uploadArea.style.display = 'block';
+        }
+    });
+}
+
+// Form submission
+form.addEventListener('submit', function(e) {
+    e.preventDefault();
+    toast.classList.add('show');
+
+    setTimeout(() => {
+        form.submit();
+    }, 500);
+});
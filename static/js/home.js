@@ -0,0 +1,116 @@
+let deleteType = null;
+let deleteId = null;
+
+function confirmDeletePost(postId) {
+    deleteType = 'post';
+    deleteId = postId;
+    document.getElementById('deleteModal').classList.add('active');
+}
+
+function confirmDeleteComment(commentId, postId) {
+    deleteType = 'comment';
+    deleteId = commentId;
+    document.getElementById('deleteModal').classList.add('active');
+}
+
+function closeModal() {
+    document.getElementById('deleteModal').classList.remove('active');
+    deleteType = null;
+    deleteId = null;
+}
+
+function confirmDelete() {
+    if (deleteType === 'post') {
+        const form = document.createElement('form');
+        form.method = 'POST';
+        form.action = `/post/${deleteId}/delete`;
+        document.body.appendChild(form);
+        form.submit();
+    } else if (deleteType === 'comment') {
+        const form = document.createElement('form');
+        form.method = 'POST';
+        form.action = `/comment/${deleteId}/delete`;
+        document.body.appendChild(form);
+        form.submit();
+    }
+    closeModal();
+}
+const commentCursors = {};
+
+async function loadComments(postId, postOwnerId, button) {
+    const list = document.getElementById(`comments-${postId}`);
+    const cursor = commentCursors[postId];
+    const url = cursor
+        ? `/post/${postId}/comments?cursor=${encodeURIComponent(cursor)}`
+        : `/post/${postId}/comments`;
+
+    button.disabled = true;
+    try {
+        const response = await fetch(url);
+        if (!response.ok) throw new Error('Failed to load comments');
+        const data = await response.json();
+
+        if (!cursor) list.innerHTML = '';
+        data.comments.forEach(comment => list.appendChild(renderComment(comment, postId, postOwnerId)));
+
+        commentCursors[postId] = data.next_cursor;
+        if (data.next_cursor) {
+            button.textContent = 'Load more comments';
+            button.disabled = false;
+        } else {
+            button.remove();
+        }
+    } catch (e) {
+        button.disabled = false;
+        showToast('Failed to load comments', 'error');
+    }
+}
+
+function renderComment(comment, postId, postOwnerId) {
+    const item = document.createElement('div');
+    item.className = 'comment-item';
+
+    const header = document.createElement('div');
+    header.className = 'comment-header';
+    const author = document.createElement('div');
+    author.className = 'comment-author';
+    author.textContent = comment.user ? comment.user.username : 'Unknown';
+    header.appendChild(author);
+    if (currentUserId !== null && (currentUserId === comment.user_id || currentUserId === postOwnerId)) {
+        const del = document.createElement('button');
+        del.className = 'comment-delete-btn';
+        del.textContent = 'Delete';
+        del.onclick = () => confirmDeleteComment(comment.id, postId);
+        header.appendChild(del);
+    }
+
+    const text = document.createElement('div');
+    text.className = 'comment-text';
+    text.textContent = comment.comment_text;
+
+    const date = document.createElement('div');
+    date.className = 'comment-date';
+    date.textContent = new Date(comment.created_at).toLocaleDateString('en-US', { year: 'numeric', month: 'long', day: 'numeric' });
+
+    item.append(header, text, date);
+    return item;
+}
+
+function showToast(message, type = 'success') {
+    const toast = document.getElementById('toast');
+    const toastMessage = document.getElementById('toastMessage');
+
+    toastMessage.textContent = message;
+    toast.className = `toast active ${type}`;
+
+    setTimeout(() => {
+        toast.classList.remove('active');
+    }, 3000);
+}
+
+
+document.getElementById('deleteModal').addEventListener('click', function(e) {
+    if (e.target === this) {
+        closeModal();
+    }
+});
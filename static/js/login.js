@@ -0,0 +1,64 @@
+const loginForm = document.getElementById("loginForm");
+const identifier = document.getElementById("identifier");
+const password = document.getElementById("password");
+const identifierError = document.getElementById("identifierError");
+const passwordError = document.getElementById("passwordError");
+const toast = document.getElementById("toast");
+
+function togglePassword() {
+    const pass = document.getElementById("password");
+    const toggle = document.querySelector(".toggle-label");
+
+    if (pass.type === "password") {
+        pass.type = "text";
+        toggle.textContent = "Hide";
+    } else {
+        pass.type = "password";
+        toggle.textContent = "Show";
+    }
+}
+
+function validateIdentifier() {
+    if (identifier.value.trim() === "") {
+        identifierError.textContent = "Username or Email is required.";
+        return false;
+    } else {
+        identifierError.textContent = "";
+        return true;
+    }
+}
+
+function validatePassword() {
+    const passVal = password.value.trim();
+    if (passVal === "") {
+        passwordError.textContent = "Password is required.";
+        return false;
+    } else if (passVal.length < 6) {
+        passwordError.textContent = "Password must be at least 6 characters.";
+        return false;
+    } else {
+        passwordError.textContent = "";
+        return true;
+    }
+}
+
+identifier.addEventListener("input", validateIdentifier);
+password.addEventListener("input", validatePassword);
+
+loginForm.addEventListener("submit", function(e) {
+    const validIdentifier = validateIdentifier();
+    const validPassword = validatePassword();
+
+    if (!validIdentifier || !validPassword) {
+        e.preventDefault(); 
+        return;
+    }
+
+    e.preventDefault(); 
+    toast.textContent = "Logging in... ✅";
+    toast.classList.add("show");
+
+    setTimeout(() => {
+        loginForm.submit(); 
+    }, 500);
+});
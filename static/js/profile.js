@@ -0,0 +1,26 @@
+function closeModal(id) {
+    document.getElementById(id).classList.remove('active');
+}
+
+document.querySelectorAll('.modal').forEach(function (modal) {
+    modal.addEventListener('click', function (e) {
+        if (e.target === modal) closeModal(modal.id);
+    });
+});
+
+document.addEventListener('keydown', function (e) {
+    if (e.key === 'Escape') {
+        document.querySelectorAll('.modal.active').forEach(function (m) {
+            closeModal(m.id);
+        });
+    }
+});
+var deleteForm = document.getElementById('deleteForm');
+function confirmDelete(postId) {
+    deleteForm.action = '/post/' + postId + '/delete';
+    document.getElementById('deleteModal').classList.add('active');
+}
+
+function openAccountModal() {
+    document.getElementById('accountModal').classList.add('active');
+}
@@ -0,0 +1,298 @@
+function togglePassword(id) {
+    const input = document.getElementById(id);
+    const label = input.nextElementSibling;
+
+    if (input.type === "password") {
+        input.type = "text";
+        label.textContent = "Hide";
+    } else {
+        input.type = "password";
+        label.textContent = "Show";
+    }
+}
+
+const form = document.getElementById("registerForm");
+const username = document.getElementById("username");
+const email = document.getElementById("email");
+const password = document.getElementById("password");
+const confirmPassword = document.getElementById("confirm_password");
+const usernameError = document.getElementById("usernameError");
+const emailError = document.getElementById("emailError");
+const passwordError = document.getElementById("passwordError");
+const confirmPasswordError = document.getElementById("confirmPasswordError");
+const otpInput = document.getElementById("otp");
+const otpError = document.getElementById("otpError");
+const otpSuccess = document.getElementById("otpSuccess");
+
+const touchedFields = {
+    username: false,
+    email: false,
+    password: false,
+    confirmPassword: false
+};
+
+window.addEventListener("DOMContentLoaded", () => {
+    // Show server errors for registration form
+    if (username && usernameError) showServerError(username, usernameError);
+    if (email && emailError) showServerError(email, emailError);
+    if (password && passwordError) showServerError(password, passwordError);
+    if (confirmPassword && confirmPasswordError) showServerError(confirmPassword, confirmPasswordError);
+
+    // Show server errors for OTP
+    if (otpError && otpError.textContent.trim() !== "") {
+        otpError.classList.add("show");
+    }
+
+    // Show success message for OTP
+    if (otpSuccess && otpSuccess.textContent.trim() !== "") {
+        otpSuccess.classList.add("show");
+    }
+
+    // Auto-focus OTP input if on OTP step
+    if (otpInput && !otpInput.closest('form').classList.contains('hidden')) {
+        otpInput.focus();
+    }
+});
+
+function showServerError(input, errorBox) {
+    if (errorBox.textContent.trim() !== "") {
+        input.classList.add("error");
+        errorBox.classList.add("show");
+    }
+}
+
+function showError(input, errorBox, message) {
+    input.classList.remove("success");
+    input.classList.add("error");
+    errorBox.textContent = message;
+    errorBox.classList.add("show");
+}
+
+function clearError(input, errorBox) {
+    input.classList.remove("error");
+    input.classList.add("success");
+    errorBox.textContent = "";
+    errorBox.classList.remove("show");
+}
+
+function validateUsername() {
+    if (!username) return true;
+    const value = username.value.trim();
+
+    if (value === "") {
+        showError(username, usernameError, "Username is required");
+        return false;
+    }
+    if (value.length < 3) {
+        showError(username, usernameError, "Minimum 3 characters needed");
+        return false;
+    }
+    if (!/^[a-zA-Z0-9_]+$/.test(value)) {
+        showError(username, usernameError, "Only letters, numbers, underscore allowed");
+        return false;
+    }
+
+    clearError(username, usernameError);
+    return true;
+}
+
+function validateEmail() {
+    if (!email) return true;
+    const value = email.value.trim();
+
+    if (value === "") {
+        showError(email, emailError, "Email is required");
+        return false;
+    }
+    if (!/^[\w\.-]+@[\w\.-]+\.\w{2,}$/.test(value)) {
+        showError(email, emailError, "Invalid email format");
+        return false;
+    }
+
+    clearError(email, emailError);
+    return true;
+}
+
+function validatePassword() {
+    if (!password) return true;
+    const value = password.value;
+
+    if (value.length < 6) {
+        showError(password, passwordError, "At least 6 characters");
+        return false;
+    }
+    if (!/[A-Z]/.test(value)) {
+        showError(password, passwordError, "One uppercase letter required");
+        return false;
+    }
+    if (!/[a-z]/.test(value)) {
+        showError(password, passwordError, "One lowercase letter required");
+        return false;
+    }
+    if (!/\d/.test(value)) {
+        showError(password, passwordError, "One number required");
+        return false;
+    }
+    if (!/[!@#$%^&*(),.?":{}|<>_\-\\[\]=+;/`~]/.test(value)) {
+        showError(password, passwordError, "One special character required");
+        return false;
+    }
+    clearError(password, passwordError);
+    return true;
+}
+
+function validateConfirmPassword() {
+    if (!confirmPassword) return true;
+    if (confirmPassword.value !== password.value) {
+        showError(confirmPassword, confirmPasswordError, "Passwords do not match");
+        return false;
+    }
+
+    clearError(confirmPassword, confirmPasswordError);
+    return true;
+}
+
+if (username) {
+    username.addEventListener("input", () => {
+        touchedFields.username = true;
+        if (touchedFields.username) {
+            validateUsername();
+        }
+    });
+
+    username.addEventListener("blur", () => {
+        touchedFields.username = true;
+        validateUsername();
+    });
+}
+
+if (email) {
+    email.addEventListener("input", () => {
+        touchedFields.email = true;
+        if (touchedFields.email) {
+            validateEmail();
+        }
+    });
+
+    email.addEventListener("blur", () => {
+        touchedFields.email = true;
+        validateEmail();
+    });
+}
+
+if (password) {
+    password.addEventListener("input", () => {
+        touchedFields.password = true;
+        if (touchedFields.password) {
+            validatePassword();
+        }
+        if (touchedFields.confirmPassword && confirmPassword && confirmPassword.value !== "") {
+            validateConfirmPassword();
+        }
+    });
+
+    password.addEventListener("blur", () => {
+        touchedFields.password = true;
+        validatePassword();
+    });
+}
+
+if (confirmPassword) {
+    confirmPassword.addEventListener("input", () => {
+        touchedFields.confirmPassword = true;
+        if (touchedFields.confirmPassword) {
+            validateConfirmPassword();
+        }
+    });
+
+    confirmPassword.addEventListener("blur", () => {
+        touchedFields.confirmPassword = true;
+        validateConfirmPassword();
+    });
+}
+
+if (form) {
+    form.addEventListener("submit", (e) => {
+        touchedFields.username = true;
+        touchedFields.email = true;
+        touchedFields.password = true;
+        touchedFields.confirmPassword = true;
+
+        const isValid =
+            validateUsername() &&
+            validateEmail() &&
+            validatePassword() &&
+            validateConfirmPassword();
+
+        if (!isValid) {
+            e.preventDefault();
+        }
+    });
+}
+
+// OTP input validation - only allow numbers
+if (otpInput) {
+    otpInput.addEventListener("input", (e) => {
+        e.target.value = e.target.value.replace(/[^0-9]/g, '');
+    });
+}
+
+// Toast functionality
+let toastTimeout = null;
+
+function showToast(message, type = 'success', duration = 5000) {
+    const toast = document.getElementById('toast');
+    const toastMessage = document.getElementById('toastMessage');
+
+    if (toastTimeout) {
+        clearTimeout(toastTimeout);
+    }
+
+    toastMessage.textContent = message;
+    toast.className = `toast active ${type}`;
+
+    toastTimeout = setTimeout(() => {
+        hideToast();
+    }, duration);
+}
+
+function hideToast() {
+    const toast = document.getElementById('toast');
+    toast.classList.remove('active');
+    if (toastTimeout) {
+        clearTimeout(toastTimeout);
+    }
+}
+
+function toggleToast() {
+    const toast = document.getElementById('toast');
+    if (toast.classList.contains('active')) {
+        hideToast();
+    } else {
+        showToast('This is a sample message', 'info');
+    }
+}
+window.addEventListener('DOMContentLoaded', () => {
+    const serverError = document.querySelector('.server-error');
+    const serverSuccess = document.querySelector('.server-success');
+
+    if (serverError && serverError.textContent.trim()) {
+        showToast(serverError.textContent.trim(), 'error', 6000);
+    }
+
+    if (serverSuccess && serverSuccess.textContent.trim()) {
+        showToast(serverSuccess.textContent.trim(), 'success', 6000);
+    }
+});
+document.addEventListener('keydown', function(e) {
+    if (e.key === 'Escape') {
+        hideToast();
+    }
+});
+window.addEventListener('DOMContentLoaded', () => {
+    const body = document.body;
+    const successMessage = body.getAttribute('data-success-message');
+    if (successMessage) {
+        showToast(successMessage, 'success', 6000);
+    }
+});
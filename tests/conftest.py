@@ -0,0 +1,137 @@
+import os
+import tempfile
+from contextlib import contextmanager
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+
+# Configure the app before it is imported: a throwaway SQLite database, no
+# background workers and no throttling. Templates and static files are
+# resolved relative to the working directory.
+os.environ["DATABASE_URL"] = f"sqlite:///{Path(tempfile.mkdtemp()) / 'test.db'}"
+os.environ["DB_MODE"] = "sync"
+os.environ.setdefault("SMTP_EMAIL", "test@example.com")
+os.environ.setdefault("SMTP_PASSWORD", "test")
+os.environ["EMAIL_WORKER_ENABLED"] = "false"
+os.environ["OTP_REAPER_ENABLED"] = "false"
+os.environ["RATE_LIMIT_ENABLED"] = "false"
+os.chdir(ROOT)
+
+import pytest
+from fastapi.testclient import TestClient
+from sqlalchemy import event
+from app.database.connection import Base, SessionLocal, engine
+from app.main import app
+from app.models import Comment, Post, User
+from app.utils.hashing import hash_password
+from app.utils.render_cache import fragment_cache, page_cache
+from app.utils.storage import LocalStorage, get_storage, set_storage_backend
+from app.utils.user_cache import invalidate_user
+
+PASSWORD = "Secret1!"
+
+
+@pytest.fixture(autouse=True)
+def fresh_database():
+    Base.metadata.drop_all(bind=engine)
+    Base.metadata.create_all(bind=engine)
+    page_cache.clear()
+    fragment_cache.clear()
+    yield
+
+
+@pytest.fixture
+def db():
+    session = SessionLocal()
+    try:
+        yield session
+    finally:
+        session.close()
+
+
+@pytest.fixture
+def user(db):
+    alice = User(username="alice", email="alice@example.com", password=hash_password(PASSWORD))
+    db.add(alice)
+    db.commit()
+    return alice
+
+
+@pytest.fixture
+def add_posts(db, user):
+    """
+    add_posts(n, comments=5, own=True) creates n posts, each with `comments`
+    comments. Posts are by `user` when `own`, otherwise each by a new user;
+    every comment is by a new user, so per-row author loads would show up
+    as extra statements instead of hitting the identity map.
+    """
+    created = {"users": 0}
+
+    def new_user():
+        created["users"] += 1
+        other = User(username=f"user{created['users']}", email=f"user{created['users']}@example.com", password="x")
+        db.add(other)
+        db.flush()
+        return other
+
+    def add(count: int, comments: int = 5, own: bool = True):
+        for _ in range(count):
+            author = user if own else new_user()
+            post = Post(title="Title", content="Some content", user_id=author.id, comment_count=comments)
+            db.add(post)
+            db.flush()
+            for i in range(comments):
+                db.add(Comment(post_id=post.id, user_id=new_user().id, comment_text=f"comment {i}"))
+        db.commit()
+
+    return add
+
+
+@pytest.fixture
+def storage(tmp_path):
+    """Uploads go to a LocalStorage under tmp_path for the test."""
+    previous = get_storage()
+    local = LocalStorage(tmp_path, "/static/uploads")
+    set_storage_backend(local)
+    yield local
+    set_storage_backend(previous)
+
+
+@pytest.fixture
+def client():
+    with TestClient(app) as test_client:
+        yield test_client
+
+
+@pytest.fixture
+def logged_in_client(client, user):
+    response = client.post("/login", data={"identifier": "alice", "password": PASSWORD}, follow_redirects=False)
+    assert response.status_code == 303
+    return client
+
+
+@contextmanager
+def captured_statements(bind=engine):
+    """Collect (sql, parameters) for every statement sent to the database."""
+    statements = []
+
+    def record(conn, cursor, statement, parameters, context, executemany):
+        statements.append((statement, parameters))
+
+    event.listen(bind, "before_cursor_execute", record)
+    try:
+        yield statements
+    finally:
+        event.remove(bind, "before_cursor_execute", record)
+
+
+@pytest.fixture
+def reset_caches(user):
+    """Drop every cache a request could answer from, so each one hits the database."""
+
+    def reset():
+        page_cache.clear()
+        fragment_cache.clear()
+        invalidate_user(user.id)
+
+    return reset
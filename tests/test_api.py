@@ -0,0 +1,86 @@
+from app.models import Post
+
+SUMMARY_KEYS = {"id", "title", "image_url", "comment_count", "created_at", "updated_at", "author"}
+
+
+def test_post_list_shape_and_paging(client, add_posts):
+    add_posts(3, comments=2)
+
+    first = client.get("/api/v1/posts", params={"limit": 2})
+    assert first.status_code == 200
+    assert first.headers["content-type"] == "application/json"
+    page = first.json()
+    assert set(page) == {"posts", "next_cursor"}
+    assert [set(post) for post in page["posts"]] == [SUMMARY_KEYS] * 2
+    assert page["posts"][0]["author"] == {"id": 1, "username": "alice"}
+    assert page["posts"][0]["comment_count"] == 2
+
+    rest = client.get("/api/v1/posts", params={"limit": 2, "cursor": page["next_cursor"]}).json()
+    assert len(rest["posts"]) == 1
+    assert rest["posts"][0]["id"] not in {post["id"] for post in page["posts"]}
+
+
+def test_post_list_includes_content_on_request(client, add_posts):
+    add_posts(1, comments=0)
+    post = client.get("/api/v1/posts", params={"include": "content"}).json()["posts"][0]
+    assert set(post) == SUMMARY_KEYS | {"content"}
+    assert post["content"] == "Some content"
+
+
+def test_post_detail_shape(client, add_posts, db):
+    add_posts(1, comments=0)
+    post_id = db.query(Post.id).scalar()
+
+    post = client.get(f"/api/v1/posts/{post_id}").json()
+    assert set(post) == SUMMARY_KEYS | {"content"}
+    assert client.get("/api/v1/posts/999").json() == {"detail": "Post not found"}
+
+
+def test_comment_page_shape(client, add_posts, db):
+    add_posts(1, comments=3)
+    post_id = db.query(Post.id).scalar()
+
+    page = client.get(f"/api/v1/posts/{post_id}/comments", params={"limit": 2}).json()
+    assert set(page) == {"post_id", "comments", "next_cursor"}
+    assert page["post_id"] == post_id and page["next_cursor"]
+    assert [set(comment) for comment in page["comments"]] == [
+        {"id", "post_id", "comment_text", "created_at", "user"}
+    ] * 2
+    assert set(page["comments"][0]["user"]) == {"id", "username"}
+
+
+def test_profile_shape(logged_in_client, add_posts):
+    add_posts(2, comments=0)
+    profile = logged_in_client.get("/api/v1/profile").json()
+    assert set(profile) == {"id", "username", "email", "created_at", "posts", "next_cursor"}
+    assert profile["username"] == "alice"
+    assert [set(post) for post in profile["posts"]] == [SUMMARY_KEYS] * 2
+
+
+def test_profile_requires_login(client):
+    assert client.get("/api/v1/profile").status_code == 401
+
+
+def test_batch_reports_created_ids_and_item_errors(logged_in_client, db):
+    response = logged_in_client.post(
+        "/api/v1/posts/batch",
+        json={"posts": [{"title": "A title", "content": "Body"}, {"title": "", "content": ""}]},
+    )
+    assert response.status_code == 200
+    result = response.json()
+    assert result["created"] == [db.query(Post.id).scalar()]
+    assert result["errors"] == [{"index": 1, "detail": "Title is required"}]
+
+
+def test_null_title_and_content_are_returned_as_null(client, db, user):
+    post = Post(title=None, content=None, user_id=user.id)
+    db.add(post)
+    db.commit()
+
+    listed = client.get("/api/v1/posts", params={"include": "content"})
+    assert listed.status_code == 200
+    assert listed.json()["posts"][0]["title"] is None
+
+    detail = client.get(f"/api/v1/posts/{post.id}")
+    assert detail.status_code == 200
+    assert detail.json()["title"] is None and detail.json()["content"] is None
@@ -0,0 +1,73 @@
+import pytest
+from fastapi import FastAPI
+from fastapi.responses import PlainTextResponse
+from fastapi.testclient import TestClient
+from app.helper.compression import CompressionMiddleware, no_compression
+
+BODY = "compressible text " * 500
+
+
+@pytest.fixture
+def plain_client():
+    """A bare app behind CompressionMiddleware, with and without @no_compression."""
+    app = FastAPI()
+    app.add_middleware(CompressionMiddleware)
+
+    @app.get("/text")
+    def text():
+        return PlainTextResponse(BODY, headers={"ETag": '"abc"'})
+
+    @app.get("/raw")
+    @no_compression
+    def raw():
+        return PlainTextResponse(BODY, headers={"ETag": '"abc"'})
+
+    @app.get("/small")
+    def small():
+        return PlainTextResponse("tiny", headers={"ETag": '"abc"'})
+
+    with TestClient(app) as client:
+        yield client
+
+
+def test_compressed_response_gets_a_weak_etag(plain_client):
+    response = plain_client.get("/text", headers={"Accept-Encoding": "gzip"})
+    assert response.headers["content-encoding"] == "gzip"
+    assert response.headers["etag"] == 'W/"abc"'
+    assert "Accept-Encoding" in response.headers["vary"]
+    assert response.text == BODY
+
+
+def test_identity_response_keeps_the_strong_etag(plain_client):
+    response = plain_client.get("/text", headers={"Accept-Encoding": "identity"})
+    assert "content-encoding" not in response.headers
+    assert response.headers["etag"] == '"abc"'
+    assert "Accept-Encoding" in response.headers["vary"]
+
+
+def test_no_compression_endpoint_is_sent_as_is(plain_client):
+    response = plain_client.get("/raw", headers={"Accept-Encoding": "gzip"})
+    assert "content-encoding" not in response.headers
+    assert response.headers["etag"] == '"abc"'
+    assert "vary" not in response.headers
+    assert response.text == BODY
+
+
+def test_small_body_is_not_compressed(plain_client):
+    response = plain_client.get("/small", headers={"Accept-Encoding": "gzip"})
+    assert "content-encoding" not in response.headers
+    assert response.headers["etag"] == '"abc"'
+
+
+def test_compressed_feed_revalidates_with_its_weak_etag(client, add_posts):
+    add_posts(10, own=False)
+    compressed = client.get("/read", headers={"Accept-Encoding": "gzip"})
+    identity = client.get("/read", headers={"Accept-Encoding": "identity"})
+
+    assert compressed.headers["content-encoding"] == "gzip"
+    assert compressed.headers["etag"] == f"W/{identity.headers['etag']}"
+
+    revalidated = client.get(
+        "/read", headers={"Accept-Encoding": "gzip", "If-None-Match": compressed.headers["etag"]}
+    )
+    assert revalidated.status_code == 304
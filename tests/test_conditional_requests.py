@@ -0,0 +1,48 @@
+from datetime import datetime, timedelta, timezone
+import pytest
+from app.models import Post
+from app.services.post_service import delete_post
+
+
+@pytest.fixture
+def two_posts(db, user):
+    """An older and a newer post by `user`, both well before the test runs."""
+    now = datetime.now(timezone.utc)
+    older = Post(title="Older", content="Some content", user_id=user.id, created_at=now - timedelta(hours=2))
+    newer = Post(title="Newer", content="Some content", user_id=user.id, created_at=now - timedelta(hours=1))
+    db.add_all([older, newer])
+    db.commit()
+    return older, newer
+
+
+def test_deleting_a_post_moves_feed_last_modified(db, client, two_posts):
+    _, newer = two_posts
+    before = client.get("/read")
+    assert "Newer" in before.text
+
+    delete_post(db, newer.id)
+
+    revalidated = client.get("/read", headers={"If-Modified-Since": before.headers["last-modified"]})
+    assert revalidated.status_code == 200
+    assert "Newer" not in revalidated.text
+    assert revalidated.headers["last-modified"] != before.headers["last-modified"]
+
+
+def test_deleting_a_post_moves_profile_last_modified(db, logged_in_client, two_posts):
+    _, newer = two_posts
+    before = logged_in_client.get("/profile")
+    assert "Newer" in before.text
+
+    delete_post(db, newer.id)
+
+    revalidated = logged_in_client.get(
+        "/profile", headers={"If-Modified-Since": before.headers["last-modified"]}
+    )
+    assert revalidated.status_code == 200
+    assert "Newer" not in revalidated.text
+
+
+def test_unchanged_feed_revalidates_on_last_modified(client, two_posts):
+    before = client.get("/read")
+    revalidated = client.get("/read", headers={"If-Modified-Since": before.headers["last-modified"]})
+    assert revalidated.status_code == 304
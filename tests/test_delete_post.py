@@ -0,0 +1,72 @@
+from fastapi import BackgroundTasks
+import pytest
+from app.models import Comment, Post, User
+from app.services.post_service import delete_post
+
+
+@pytest.fixture
+def stored_image(storage, tmp_path):
+    """stored_image(key) puts a file in storage and returns its URL."""
+
+    def put(key: str) -> str:
+        source = tmp_path / f"source-{key}"
+        source.write_bytes(b"image bytes")
+        storage.put_file(key, source)
+        return storage.url(key)
+
+    return put
+
+
+def test_deleting_someone_elses_post_is_forbidden(db, logged_in_client, add_posts):
+    add_posts(1, comments=3, own=False)
+    post = db.query(Post).one()
+
+    response = logged_in_client.post(f"/post/{post.id}/delete", follow_redirects=False)
+
+    assert response.status_code == 403
+    db.expire_all()
+    assert post.deleted_at is None and post.comment_count == 3
+    assert db.query(Comment).filter(Comment.deleted_at.is_(None)).count() == 3
+
+
+def test_deleting_own_post_removes_it_and_its_comments(db, logged_in_client, add_posts):
+    add_posts(1, comments=3)
+    post = db.query(Post).one()
+
+    response = logged_in_client.post(f"/post/{post.id}/delete", follow_redirects=False)
+
+    assert response.status_code == 303
+    db.expire_all()
+    assert post.deleted_at is not None and post.comment_count == 0
+    assert db.query(Comment).filter(Comment.deleted_at.is_(None)).count() == 0
+
+
+def test_orphaned_image_is_removed_in_the_background(db, user, storage, stored_image):
+    post = Post(title="Title", content="Some content", user_id=user.id, image_url=stored_image("a.png"))
+    db.add(post)
+    db.commit()
+    background_tasks = BackgroundTasks()
+
+    assert delete_post(db, post.id, user_id=user.id, background_tasks=background_tasks)
+
+    assert storage.exists("a.png")  # nothing removed inside the request
+    assert len(background_tasks.tasks) == 1
+    for task in background_tasks.tasks:
+        task.func(*task.args, **task.kwargs)
+    assert not storage.exists("a.png")
+
+
+def test_shared_image_is_kept(db, user, storage, stored_image):
+    url = stored_image("b.png")
+    other = User(username="bob", email="bob@example.com", password="x")
+    db.add(other)
+    db.flush()
+    post = Post(title="Title", content="Some content", user_id=user.id, image_url=url)
+    db.add_all([post, Post(title="Title", content="Same image", user_id=other.id, image_url=url)])
+    db.commit()
+    background_tasks = BackgroundTasks()
+
+    assert delete_post(db, post.id, user_id=user.id, background_tasks=background_tasks)
+
+    assert background_tasks.tasks == []
+    assert storage.exists("b.png")
@@ -0,0 +1,45 @@
+from threading import BoundedSemaphore
+import pytest
+from fastapi import HTTPException
+import app.utils.hashing as hashing
+from app.services.login import login_user_service
+from app.utils.hashing import HashingBusyError, hash_password, verify_password
+from tests.conftest import PASSWORD
+
+
+@pytest.fixture
+def full_hashing_queue(monkeypatch):
+    """Every slot in the hashing pool is taken."""
+    slots = BoundedSemaphore(1)
+    slots.acquire()
+    monkeypatch.setattr(hashing, "_slots", slots)
+
+
+def test_hashing_rejects_work_past_the_queue_limit(full_hashing_queue):
+    with pytest.raises(HashingBusyError):
+        hash_password(PASSWORD)
+
+
+def test_slots_are_released_after_each_hash(monkeypatch):
+    monkeypatch.setattr(hashing, "_slots", BoundedSemaphore(1))
+    hashed = hash_password(PASSWORD)
+    assert verify_password(PASSWORD, hashed)  # would be busy if the first slot leaked
+
+
+def test_busy_hashing_pool_is_503_in_the_login_service(db, user, full_hashing_queue):
+    with pytest.raises(HTTPException) as raised:
+        login_user_service(db, "alice", PASSWORD)
+    assert raised.value.status_code == 503
+
+
+@pytest.mark.parametrize(
+    "path, form",
+    [
+        ("/login", {"identifier": "alice", "password": PASSWORD}),
+        ("/auth/login", {"username": "alice", "password": PASSWORD}),
+    ],
+)
+def test_busy_hashing_pool_is_503_on_login(client, user, full_hashing_queue, path, form):
+    response = client.post(path, data=form, follow_redirects=False)
+    assert response.status_code == 503
+    assert response.json()["detail"] == "Server busy. Please try again."
@@ -0,0 +1,76 @@
+from datetime import datetime, timedelta, timezone
+import pytest
+from sqlalchemy import text
+from app.models import Post
+from app.schemas.post import PostUpdate
+from app.services.image_service import _process
+from app.services.post_service import update_post
+
+Image = pytest.importorskip("PIL.Image")
+
+
+@pytest.fixture
+def upload(storage, tmp_path):
+    """upload(key) stores a small image under `key` and returns its URL."""
+
+    def put(key: str) -> str:
+        source = tmp_path / f"source-{key}"
+        Image.new("RGB", (1000, 500), "red").save(source, format="PNG")
+        storage.put_file(key, source)
+        return storage.url(key)
+
+    return put
+
+
+@pytest.fixture
+def image_post(db, user, upload):
+    # A minute old: Last-Modified has one-second resolution, and variants
+    # normally land well after the post that triggered them.
+    post = Post(
+        title="Title",
+        content="Some content",
+        user_id=user.id,
+        image_url=upload("abc.png"),
+        created_at=datetime.now(timezone.utc) - timedelta(minutes=1),
+    )
+    db.add(post)
+    db.commit()
+    return post
+
+
+def test_variants_do_not_mark_post_as_edited(db, client, image_post):
+    before = client.get("/read")
+    _process(image_post.id, image_post.image_url)
+    after = client.get("/read")
+
+    db.refresh(image_post)
+    assert image_post.image_variants is not None
+    assert image_post.updated_at is None
+    assert after.headers["etag"] != before.headers["etag"]
+    assert "<picture" not in before.text and "<picture" in after.text
+
+
+def test_variants_after_image_edit_change_validators(db, client, image_post, upload, monkeypatch):
+    monkeypatch.setattr("app.services.post_service.schedule_image_variants", lambda *args: None)
+    _process(image_post.id, image_post.image_url)
+    db.expire_all()  # _process wrote through its own session
+    update_post(db, image_post.id, PostUpdate(image_url=upload("def.png")))
+    raw = db.execute(text("SELECT image_variants FROM posts WHERE id = :id"), {"id": image_post.id}).scalar()
+    assert raw is None  # SQL NULL, not the JSON value 'null'
+
+    before = client.get("/read")
+    assert "<picture" not in before.text
+    _process(image_post.id, image_post.image_url)
+
+    revalidated = client.get("/read", headers={"If-None-Match": before.headers["etag"]})
+    assert revalidated.status_code == 200
+    assert "<picture" in revalidated.text
+
+
+def test_variants_move_last_modified(client, image_post):
+    before = client.get("/read")
+    _process(image_post.id, image_post.image_url)
+
+    revalidated = client.get("/read", headers={"If-Modified-Since": before.headers["last-modified"]})
+    assert revalidated.status_code == 200
+    assert "<picture" in revalidated.text
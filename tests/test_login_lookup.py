@@ -0,0 +1,34 @@
+from datetime import datetime, timezone
+import pytest
+from app.services.login import find_login_user
+from tests.conftest import PASSWORD, captured_statements
+
+
+@pytest.mark.parametrize("identifier", ["alice", "ALICE", "  Alice ", "alice@example.com", "Alice@Example.COM"])
+def test_login_identifier_is_case_insensitive(db, user, identifier):
+    assert find_login_user(db, identifier).id == user.id
+
+
+@pytest.mark.parametrize(
+    "identifier, column, other",
+    [("Alice", "username_key", "email"), ("Alice@Example.com", "email", "username_key")],
+)
+def test_identifier_with_at_sign_goes_to_the_email_index(db, user, identifier, column, other):
+    with captured_statements() as statements:
+        find_login_user(db, identifier)
+    [(sql, _)] = statements
+    where = sql.split("WHERE", 1)[1]
+    assert f"users.{column} =" in where
+    assert f"users.{other}" not in where
+
+
+def test_unknown_and_deleted_users_are_not_found(db, user):
+    assert find_login_user(db, "bob") is None
+    user.deleted_at = datetime.now(timezone.utc)
+    db.commit()
+    assert find_login_user(db, "alice") is None
+
+
+def test_login_form_accepts_any_case(client, user):
+    response = client.post("/login", data={"identifier": "ALICE@example.com", "password": PASSWORD}, follow_redirects=False)
+    assert response.status_code == 303
@@ -0,0 +1,17 @@
+import pytest
+
+ENDPOINTS = ["/metrics/db-pool", "/metrics/templates", "/metrics/otp-reaper", "/metrics/rate-limit"]
+
+
+@pytest.mark.parametrize("path", ENDPOINTS)
+def test_metrics_are_off_without_a_token(client, monkeypatch, path):
+    monkeypatch.setattr("app.routers.metrics_controller.METRICS_TOKEN", None)
+    assert client.get(path, headers={"Authorization": "Bearer anything"}).status_code == 404
+
+
+@pytest.mark.parametrize("path", ENDPOINTS)
+def test_metrics_require_the_token(client, monkeypatch, path):
+    monkeypatch.setattr("app.routers.metrics_controller.METRICS_TOKEN", "s3cret")
+    assert client.get(path).status_code == 401
+    assert client.get(path, headers={"Authorization": "Bearer wrong"}).status_code == 401
+    assert client.get(path, headers={"Authorization": "Bearer s3cret"}).status_code == 200
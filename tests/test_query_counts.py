@@ -0,0 +1,74 @@
+from datetime import datetime, timedelta, timezone
+import pytest
+from app.database.connection import SessionLocal
+from app.models import EmailOutbox, Post
+from app.services.email_outbox import deliver_batch
+from app.services.post_service import delete_post
+from tests.conftest import captured_statements
+
+
+def _count_statements(client, path, reset_caches):
+    reset_caches()
+    with captured_statements() as statements:
+        response = client.get(path)
+    assert response.status_code == 200
+    return len(statements)
+
+
+@pytest.mark.parametrize("path", ["/read", "/profile"])
+def test_statements_per_request_do_not_grow_with_posts(logged_in_client, add_posts, reset_caches, path):
+    own = path == "/profile"
+    add_posts(3, own=own)
+    few = _count_statements(logged_in_client, path, reset_caches)
+    add_posts(12, own=own)
+    many = _count_statements(logged_in_client, path, reset_caches)
+    assert many == few, f"{path}: {few} statements for 3 posts, {many} for 15"
+
+
+def test_anonymous_feed_statements_do_not_grow_with_posts(client, add_posts, reset_caches):
+    add_posts(3, own=False)
+    few = _count_statements(client, "/read", reset_caches)
+    add_posts(12, own=False)
+    many = _count_statements(client, "/read", reset_caches)
+    assert many == few, f"/read: {few} statements for 3 posts, {many} for 15"
+
+
+def test_delete_post_statements_do_not_grow_with_comments(db, add_posts):
+    add_posts(1, comments=5, own=False)
+    add_posts(1, comments=200, own=False)
+    counts = []
+    for (post_id,) in db.query(Post.id).order_by(Post.id).all():
+        with captured_statements() as statements:
+            assert delete_post(db, post_id)
+        counts.append(len(statements))
+    assert counts[0] == counts[1], f"{counts[0]} statements for 5 comments, {counts[1]} for 200"
+
+
+def test_outbox_batch_does_not_refetch_claimed_rows():
+    class Outgoing:
+        def __init__(self):
+            self.sent = []
+
+        def send_message(self, to_email, subject, body):
+            self.sent.append(to_email)
+
+    due = datetime.now(timezone.utc) - timedelta(minutes=1)
+    counts = []
+    for size in (2, 8):
+        db = SessionLocal(expire_on_commit=False)
+        db.add_all(
+            EmailOutbox(to_email=f"u{i}@example.com", subject="Hi", body="Body", next_attempt_at=due)
+            for i in range(size)
+        )
+        db.commit()
+        db.close()
+
+        db = SessionLocal(expire_on_commit=False)
+        outgoing = Outgoing()
+        with captured_statements() as statements:
+            assert deliver_batch(db, outgoing) == size
+        db.close()
+        assert len(outgoing.sent) == size
+        # One claim SELECT and one lease UPDATE, then one UPDATE per message.
+        counts.append(len(statements) - size)
+    assert counts[0] == counts[1], f"{counts[0]} extra statements for 2 messages, {counts[1]} for 8"
@@ -0,0 +1,118 @@
+"""
+Query plan regressions: run each hot service query, EXPLAIN QUERY PLAN the
+statements it actually sent (SQLite), and fail if one of the lookup tables
+is read with a full table scan or the index meant for it goes unused.
+"""
+from datetime import datetime, timedelta, timezone
+import re
+import pytest
+from app.database.connection import engine
+from app.models.otp import OTP
+from app.services.login import find_login_user
+from app.services.otp_service import cleanup_expired_otps, is_email_verified, verify_otp
+from app.services.post_service import (
+    get_comments_for_post,
+    get_feed_page,
+    get_user_posts,
+    is_image_shared,
+)
+from app.services.user_service import delete_user_account
+from tests.conftest import captured_statements
+
+GUARDED_TABLES = ("posts", "comments", "users", "otps")
+
+
+def _plan(statements):
+    """Detail lines of EXPLAIN QUERY PLAN for every captured statement."""
+    details = []
+    raw = engine.raw_connection()
+    try:
+        cursor = raw.cursor()
+        for sql, parameters in statements:
+            if not sql.lstrip().upper().startswith(("SELECT", "UPDATE", "DELETE", "WITH")):
+                continue
+            if isinstance(parameters, list):  # executemany: one set is enough
+                parameters = parameters[0]
+            details += [row[-1] for row in cursor.execute(f"EXPLAIN QUERY PLAN {sql}", parameters or ())]
+    finally:
+        raw.close()
+    return details
+
+
+def _assert_indexed(statements, index):
+    details = _plan(statements)
+    full_scans = [
+        line for line in details
+        if re.match(rf"SCAN ({'|'.join(GUARDED_TABLES)})\b", line) and "USING" not in line
+    ]
+    assert not full_scans, f"full table scan: {full_scans}"
+    assert any(index in line for line in details), f"{index} not used: {details}"
+
+
+@pytest.fixture
+def otps(db):
+    now = datetime.now(timezone.utc)
+    for i in range(20):
+        db.add(OTP(email=f"user{i}@example.com", otp_code="123456", expires_at=now + timedelta(minutes=10)))
+    db.commit()
+
+
+def test_user_posts_use_user_feed_index(db, user, add_posts):
+    add_posts(5)
+    with captured_statements() as statements:
+        get_user_posts(db, user.id)
+    _assert_indexed(statements, "ix_posts_user_feed")
+
+
+def test_feed_page_uses_feed_index(db, add_posts):
+    add_posts(5, own=False)
+    with captured_statements() as statements:
+        get_feed_page(db)
+    _assert_indexed(statements, "ix_posts_feed")
+
+
+def test_comment_thread_uses_thread_index(db, add_posts):
+    add_posts(1)
+    with captured_statements() as statements:
+        get_comments_for_post(db, 1)
+    _assert_indexed(statements, "ix_comments_post_thread")
+
+
+def test_image_shared_check_uses_image_index(db, add_posts):
+    add_posts(5)
+    with captured_statements() as statements:
+        is_image_shared(db, "/static/uploads/abc.png", 1)
+    _assert_indexed(statements, "ix_posts_image_url")
+
+
+def test_account_deletion_finds_comments_by_user_index(db, user, add_posts):
+    add_posts(3, own=False)
+    with captured_statements() as statements:
+        delete_user_account(db, user.id)
+    _assert_indexed(statements, "ix_comments_user")
+
+
+@pytest.mark.parametrize("identifier", ["Alice", "ALICE@example.com"])
+def test_login_lookup_uses_unique_indexes(db, user, identifier):
+    with captured_statements() as statements:
+        assert find_login_user(db, identifier).id == user.id
+    index = "sqlite_autoindex_users" if "@" in identifier else "ix_users_username_key"
+    _assert_indexed(statements, index)
+
+
+def test_otp_verification_uses_email_index(db, otps):
+    with captured_statements() as statements:
+        assert verify_otp(db, "user3@example.com", "123456")
+    _assert_indexed(statements, "ix_otps_email_verified")
+
+
+def test_email_verified_check_uses_email_index(db, otps):
+    with captured_statements() as statements:
+        is_email_verified(db, "user3@example.com")
+    _assert_indexed(statements, "ix_otps_email_verified")
+
+
+def test_otp_cleanup_uses_expiry_index(db, otps):
+    with captured_statements() as statements:
+        cleanup_expired_otps(db)
+    _assert_indexed(statements, "ix_otps_expires_at")
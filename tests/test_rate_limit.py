@@ -0,0 +1,55 @@
+from concurrent.futures import ThreadPoolExecutor
+import pytest
+import app.utils.rate_limit as rate_limit
+from app.utils.rate_limit import RULES, InMemoryRateLimitBackend
+
+
+@pytest.fixture
+def limiter(monkeypatch):
+    """Turn the rate limiter on with an empty in-memory backend."""
+    monkeypatch.setattr(rate_limit, "RATE_LIMIT_ENABLED", True)
+    previous = rate_limit.get_rate_limit_backend()
+    rate_limit.set_rate_limit_backend(InMemoryRateLimitBackend())
+    yield
+    rate_limit.set_rate_limit_backend(previous)
+
+
+@pytest.fixture
+def verify_calls(monkeypatch):
+    """Count password verifications; every one of them fails."""
+    calls = []
+
+    async def verify(plain_password, hashed_password):
+        calls.append(plain_password)
+        return False
+
+    monkeypatch.setattr("app.services.login.verify_password_async", verify)
+    return calls
+
+
+def test_bad_logins_for_one_identifier_stop_hashing_at_the_limit(client, user, limiter, verify_calls):
+    limit = RULES["login_identifier"].limit
+    attempts = RULES["login_ip"].limit  # all within the per-IP limit
+
+    def attempt(i):
+        # Both login endpoints, and case variants of the name, share one counter.
+        identifier = "alice" if i % 2 else "ALICE"
+        if i % 3:
+            return client.post("/login", data={"identifier": identifier, "password": f"wrong{i}"}).status_code
+        return client.post("/auth/login", data={"username": identifier, "password": f"wrong{i}"}).status_code
+
+    with ThreadPoolExecutor(max_workers=8) as pool:
+        statuses = list(pool.map(attempt, range(attempts)))
+
+    assert len(verify_calls) <= limit
+    assert statuses.count(429) == attempts - limit
+
+
+def test_login_ip_limit_rejects_before_the_handler(client, user, limiter, verify_calls):
+    limit = RULES["login_ip"].limit
+    statuses = [
+        client.post("/login", data={"identifier": f"nobody{i}", "password": "wrong"}).status_code
+        for i in range(limit + 5)
+    ]
+    assert statuses[limit:] == [429] * 5
+    assert verify_calls == []  # unknown users never reach the hash
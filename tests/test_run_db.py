@@ -0,0 +1,51 @@
+import asyncio
+import threading
+import pytest
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+from sqlalchemy.orm import Session
+from app.database.connection import DATABASE_URL, SessionLocal, async_database_url, run_db
+from app.services.post_service import get_user_posts
+
+
+def _where(db: Session, user_id: int):
+    """Report what run_db handed the service function, and run real queries."""
+    posts = get_user_posts(db, user_id)
+    # Lazy loads work too: inside run_sync they run on the async driver.
+    return type(db), threading.current_thread(), [len(post.comments) for post in posts]
+
+
+def test_run_db_async_mode_runs_sync_services_through_run_sync(user, add_posts):
+    pytest.importorskip("aiosqlite")
+    add_posts(3, comments=2)
+
+    async def main():
+        engine = create_async_engine(async_database_url(DATABASE_URL))
+        factory = async_sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)
+        try:
+            async with factory() as db:
+                return await run_db(db, _where, user.id)
+        finally:
+            await engine.dispose()
+
+    session_type, thread, comment_counts = asyncio.run(main())
+
+    assert issubclass(session_type, Session) and not issubclass(session_type, AsyncSession)
+    assert thread is threading.main_thread()  # greenlet on the loop, not the threadpool
+    assert comment_counts == [2, 2, 2]
+
+
+def test_run_db_sync_mode_uses_the_threadpool(user, add_posts):
+    add_posts(2, comments=0)
+
+    async def main():
+        db = SessionLocal()
+        try:
+            return await run_db(db, _where, user.id)
+        finally:
+            db.close()
+
+    session_type, thread, comment_counts = asyncio.run(main())
+
+    assert issubclass(session_type, Session)
+    assert thread is not threading.main_thread()
+    assert comment_counts == [0, 0]
@@ -0,0 +1,67 @@
+import pytest
+from app.helper.imagefile import MAX_UPLOAD_REQUEST_BYTES
+from app.models import Post
+
+BOUNDARY = "upload-test-boundary"
+
+
+def multipart_body(image_size: int) -> bytes:
+    return (
+        f"--{BOUNDARY}\r\n"
+        'Content-Disposition: form-data; name="title"\r\n\r\nTitle\r\n'
+        f"--{BOUNDARY}\r\n"
+        'Content-Disposition: form-data; name="content"\r\n\r\nSome content\r\n'
+        f"--{BOUNDARY}\r\n"
+        'Content-Disposition: form-data; name="image"; filename="big.png"\r\n'
+        "Content-Type: image/png\r\n\r\n"
+    ).encode() + b"\0" * image_size + f"\r\n--{BOUNDARY}--\r\n".encode()
+
+
+@pytest.fixture
+def no_saves(monkeypatch):
+    """Fail the test if a request gets as far as storing its upload."""
+
+    async def save(upload_file):
+        raise AssertionError("oversized upload reached save_upload_file")
+
+    monkeypatch.setattr("app.routers.post_controller.save_upload_file", save)
+
+
+def test_oversized_upload_rejected_on_content_length(db, logged_in_client, no_saves):
+    response = logged_in_client.post(
+        "/create-post",
+        content=multipart_body(MAX_UPLOAD_REQUEST_BYTES),
+        headers={"Content-Type": f"multipart/form-data; boundary={BOUNDARY}"},
+        follow_redirects=False,
+    )
+    assert response.status_code == 413
+    assert db.query(Post).count() == 0
+
+
+def test_oversized_chunked_upload_rejected_while_streaming(db, logged_in_client, no_saves):
+    body = multipart_body(MAX_UPLOAD_REQUEST_BYTES)
+    chunks = (body[i:i + 1024 * 1024] for i in range(0, len(body), 1024 * 1024))
+    response = logged_in_client.post(
+        "/create-post",
+        content=chunks,  # no Content-Length: sent chunked
+        headers={"Content-Type": f"multipart/form-data; boundary={BOUNDARY}"},
+        follow_redirects=False,
+    )
+    assert response.status_code == 413
+    assert db.query(Post).count() == 0
+
+
+def test_small_upload_still_accepted(db, logged_in_client, monkeypatch):
+    async def save(upload_file):
+        return "/static/uploads/small.png"
+
+    monkeypatch.setattr("app.routers.post_controller.save_upload_file", save)
+    monkeypatch.setattr("app.services.post_service.schedule_image_variants", lambda *args: None)
+    response = logged_in_client.post(
+        "/create-post",
+        content=multipart_body(1024),
+        headers={"Content-Type": f"multipart/form-data; boundary={BOUNDARY}"},
+        follow_redirects=False,
+    )
+    assert response.status_code == 303
+    assert db.query(Post).one().image_url == "/static/uploads/small.png"